@@ -2,6 +2,7 @@ __version__ = "0.3.3"
 
 from .api_report import *
 from .bearing_seal_element import *
+from .cache import *
 from .disk_element import *
 from .materials import *
 from .point_mass import *
@@ -1,17 +1,25 @@
 # fmt: off
-from copy import copy, deepcopy
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
 
 import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import scipy.linalg as la
 from plotly.subplots import make_subplots
 from scipy.interpolate import interp1d
+from scipy.optimize import brentq, minimize_scalar
 from scipy.signal import argrelextrema
 
 from ross.bearing_seal_element import BearingElement, SealElement
+from ross.cache import cached_arrays, content_hash, get_cache
 from ross.disk_element import DiskElement
 from ross.materials import steel
+from ross.results import ForcedResponseResults, ModalResults
 from ross.rotor_assembly import Rotor
 from ross.shaft_element import ShaftElement
 
@@ -23,6 +31,316 @@ colors2 = px.colors.sequential.PuBu
 
 __all__ = ["Report", "report_example"]
 
+# modes analyzed by the report: the first two backward and forward modes
+_REPORT_MODES = [0, 1, 2, 3]
+
+
+def _run_clearance_case(report, bearings, stability_args):
+    """Run the API analyses for a bearing clearance case.
+
+    This function is module level so that it can be sent to worker processes.
+
+    Parameters
+    ----------
+    report : Report
+        The report object.
+    bearings : list
+        List with the bearing elements for the clearance case.
+    stability_args : tuple
+        Arguments passed to Report.stability_level_1().
+
+    Returns
+    -------
+    results : dict
+        Dictionary with the figures and dataframes of the clearance case, and
+        the time spent in each analysis stage in seconds.
+    attributes : dict
+        Report attributes set by the analyses.
+    """
+    rotor0 = report.rotor
+    timing = {}
+    start = time.perf_counter()
+    report.rotor = report.rotor_instance(rotor0, bearings)
+    timing["rotor_instance"] = time.perf_counter() - start
+
+    results = dict(fig_mode_shape=[], fig_unbalance=[], df_unbalance=[])
+
+    # undamped critical speed map
+    start = time.perf_counter()
+    results["df_ucs"] = report.ucs_critical_speeds()
+    # the critical speeds marked on the map are taken from the report cache
+    results["fig_ucs"] = report.plot_ucs(
+        stiffness_range=report.bearing_stiffness_range, critical_speeds=True
+    )
+    timing["plot_ucs"] = time.perf_counter() - start
+
+    # the modal and frequency responses of the rotor are solved once and shared
+    # by the mode shapes, unbalance responses and stability analyses
+    start = time.perf_counter()
+    for mode in [0, 2]:
+        # mode shape figures
+        results["fig_mode_shape"].append(report.mode_shape(mode))
+    timing["mode_shape"] = time.perf_counter() - start
+
+    # unbalance response figures and dataframes, with the load cases of all
+    # the modes solved in a single pass
+    start = time.perf_counter()
+    for fig, _dict in report.unbalance_responses([0, 2]):
+        results["fig_unbalance"].append(fig)
+        results["df_unbalance"].append(pd.DataFrame(_dict).astype(object))
+    timing["unbalance_response"] = time.perf_counter() - start
+
+    # stability level 1 figures
+    start = time.perf_counter()
+    results["figs_lvl1"] = report.stability_level_1(*stability_args)
+    timing["stability_level_1"] = time.perf_counter() - start
+
+    # stability level 2 dataframe
+    start = time.perf_counter()
+    results["df_lvl2"] = report.stability_level_2()
+    timing["stability_level_2"] = time.perf_counter() - start
+
+    # API summary tables
+    start = time.perf_counter()
+    results["summary"] = report.summary()
+    timing["summary"] = time.perf_counter() - start
+
+    results["timing"] = timing
+
+    # the results of the case rotor are not used again, and are dropped so the
+    # cache does not grow with the number of clearance cases
+    report._cache = {
+        key: value
+        for key, value in report._cache.items()
+        if value[0] is not report.rotor
+    }
+    report.rotor = rotor0
+    attributes = {
+        k: v
+        for k, v in report.__dict__.items()
+        if k not in ["rotor", "_cache", "timing", "df_ucs"]
+    }
+
+    return results, attributes
+
+
+def _non_backward_log_dec(speed, evalues, evectors, rotor_data):
+    """Log decrement of the first non-backward mode.
+
+    Parameters
+    ----------
+    speed : float
+        Rotor speed.
+    evalues : array
+        Eigenvalues sorted in ascending order of frequency.
+    evectors : array
+        Eigenvectors of the state space matrix, one mode per column.
+    rotor_data : tuple
+        Rotor ndof, nodes, nodes_pos and shaft_elements_length.
+
+    Returns
+    -------
+    index : int
+        Position of the first non-backward mode in evalues, or None if all the
+        modes are backward.
+    log_dec : float
+        Logarithmic decrement of the first non-backward mode, or None if all
+        the modes are backward.
+    """
+    # modes are checked in ascending order of frequency until a non-backward
+    # mode is found, since the whirl direction evaluation is expensive
+    for index, (lam, evector) in enumerate(zip(evalues, evectors.T)):
+        damping_ratio = -np.real(lam) / np.abs(lam)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            log_dec = 2 * np.pi * damping_ratio / np.sqrt(1 - damping_ratio ** 2)
+        modal = ModalResults(
+            speed,
+            np.array([lam]),
+            evector[:, np.newaxis],
+            np.array([np.abs(lam)]),
+            np.array([np.imag(lam)]),
+            np.array([damping_ratio]),
+            np.array([log_dec]),
+            None,
+            *rotor_data,
+        )
+        if modal.whirl_direction()[0] != "Backward":
+            return index, log_dec
+
+    return None, None
+
+
+def _antinodes(vn, idx_remove, nn):
+    """Locate the nodes with the largest displacements of a mode shape.
+
+    Parameters
+    ----------
+    vn : array
+        Mode shape displacements along the rotor, without the repeated points
+        between shaft elements.
+    idx_remove : list
+        Indexes of the removed repeated points, in ascending order.
+    nn : int
+        Number of points per shaft element.
+
+    Returns
+    -------
+    node_min, node_max : array
+        Nodes where the minimum and maximum displacements occur.
+    """
+    node_min = np.array([])
+    node_max = np.array([])
+
+    aux_idx_max = argrelextrema(vn, np.greater)[0].tolist()
+    aux_idx_min = argrelextrema(vn, np.less)[0].tolist()
+
+    # verification of rigid modes
+    if len(aux_idx_max) == 0 and len(aux_idx_min) == 0:
+        idx_max = np.argmax(vn)
+        idx_min = np.argmin(vn)
+
+        # corrects the index by the removed points
+        for i in idx_remove:
+            if idx_min > i:
+                idx_min += 1
+            if idx_max > i:
+                idx_max += 1
+        node_max = np.round(np.array([idx_max]) / nn)
+        node_min = np.round(np.array([idx_min]) / nn)
+
+    if len(aux_idx_min) != 0:
+        idx_min = np.where(vn == min(vn[aux_idx_min]))[0].tolist()
+
+        # corrects the index by the removed points
+        for i in idx_remove:
+            if idx_min[0] > i:
+                idx_min[0] += 1
+        node_min = np.round(np.array(idx_min) / nn)
+
+    if len(aux_idx_max) != 0:
+        idx_max = np.where(vn == max(vn[aux_idx_max]))[0].tolist()
+
+        # corrects the index by the removed points
+        for i in idx_remove:
+            if idx_max[0] > i:
+                idx_max[0] += 1
+        node_max = np.round(np.array(idx_max) / nn)
+
+    return node_min, node_max
+
+
+def _refine_peak(freq_range, magnitude, k, amplitude, level=0.707):
+    """Refine a response peak and its half-power frequencies.
+
+    The peak found at the k-th point of the frequency grid is located with a
+    bounded Brent search between the neighbouring points, and the frequencies
+    where the response crosses level * peak are found with Brent's method in
+    the grid intervals bracketing them. Only a few response evaluations are
+    needed to get these frequencies with a much higher precision than the grid
+    spacing.
+
+    Parameters
+    ----------
+    freq_range : array
+        Frequency grid, in ascending order.
+    magnitude : array
+        Response magnitude on the frequency grid.
+    k : int
+        Index of a local maximum of the magnitude, with 0 < k < len(freq_range) - 1.
+    amplitude : callable
+        Function returning the response magnitude at a frequency.
+    level : float, optional
+        Fraction of the peak magnitude defining the half-power frequencies.
+        Default is 0.707.
+
+    Returns
+    -------
+    wn : float
+        Frequency of the peak.
+    peak : float
+        Magnitude of the peak.
+    w_low, w_high : float
+        Frequencies below and above the peak where the magnitude crosses
+        level * peak. If the response does not cross it within the frequency
+        grid, the grid limits are returned.
+    """
+    bounds = (freq_range[k - 1], freq_range[k + 1])
+    res = minimize_scalar(
+        lambda w: -amplitude(w),
+        bounds=bounds,
+        method="bounded",
+        options=dict(xatol=1e-8 * bounds[1]),
+    )
+    wn, peak = res.x, -res.fun
+    if peak < magnitude[k]:
+        wn, peak = freq_range[k], magnitude[k]
+
+    half_power = level * peak
+    crossings = []
+    for side in [-1, 1]:
+        # grid points moving away from the peak, until the magnitude drops
+        # below the half-power level
+        idx = np.arange(k, -1, -1) if side < 0 else np.arange(k, len(freq_range))
+        idx = idx[side * (freq_range[idx] - wn) > 0]
+        w_near = wn
+        w_cross = freq_range[0] if side < 0 else freq_range[-1]
+        for i in idx:
+            if magnitude[i] < half_power:
+                w_cross = brentq(
+                    lambda w: amplitude(w) - half_power,
+                    *sorted([freq_range[i], w_near]),
+                    xtol=1e-8 * freq_range[-1],
+                )
+                break
+            w_near = freq_range[i]
+        crossings.append(w_cross)
+
+    return wn, peak, crossings[0], crossings[1]
+
+
+def _stability_variant_log_dec(M, K, C, G, speed, rotor_data, n_eigen=12):
+    """Log decrement of the first non-backward mode of a rotor variant.
+
+    This function is module level so that it can be sent to worker processes.
+    The eigenvalues are calculated as in Rotor.run_modal(). If the lowest modes
+    are all backward, the full eigenvalue problem is solved.
+
+    Parameters
+    ----------
+    M, K, C, G : np.ndarray
+        Mass, stiffness, damping and gyroscopic matrices of the rotor variant.
+    speed : float
+        Rotor speed.
+    rotor_data : tuple
+        Rotor ndof, nodes, nodes_pos and shaft_elements_length.
+    n_eigen : int, optional
+        Number of eigenvalues calculated by arpack. Default is 12.
+
+    Returns
+    -------
+    log_dec : float
+        Logarithmic decrement of the first non-backward mode.
+
+    Raises
+    ------
+    ValueError
+        If all the modes of the rotor variant are backward.
+    """
+    A = Rotor._state_matrix(M, K, C, G, speed)
+
+    for n in [n_eigen, None]:
+        evalues, evectors = Rotor._eigs(A, n)
+        idx = Rotor._index(evalues)
+        n_modes = len(evalues) // 2
+        _, log_dec = _non_backward_log_dec(
+            speed, evalues[idx][:n_modes], evectors[:, idx][:, :n_modes], rotor_data
+        )
+        if log_dec is not None:
+            return log_dec
+
+    raise ValueError("All the modes of the rotor are backward.")
+
 
 class Report:
     """Report according to standard analysis.
@@ -65,6 +383,12 @@ class Report:
     disk_nodes: list
         List of disk between bearings or overhung (depending on the
         rotor type)
+    timing: list
+        Time spent in each analysis stage by the last run(), in seconds,
+        for each bearing clearance case.
+    df_ucs: list
+        Critical speeds at the bearing stiffness found by the last run(), for
+        each bearing clearance case.
 
     Returns
     -------
@@ -200,6 +524,11 @@ class Report:
         self.node_min = None
         self.node_max = None
         self.U_force = None
+        self.timing = []
+        self.df_ucs = []
+
+        # results of the analyses shared by different report sections
+        self._cache = {}
 
     @classmethod
     def from_saved_rotors(
@@ -252,6 +581,56 @@ class Report:
             tag,
         )
 
+    def __getstate__(self):
+        """Return the report state for pickling.
+
+        The rotor can not be pickled, since its elements hold the global dof
+        indexes created during the rotor assembly. The rotor elements are pickled
+        instead and the rotor is built again when the report is unpickled. The
+        cached analyses results are not pickled.
+
+        Returns
+        -------
+        state : dict
+            The report attributes, with the rotor replaced by its elements.
+
+        Examples
+        --------
+        >>> import pickle
+        >>> import ross as rs
+        >>> report = rs.report_example()
+        >>> report_copy = pickle.loads(pickle.dumps(report))
+        >>> report_copy.rotor.m == report.rotor.m
+        True
+        """
+        rotor = self.rotor
+        state = self.__dict__.copy()
+        state["rotor"] = dict(
+            shaft_elements=rotor.shaft_elements,
+            disk_elements=rotor.disk_elements,
+            bearing_elements=rotor.bearing_elements,
+            point_mass_elements=rotor.point_mass_elements,
+            sparse=rotor.sparse,
+            n_eigen=rotor.n_eigen,
+            min_w=rotor.min_w,
+            max_w=rotor.max_w,
+            rated_w=rotor.rated_w,
+            tag=rotor.tag,
+        )
+        state["_cache"] = {}
+        return state
+
+    def __setstate__(self, state):
+        """Restore the report state, building the rotor again.
+
+        Parameters
+        ----------
+        state : dict
+            The report attributes returned by __getstate__().
+        """
+        self.__dict__.update(state)
+        self.rotor = Rotor(**state["rotor"])
+
     def rotor_instance(self, rotor, bearing_list):
         """Build an instance of an auxiliary rotor with different bearing clearances.
 
@@ -305,12 +684,237 @@ class Report:
 
         return aux_rotor
 
-    def run(self, D, H, HP, oper_speed, RHO_ratio, RHOs, RHOd, unit="m"):
+    def _run_modal(self, speed):
+        """Run the modal analysis of the current rotor.
+
+        The results are kept for each rotor and speed, so the analyses that
+        share the same rotor solve the eigenvalue problem once.
+
+        Parameters
+        ----------
+        speed : float
+            Rotor speed.
+
+        Returns
+        -------
+        modal : ModalResults
+            Modal analysis results.
+        """
+        # the rotor is kept with the results, so its id is not reused
+        key = ("modal", id(self.rotor), speed)
+        if key not in self._cache:
+            self._cache[key] = (self.rotor, self.rotor.run_modal(speed=speed))
+
+        return self._cache[key][1]
+
+    def _run_freq_response(self, speed_range):
+        """Run the frequency response of the current rotor.
+
+        The results are kept for each rotor and speed range, so the unbalance
+        responses of different modes share the same transfer matrices.
+
+        Parameters
+        ----------
+        speed_range : array
+            Array with the frequencies.
+
+        Returns
+        -------
+        freq_resp : FrequencyResponseResults
+            Frequency response results.
+        """
+        speed_range = np.asarray(speed_range, dtype=float)
+        key = ("freq_response", id(self.rotor), speed_range.tobytes())
+        if key not in self._cache:
+            self._cache[key] = (
+                self.rotor,
+                self.rotor.run_freq_response(speed_range=speed_range),
+            )
+
+        return self._cache[key][1]
+
+    def _static_forces(self):
+        """Return the bearing reaction forces of the current rotor.
+
+        The static analysis is run once for each rotor, and its results are
+        shared by the unbalance forces of all the modes.
+
+        Returns
+        -------
+        Fb : array
+            Bearing reaction forces.
+        """
+        key = ("static", id(self.rotor))
+        if key not in self._cache:
+            self._cache[key] = (self.rotor, self.static_forces())
+
+        return self._cache[key][1]
+
+    def _mode_shapes(self, modes):
+        """Return the mode shapes of several modes of the current rotor.
+
+        The mode shapes of the report modes, and of any other mode requested,
+        are evaluated once for each rotor and sliced for the requested modes.
+
+        Parameters
+        ----------
+        modes : list
+            List with the n'th vibration modes.
+
+        Returns
+        -------
+        shapes : dict
+            Dictionary with the modes, their natural frequencies "wn", the axial
+            positions "zn", the 2D mode shapes "vn" with one column per mode,
+            the nodes "node_min" and "node_max" of each mode and the modal
+            "participation" of each mode.
+        """
+        key = ("mode_shapes", id(self.rotor))
+        cached_modes = self._cache[key][1]["modes"] if key in self._cache else []
+        if not set(modes) <= set(cached_modes):
+            all_modes = sorted(set(_REPORT_MODES) | set(cached_modes) | set(modes))
+            self._cache[key] = (self.rotor, self._evaluate_mode_shapes(all_modes))
+
+        shapes = self._cache[key][1]
+        idx = [shapes["modes"].index(mode) for mode in modes]
+
+        return dict(
+            modes=list(modes),
+            wn=shapes["wn"][idx],
+            zn=shapes["zn"],
+            vn=shapes["vn"][:, idx],
+            node_min=[shapes["node_min"][j] for j in idx],
+            node_max=[shapes["node_max"][j] for j in idx],
+            participation=shapes["participation"][idx],
+        )
+
+    def _evaluate_mode_shapes(self, modes):
+        """Evaluate the mode shapes of several modes of the current rotor.
+
+        The mode shapes are interpolated along the shaft elements for all the
+        modes at once, from a single modal analysis at the maximum speed.
+
+        Parameters
+        ----------
+        modes : list
+            List with the n'th vibration modes.
+
+        Returns
+        -------
+        shapes : dict
+            Dictionary with the modes, their natural frequencies "wn", the axial
+            positions "zn", the 2D mode shapes "vn" with one column per mode,
+            the nodes "node_min" and "node_max" of each mode and the modal
+            "participation" of each mode.
+        """
+        modal = self._run_modal(self.maxspeed)
+        nodes = modal.nodes
+        nodes_pos = np.asarray(modal.nodes_pos)
+
+        # normalize the modes as ModalResults.calc_mode_shape()
+        cols = np.arange(len(modes))
+        evec = modal.modes[:, modes]
+        modex = evec[0::4]
+        modey = evec[1::4]
+        ixmax = np.argmax(np.abs(modex), axis=0)
+        iymax = np.argmax(np.abs(modey), axis=0)
+        scale = np.where(
+            np.abs(modey[iymax, cols]) > 0.4 * np.abs(modex[ixmax, cols]),
+            modey[iymax, cols],
+            modex[ixmax, cols],
+        )
+        evec = (evec / scale).real
+
+        # hermite shape functions evaluated along each shaft element
+        nn = 21
+        zeta = np.linspace(0, 1, nn)[np.newaxis, :, np.newaxis]
+        N1 = 1 - 3 * zeta ** 2 + 2 * zeta ** 3
+        N2 = zeta - 2 * zeta ** 2 + zeta ** 3
+        N3 = 3 * zeta ** 2 - 2 * zeta ** 3
+        N4 = -(zeta ** 2) + zeta ** 3
+
+        n_elements = min(len(nodes), len(modal.shaft_elements_length))
+        n = 4 * np.asarray(nodes[:n_elements])
+        Le = np.asarray(modal.shaft_elements_length[:n_elements])[:, None, None]
+
+        def dofs(i):
+            return evec[n + i][:, np.newaxis, :]
+
+        xn = N1 * dofs(0) + Le * N2 * dofs(3) + N3 * dofs(4) + Le * N4 * dofs(7)
+        yn = N1 * dofs(1) - Le * N2 * dofs(2) + N3 * dofs(5) - Le * N4 * dofs(6)
+        xn = xn.reshape(-1, len(modes))
+        yn = yn.reshape(-1, len(modes))
+        zn = (nodes_pos[n // 4][:, None] + Le[:, :, 0] * zeta[0, :, 0]).reshape(-1)
+
+        # reduce 3D view to 2D view
+        with np.errstate(divide="ignore", invalid="ignore"):
+            theta = np.arctan(xn / yn)
+        vn = xn * np.sin(theta) + yn * np.cos(theta)
+
+        # remove repetitive values from zn and vn
+        idx_remove = (np.flatnonzero(zn[1:] == zn[:-1]) + 1).tolist()
+        zn = np.delete(zn, idx_remove)
+        vn = np.delete(vn, idx_remove, axis=0)
+
+        df_disks = self.rotor.df_disks
+        node_min = []
+        node_max = []
+        for j in range(len(modes)):
+            if self.rotor_type == "between_bearings":
+                nodes_j = _antinodes(vn[:, j], idx_remove, nn)
+            elif self.rotor_type == "double_overhung":
+                nodes_j = ([min(df_disks["n"])], [max(df_disks["n"])])
+            elif self.rotor_type == "single_overhung_l":
+                nodes_j = ([min(df_disks["n"])], np.array([]))
+            elif self.rotor_type == "single_overhung_r":
+                nodes_j = (np.array([]), [max(df_disks["n"])])
+            else:
+                nodes_j = (np.array([]), np.array([]))
+            node_min.append(nodes_j[0])
+            node_max.append(nodes_j[1])
+
+        # fraction of the rotor mass taking part in each mode, for lateral
+        # translations: the effective modal mass in each direction over the
+        # total translational mass in that direction
+        M = self.rotor.M()
+        phi = modal.modes[:, modes]
+        modal_mass = np.real(np.sum(phi.conj() * (M @ phi), axis=0))
+        participation = 0
+        for i in [0, 1]:
+            translation = np.zeros(modal.ndof)
+            translation[i::4] = 1
+            M_r = M @ translation
+            total_mass = translation @ M_r
+            participation = participation + np.abs(M_r @ phi) ** 2 / (
+                modal_mass * total_mass
+            )
+
+        return dict(
+            modes=list(modes),
+            wn=modal.wn[modes],
+            zn=zn,
+            vn=vn,
+            node_min=node_min,
+            node_max=node_max,
+            participation=participation,
+        )
+
+    def run(self, D, H, HP, oper_speed, RHO_ratio, RHOs, RHOd, unit="m", n_jobs=1):
         """Run API report.
 
         This method runs the API analysis and prepare the results to
         generate the PDF report.
 
+        The bearing clearance cases are independent and can be run in
+        parallel processes. Within each case, the modal analysis and the
+        frequency response of the rotor are solved once and shared by the
+        mode shapes, unbalance responses and stability analyses.
+
+        The time spent in each analysis stage is stored in the timing attribute,
+        a list with a dictionary of seconds per stage for each clearance case,
+        and the critical speeds at the bearing stiffness (see
+        ucs_critical_speeds()) are stored in the df_ucs attribute.
+
         Parameters
         ----------
         D: list
@@ -334,6 +938,9 @@ class Report:
         unit: str, optional
             Adopted unit system. Options are "m" (meter) and "in" (inch)
             Default is "m"
+        n_jobs : int, optional
+            Number of worker processes used to run the bearing clearance cases.
+            If None, the number of processors is used. Default is 1.
 
         Returns
         -------
@@ -376,39 +983,43 @@ class Report:
         df_unbalance = []
         summaries = []
 
-        rotor0 = self.rotor
-
-        for bearings in self.bearing_clearance_lists:
-            self.rotor = self.rotor_instance(rotor0, bearings)
+        stability_args = (D, H, HP, oper_speed, RHO_ratio, RHOs, RHOd)
+        cases = self.bearing_clearance_lists
 
-            # undamped critical speed map
-            fig_ucs.append(self.plot_ucs(stiffness_range=self.bearing_stiffness_range))
-
-            for i, mode in enumerate([0, 2]):
-                # mode shape figures
-                fig_mode_shape.append(self.mode_shape(mode))
-
-                # unbalance response figures and dataframe
-                fig, _dict = self.unbalance_response(mode)
-                fig_unbalance.append(fig)
-                df = pd.DataFrame(_dict).astype(object)
-                df_unbalance.append(df)
-
-            # stability level 1 figures
-            figs = self.stability_level_1(D, H, HP, oper_speed, RHO_ratio, RHOs, RHOd)
-            fig_a_lvl1.append(figs[0])
-            fig_b_lvl1.append(figs[1])
-
-            # stability level 2 dataframe
-            df_lvl2 = self.stability_level_2()
+        if n_jobs == 1:
+            cases_results = [
+                _run_clearance_case(self, bearings, stability_args)
+                for bearings in cases
+            ]
+        else:
+            n_workers = min(n_jobs or os.cpu_count(), len(cases))
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                cases_results = list(
+                    executor.map(
+                        _run_clearance_case,
+                        [self] * len(cases),
+                        cases,
+                        [stability_args] * len(cases),
+                    )
+                )
 
-            # API summary tables
-            summaries.append(self.summary())
+        for results, attributes in cases_results:
+            fig_ucs.append(results["fig_ucs"])
+            fig_mode_shape.extend(results["fig_mode_shape"])
+            fig_unbalance.extend(results["fig_unbalance"])
+            df_unbalance.extend(results["df_unbalance"])
+            fig_a_lvl1.append(results["figs_lvl1"][0])
+            fig_b_lvl1.append(results["figs_lvl1"][1])
+            df_lvl2 = results["df_lvl2"]
+            summaries.append(results["summary"])
+
+        # report attributes are kept from the last clearance case
+        self.__dict__.update(attributes)
+        self.timing = [results["timing"] for results, _ in cases_results]
+        self.df_ucs = [results["df_ucs"] for results, _ in cases_results]
 
         df_unbalance = pd.concat(df_unbalance)
 
-        self.rotor = rotor0
-
         return (
             fig_ucs,
             fig_mode_shape,
@@ -420,7 +1031,7 @@ class Report:
             summaries,
         )
 
-    def plot_ucs(self, stiffness_range=None, num=20):
+    def plot_ucs(self, stiffness_range=None, num=20, critical_speeds=False):
         """Plot undamped critical speed map.
 
         This method will plot the undamped critical speed map for a given range
@@ -434,6 +1045,11 @@ class Report:
         num : int
             Number of steps in the range.
             Default is 20.
+        critical_speeds : bool, optional
+            If True, the critical speeds at the bearing stiffness, calculated
+            with ucs_critical_speeds(), are marked on the map. Finding them
+            takes a modal analysis for each bracketing and refinement step.
+            Default is False.
 
         Returns
         -------
@@ -463,16 +1079,31 @@ class Report:
             if not isinstance(bearing, SealElement):
                 bearings_elements.append(bearing)
 
-        for i, k in enumerate(stiffness_log):
-            bearings = [BearingElement(b.n, kxx=k, cxx=0) for b in bearings_elements]
-            rotor = self.rotor.__class__(
-                self.rotor.shaft_elements,
-                self.rotor.disk_elements,
-                bearings,
-                n_eigen=16,
-            )
-            modal = rotor.run_modal(speed=0)
-            rotor_wn[:, i] = modal.wn[:8:2]
+        def compute():
+            for i, k in enumerate(stiffness_log):
+                bearings = [
+                    BearingElement(b.n, kxx=k, cxx=0) for b in bearings_elements
+                ]
+                rotor = self.rotor.__class__(
+                    self.rotor.shaft_elements,
+                    self.rotor.disk_elements,
+                    bearings,
+                    n_eigen=16,
+                )
+                modal = rotor.run_modal(speed=0)
+                rotor_wn[:, i] = modal.wn[:8:2]
+            return {"rotor_wn": rotor_wn}
+
+        # the rotors are not built again if the map is cached
+        rotor_wn = cached_arrays(
+            compute,
+            "plot_ucs",
+            self.rotor.__class__.__name__,
+            self.rotor.shaft_elements,
+            self.rotor.disk_elements,
+            [b.n for b in bearings_elements],
+            stiffness_log,
+        )["rotor_wn"]
 
         bearing0 = bearings_elements[0]
 
@@ -551,6 +1182,21 @@ class Report:
                     showlegend=False,
                 )
             )
+        # critical speeds at the bearing stiffness
+        if critical_speeds:
+            df_critical = self.ucs_critical_speeds()
+            fig.add_trace(
+                go.Scatter(
+                    x=df_critical["stiffness"],
+                    y=df_critical["critical_speed"],
+                    mode="markers",
+                    marker=dict(size=12, symbol="x", color="black"),
+                    name="Critical Speeds",
+                    hovertemplate=(
+                        "Stiffness: %{x:.2e}<br>" + "Critical Speed: %{y:.2f}"
+                    ),
+                )
+            )
         fig.update_xaxes(
             title_text="<b>Bearing Stiffness</b>",
             title_font=dict(size=16),
@@ -590,6 +1236,43 @@ class Report:
 
         return fig
 
+    def ucs_critical_speeds(self):
+        """Calculate the critical speeds at the bearing stiffness.
+
+        The critical speeds are the intersections of the undamped critical
+        speed map with the bearing kxx and kyy coefficients, found by root
+        finding with Rotor.ucs_critical_speeds(). The separation margins are
+        calculated from the operation speed range.
+
+        Returns
+        -------
+        df : pd.DataFrame
+            Dataframe with the map curve (mode), the bearing coefficient, the
+            bearing stiffness, the critical speed and the separation margin of
+            each intersection. Speeds are in rad/s.
+
+        Example
+        -------
+        >>> import ross as rs
+        >>> report = rs.report_example()
+        >>> df = report.ucs_critical_speeds()
+        >>> df["critical_speed"].round(2).tolist()[:4]
+        [nan, 410.87, 1271.99, nan]
+        """
+        key = ("ucs", id(self.rotor))
+        if key not in self._cache:
+            df = self.rotor.ucs_critical_speeds()
+            wn = df["critical_speed"]
+            # Separation Margin - API684 - SP6.8.2.10
+            df["separation_margin"] = np.select(
+                [wn < self.minspeed, wn > self.maxspeed],
+                [(self.minspeed - wn) / wn, (wn - self.maxspeed) / self.maxspeed],
+                default=np.where(np.isnan(wn), np.nan, 0.0),
+            )
+            self._cache[key] = (self.rotor, df)
+
+        return self._cache[key][1].copy()
+
     def static_forces(self):
         """Calculate the bearing reaction forces.
 
@@ -645,6 +1328,26 @@ class Report:
         >>> report.unbalance_forces(mode=0)
         [58.641354289961676]
         """
+        U_force = self._unbalance_weights(mode)
+        self.U_force = U_force
+
+        return U_force
+
+    def _unbalance_weights(self, mode):
+        """Calculate the unbalance forces of a mode.
+
+        See unbalance_forces(). The report attributes are not changed.
+
+        Parameters
+        ----------
+        mode : int
+            n'th mode shape.
+
+        Returns
+        -------
+        U : list
+            Unbalancing forces.
+        """
         if mode > 3:
             raise ValueError(
                 "This module calculates only the response for the first "
@@ -655,7 +1358,7 @@ class Report:
 
         # get reaction forces on bearings
         if self.rotor_type == "between_bearings":
-            Fb = self.static_forces()
+            Fb = self._static_forces()
             if mode == 0 or mode == 1:
                 U_force = [max(6350 * np.sum(Fb) / N, 254e-6 * np.sum(Fb))]
 
@@ -718,8 +1421,6 @@ class Report:
 
             U_force = 6350 * W3 / N
 
-        self.U_force = U_force
-
         return U_force
 
     def unbalance_response(self, mode, samples=201):
@@ -737,7 +1438,10 @@ class Report:
         mode : int
             n'th mode shape.
         samples : int
-            Number of samples to generate de frequency range.
+            Number of samples to generate de frequency range. The critical
+            speeds and the half-power frequencies used for the amplification
+            factors are refined between the samples, so a coarse frequency
+            range is enough to locate the response peaks.
 
         Returns
         -------
@@ -760,23 +1464,117 @@ class Report:
         >>> report = rs.report_example()
         >>> fig, unbalance_dict = report.unbalance_response(mode=0)
         """
-        maxspeed = self.maxspeed
-        minspeed = self.minspeed
-        freq_range = np.linspace(0, self.speed_factor * maxspeed, 201)
+        return self.unbalance_responses([mode], samples)[0]
+
+    def unbalance_responses(self, modes, samples=201):
+        """Evaluate the unbalance response for several modes.
+
+        The unbalance load cases of all the modes are solved in a single pass:
+        the response to a unit unbalance at each node where a load is applied
+        is calculated with one set of frequency response solves, with one
+        right-hand side per node. Since the response is linear in the load, the
+        response of each mode is the superposition of its node responses,
+        scaled by the unbalance weights and phases.
 
-        # returns de nodes where forces will be applied
-        self.mode_shape(mode)
-        node_min = self.node_min
-        node_max = self.node_max
-        nodes = [int(node) for sub_nodes in [node_min, node_max] for node in sub_nodes]
+        Parameters
+        ----------
+        modes : list
+            List with the n'th mode shapes.
+        samples : int
+            Number of samples to generate de frequency range. The critical
+            speeds and the half-power frequencies used for the amplification
+            factors are refined between the samples.
+
+        Returns
+        -------
+        results : list
+            List with the (subplots, unbalance_dict) results of each mode. See
+            unbalance_response().
+
+        Example
+        -------
+        >>> import ross as rs
+        >>> report = rs.report_example()
+        >>> results = report.unbalance_responses(modes=[0, 2])
+        >>> [unbalance_dict["Mode"] for _, unbalance_dict in results]
+        [1, 3]
+        """
+        freq_range = np.linspace(0, self.speed_factor * self.maxspeed, samples)
 
-        force = self.unbalance_forces(mode)
+        # returns de nodes where forces will be applied, for all the modes
+        df_modes = self.mode_analysis(modes)
 
-        phase = []
-        phase_angle = 0
-        for node in nodes:
-            phase.append(phase_angle)
-            phase_angle += np.pi
+        cases = []
+        for _, row in df_modes.iterrows():
+            nodes = [
+                int(node)
+                for sub_nodes in [row["node_min"], row["node_max"]]
+                for node in sub_nodes
+            ]
+            force = row["unbalance"]
+            phase = [i * np.pi for i in range(len(nodes))]
+            cases.append((int(row["mode"]), nodes, force, phase))
+
+        # report attributes are set for the last mode, as in mode_shape()
+        self.node_min = row["node_min"]
+        self.node_max = row["node_max"]
+        self.U_force = force
+
+        # responses to a unit unbalance at each node, solved with the frequency
+        # response shared by all the load cases
+        all_nodes = sorted({node for _, nodes, _, _ in cases for node in nodes})
+        unit_force = np.stack(
+            [self.rotor._unbalance_force(n, 1.0, 0.0, freq_range) for n in all_nodes],
+            axis=1,
+        )
+        freq_resp = self._run_freq_response(freq_range).freq_resp
+        unit_resp = np.matmul(
+            np.moveaxis(freq_resp, -1, 0), np.moveaxis(unit_force, -1, 0)
+        )
+
+        results = []
+        for mode, nodes, force, phase in cases:
+            forced_resp = sum(
+                m * np.exp(1j * p) * unit_resp[:, :, all_nodes.index(n)].T
+                for n, m, p in zip(nodes, force, phase)
+            )
+            response = ForcedResponseResults(
+                forced_resp=forced_resp,
+                speed_range=freq_range,
+                magnitude=abs(forced_resp),
+                phase=np.angle(forced_resp),
+            )
+            results.append(
+                self._unbalance_response_results(
+                    mode, nodes, force, phase, freq_range, response
+                )
+            )
+
+        return results
+
+    def _unbalance_response_results(
+        self, mode, nodes, force, phase, freq_range, response
+    ):
+        """Build the unbalance response figure and dictionary of a mode.
+
+        Parameters
+        ----------
+        mode : int
+            n'th mode shape.
+        nodes, force, phase : list
+            Unbalance stations, weights and phases.
+        freq_range : array
+            Frequency range.
+        response : ForcedResponseResults
+            Unbalance response over the frequency range.
+
+        Returns
+        -------
+        subplots, unbalance_dict
+            See unbalance_response().
+        """
+        maxspeed = self.maxspeed
+        minspeed = self.minspeed
 
         unbalance_dict = {
             "Mode": mode + 1,
@@ -789,37 +1587,51 @@ class Report:
             "Unbalance phase(s)": [phase],
         }
 
-        response = self.rotor.run_unbalance_response(nodes, force, phase, freq_range)
-        mag = response.magnitude
-
-        for node in nodes:
-            dof = 4 * node + 1
-            mag_plot = response.plot_magnitude(dof)
-            phs_plot = response.plot_phase(dof)
+        # the peaks found on the frequency grid are refined with the response
+        # calculated directly from the rotor impedance at each frequency
+        dof = 4 * nodes[-1] + 1
+        M = self.rotor.M()
+        G = self.rotor.G()
+        refined = {}
+
+        def amplitude(w):
+            if w not in refined:
+                Z = self.rotor.K(w) - w ** 2 * M + 1j * w * (self.rotor.C(w) + w * G)
+                F = sum(
+                    self.rotor._unbalance_force(n, m, p, [w])[:, 0]
+                    for n, m, p in zip(nodes, force, phase)
+                )
+                refined[w] = la.solve(Z, F)
+            return np.abs(refined[w][dof])
 
-        magnitude = mag[dof]
+        magnitude = response.magnitude[dof]
         idx_max = argrelextrema(magnitude, np.greater)[0].tolist()
-        wn = freq_range[idx_max]
-
-        for i, peak in enumerate(magnitude[idx_max]):
-            peak_n = 0.707 * peak
-            peak_aux = np.linspace(peak_n, peak_n, len(freq_range))
-
-            idx = np.argwhere(np.diff(np.sign(peak_aux - magnitude))).flatten()
-            idx = np.sort(np.append(idx, idx_max[i]))
-
-            # if speed range is not long enough to catch the magnitudes
-            try:
-                idx_aux = [
-                    list(idx).index(idx_max[i]) - 1,
-                    list(idx).index(idx_max[i]) + 1,
-                ]
-                idx = idx[idx_aux]
-            except IndexError:
-                idx = [list(idx).index(idx_max[i]) - 1, len(freq_range) - 1]
+        peaks = [_refine_peak(freq_range, magnitude, k, amplitude) for k in idx_max]
+        wn = [peak[0] for peak in peaks]
+        peak_max = max([peak[1] for peak in peaks], default=0)
+
+        # refined frequencies are added to the plotted response
+        refined = {w: x for w, x in refined.items() if w not in freq_range}
+        speed_range = np.concatenate([freq_range, list(refined)])
+        forced_resp = np.hstack(
+            [response.forced_resp] + [x[:, np.newaxis] for x in refined.values()]
+        )
+        order = np.argsort(speed_range, kind="stable")
+        speed_range = speed_range[order]
+        forced_resp = forced_resp[:, order]
+        response = ForcedResponseResults(
+            forced_resp=forced_resp,
+            speed_range=speed_range,
+            magnitude=abs(forced_resp),
+            phase=np.angle(forced_resp),
+        )
+        mag = response.magnitude
+        mag_plot = response.plot_magnitude(dof)
+        phs_plot = response.plot_phase(dof)
 
+        for i, (_, _, w_low, w_high) in enumerate(peaks):
             # Amplification Factor (AF) - API684 - SP6.8.2.1
-            AF = wn[i] / (freq_range[idx[1]] - freq_range[idx[0]])
+            AF = wn[i] / (w_high - w_low)
 
             # Separation Margin (SM) - API684 - SP6.8.2.10
             if AF > 2.5 and wn[i] < minspeed:
@@ -834,7 +1646,7 @@ class Report:
                 mag_plot.add_trace(
                     go.Scatter(
                         x=[wn[i], SMspeed, SMspeed, wn[i], wn[i]],
-                        y=[0, 0, max(magnitude[idx_max]), max(magnitude[idx_max]), 0],
+                        y=[0, 0, peak_max, peak_max, 0],
                         text=hovertemplate,
                         mode="lines",
                         opacity=0.3,
@@ -863,7 +1675,7 @@ class Report:
                 mag_plot.add_trace(
                     go.Scatter(
                         x=[SMspeed, wn[i], wn[i], SMspeed, SMspeed],
-                        y=[0, 0, max(magnitude[idx_max]), max(magnitude[idx_max]), 0],
+                        y=[0, 0, peak_max, peak_max, 0],
                         text=hovertemplate,
                         mode="lines",
                         opacity=0.3,
@@ -965,6 +1777,59 @@ class Report:
 
         return subplots, unbalance_dict
 
+    def mode_analysis(self, modes=None):
+        """Analyze the mode shapes and unbalance loads of several modes.
+
+        All the modes are analyzed from a single modal analysis at the maximum
+        speed and a single static analysis, so the cost does not depend on the
+        number of modes. For each mode, the analysis returns the nodes where
+        the maximum and minimum displacements occur (where the unbalance is
+        applied), the modal participation and the API unbalance weights.
+
+        The modal participation is the fraction of the rotor mass that takes
+        part in the mode for lateral translations (effective modal mass ratio).
+
+        Parameters
+        ----------
+        modes : list, optional
+            List with the n'th vibration modes. Default is the first two
+            backward and forward modes, [0, 1, 2, 3].
+
+        Returns
+        -------
+        df : pd.DataFrame
+            Dataframe with the mode, the natural frequency (wn), the nodes of
+            minimum and maximum displacement (node_min and node_max), the
+            modal participation and the unbalance weights of each mode. The
+            unbalance weights are only calculated for the first four modes.
+
+        Example
+        -------
+        >>> import ross as rs
+        >>> report = rs.report_example()
+        >>> df = report.mode_analysis()
+        >>> df["node_max"].tolist()
+        [array([3.]), array([3.]), array([1.]), array([1.])]
+        """
+        if modes is None:
+            modes = _REPORT_MODES
+
+        shapes = self._mode_shapes(modes)
+
+        return pd.DataFrame(
+            dict(
+                mode=list(modes),
+                wn=shapes["wn"],
+                node_min=shapes["node_min"],
+                node_max=shapes["node_max"],
+                participation=shapes["participation"],
+                unbalance=[
+                    self._unbalance_weights(mode) if mode <= 3 else None
+                    for mode in modes
+                ],
+            )
+        )
+
     def mode_shape(self, mode):
         """Evaluate the mode shapes for the rotor.
 
@@ -1002,77 +1867,16 @@ class Report:
         """
         nodes_pos = self.rotor.nodes_pos
         df_bearings = self.rotor.df_bearings
-        df_disks = self.rotor.df_disks
 
-        modal = self.rotor.run_modal(speed=self.maxspeed)
-        xn, yn, zn, xc, yc, zc_pos, nn = modal.calc_mode_shape(mode=mode)
-
-        # reduce 3D view to 2D view
-        vn = np.zeros(len(zn))
-        for i in range(len(zn)):
-            theta = np.arctan(xn[i] / yn[i])
-            vn[i] = xn[i] * np.sin(theta) + yn[i] * np.cos(theta)
-
-        # remove repetitive values from zn and vn
-        idx_remove = []
-        for i in range(1, len(zn)):
-            if zn[i] == zn[i - 1]:
-                idx_remove.append(i)
-        zn = np.delete(zn, idx_remove)
-        vn = np.delete(vn, idx_remove)
-
-        node_min = np.array([])
-        node_max = np.array([])
-
-        if self.rotor_type == "between_bearings":
-
-            aux_idx_max = argrelextrema(vn, np.greater)[0].tolist()
-            aux_idx_min = argrelextrema(vn, np.less)[0].tolist()
-
-            # verification of rigid modes
-            if len(aux_idx_max) == 0 and len(aux_idx_min) == 0:
-                idx_max = np.argmax(vn)
-                idx_min = np.argmin(vn)
-
-                # corrects the index by the removed points
-                for i in idx_remove:
-                    if idx_min > i:
-                        idx_min += 1
-                    if idx_max > i:
-                        idx_max += 1
-                node_max = np.round(np.array([idx_max]) / nn)
-                node_min = np.round(np.array([idx_min]) / nn)
-
-            if len(aux_idx_min) != 0:
-                idx_min = np.where(vn == min(vn[aux_idx_min]))[0].tolist()
-
-                # corrects the index by the removed points
-                for i in idx_remove:
-                    if idx_min[0] > i:
-                        idx_min[0] += 1
-                node_min = np.round(np.array(idx_min) / nn)
-
-            if len(aux_idx_max) != 0:
-                idx_max = np.where(vn == max(vn[aux_idx_max]))[0].tolist()
-
-                # corrects the index by the removed points
-                for i in idx_remove:
-                    if idx_max[0] > i:
-                        idx_max[0] += 1
-                node_max = np.round(np.array(idx_max) / nn)
-
-        elif self.rotor_type == "double_overhung":
-            node_max = [max(df_disks["n"])]
-            node_min = [min(df_disks["n"])]
-
-        elif self.rotor_type == "single_overhung_l":
-            node_min = [min(df_disks["n"])]
-
-        elif self.rotor_type == "single_overhung_r":
-            node_max = [max(df_disks["n"])]
+        # the mode shapes of the report modes are evaluated together
+        shapes = self._mode_shapes([mode])
+        zn = shapes["zn"]
+        vn = shapes["vn"][:, 0]
+        node_min = shapes["node_min"][0]
+        node_max = shapes["node_max"][0]
 
         nodes_pos = np.array(nodes_pos)
-        rpm_speed = (30 / np.pi) * modal.wn[mode]
+        rpm_speed = (30 / np.pi) * shapes["wn"][0]
 
         self.node_min = node_min
         self.node_max = node_max
@@ -1174,6 +1978,155 @@ class Report:
 
         return fig
 
+    def _cross_coupled_log_dec(self, bearings, nodes, cross_coupling, speed):
+        """Log decrement along a sweep of applied cross-coupled stiffness.
+
+        The cross-coupled stiffness q applied at a node adds kxy = q and
+        kyx = -q to the rotor stiffness matrix, which is a rank-2 update of the
+        state space matrix. The eigenvalue problem is solved once for the rotor
+        without cross-coupling, and the updated problem is written in its modal
+        coordinates as a diagonal matrix plus a low rank term.
+
+        The lowest modes are tracked along the sweep: each eigenvalue is predicted
+        from the previous step eigenvectors (first order perturbation) and
+        corrected with two-sided Rayleigh quotient iterations, where the shifted
+        systems are solved with the Woodbury identity. Each step costs a few
+        products with the modal matrices instead of a new modal analysis. If the
+        iterations do not converge, or the tracked mode is no longer the first
+        non-backward mode, the step is solved with a new modal analysis.
+
+        Parameters
+        ----------
+        bearings : list
+            List with the bearing elements of the rotor, without cross-coupling.
+        nodes : list
+            Nodes where the cross-coupled stiffness is applied.
+        cross_coupling : np.ndarray
+            Cross-coupled stiffness applied at each node, with shape
+            (n_steps, len(nodes)).
+        speed : float
+            Rotor speed.
+
+        Returns
+        -------
+        log_dec : np.ndarray
+            Logarithmic decrement of the first non-backward mode for each step.
+
+        Raises
+        ------
+        ValueError
+            If all the modes of the rotor without cross-coupling are backward.
+        """
+
+        def aux_rotor_instance(q=None):
+            aux_bearings = [copy(b) for b in bearings]
+            if q is not None:
+                for n, qi in zip(nodes, q):
+                    aux_bearings.append(
+                        BearingElement(n=n, kxx=0, cxx=0, kxy=qi, kyx=-qi)
+                    )
+
+            return Rotor(
+                shaft_elements=self.rotor.shaft_elements,
+                disk_elements=[],
+                bearing_elements=aux_bearings,
+                rated_w=self.rotor.rated_w,
+            )
+
+        def solve(D, P, Qt, c, b):
+            """Solve (diag(D) + P diag(c) Qt) x = b with the Woodbury identity."""
+            DP = P / D[:, np.newaxis]
+            cap = np.eye(len(c)) + c[:, np.newaxis] * (Qt @ DP)
+            Db = b / D
+            return Db - DP @ np.linalg.solve(cap, c * (Qt @ Db))
+
+        aux_rotor = aux_rotor_instance()
+        rotor_data = (
+            aux_rotor.ndof,
+            aux_rotor.nodes,
+            aux_rotor.nodes_pos,
+            aux_rotor.shaft_elements_length,
+        )
+
+        # the full eigenvalue problem without cross-coupling gives both the
+        # first non-backward mode and the modal coordinates of the update
+        evalues, X = Rotor._eigs(aux_rotor.A(speed=speed))
+        idx = Rotor._index(evalues)
+        n_modes = len(evalues) // 2
+        mode, _ = _non_backward_log_dec(
+            speed, evalues[idx][:n_modes], X[:, idx][:, :n_modes], rotor_data
+        )
+        if mode is None:
+            raise ValueError("All the modes of the rotor are backward.")
+
+        # the modes up to the first non-backward mode, and the next ones
+        n_track = min(mode + 3, n_modes)
+        track = idx[:n_track]
+
+        # rank-2 update for a unit cross-coupled stiffness at each node
+        ndof = aux_rotor.ndof
+        U = np.zeros((2 * ndof, 2 * len(nodes)))
+        V = np.zeros((2 * ndof, 2 * len(nodes)))
+        for i, n in enumerate(nodes):
+            unit = BearingElement(n=n, kxx=0, cxx=0, kxy=1, kyx=-1)
+            dofs = aux_rotor.number_dof * n + np.arange(2)
+            E = np.zeros((ndof, 2))
+            E[dofs, [0, 1]] = 1
+            U[ndof:, 2 * i : 2 * i + 2] = -la.solve(aux_rotor.M(), E) @ unit.K(speed)
+            V[:ndof, 2 * i : 2 * i + 2] = E
+
+        # update in modal coordinates: diag(evalues) + P @ diag(c) @ Qt
+        P = la.solve(X, U)
+        Qt = V.T @ X
+
+        # right and left eigenvectors of the tracked modes in modal coordinates
+        Z = np.eye(len(evalues), dtype=complex)[:, track]
+        Y = Z.copy()
+        sigma = evalues[track]
+
+        log_dec = np.zeros(len(cross_coupling))
+        for i, q in enumerate(cross_coupling):
+            c = np.repeat(q, 2).astype(float)
+            converged = np.zeros(n_track, dtype=bool)
+            for j in range(n_track):
+                z, y = Z[:, j], Y[:, j]
+                for _ in range(20):
+                    Bz = evalues * z + P @ (c * (Qt @ z))
+                    sigma_new = (y.conj() @ Bz) / (y.conj() @ z)
+                    converged[j] = np.abs(sigma_new - sigma[j]) <= 1e-12 * np.abs(
+                        sigma_new
+                    )
+                    sigma[j] = sigma_new
+                    if converged[j]:
+                        break
+                    D = evalues - sigma[j]
+                    z = solve(D, P, Qt, c, z)
+                    z /= la.norm(z)
+                    y = solve(D.conj(), Qt.conj().T, P.conj().T, c, y)
+                    y /= la.norm(y)
+                Z[:, j], Y[:, j] = z, y
+
+            order = np.argsort(np.imag(sigma))
+            index, log_dec_i = _non_backward_log_dec(
+                speed, sigma[order], X @ Z[:, order], rotor_data
+            )
+            # the tracked mode must still be the first non-backward one, below
+            # the highest tracked mode so no untracked mode can be lower
+            if (
+                np.all(converged)
+                and index is not None
+                and order[index] == mode
+                and index < n_track - 1
+            ):
+                log_dec[i] = log_dec_i
+            else:
+                # tracking failed or the first non-backward mode changed
+                modal = aux_rotor_instance(q).run_modal(speed=speed)
+                non_backward = modal.whirl_direction() != "Backward"
+                log_dec[i] = modal.log_dec[non_backward][0]
+
+        return log_dec
+
     def stability_level_1(self, D, H, HP, oper_speed, RHO_ratio, RHOs, RHOd, unit="m"):
         """Stability analysis level 1.
 
@@ -1277,8 +2230,6 @@ class Report:
             [len(self.disk_nodes) + 1, steps]
         ).T
 
-        log_dec = np.zeros(len(cross_coupled_array))
-
         # remove disks and seals from the rotor model
         bearing_list = [
             copy(b)
@@ -1288,42 +2239,28 @@ class Report:
 
         # Applying cross-coupling on rotor mid-span
         if self.rotor_type == "between_bearings":
-            for i, Q in enumerate(cross_coupled_array[:, -1]):
-                bearings = [copy(b) for b in bearing_list]
-
-                # cross-coupling introduced at the rotor mid-span
-                n = np.round(np.mean(self.rotor.nodes))
-                cross_coupling = BearingElement(n=int(n), kxx=0, cxx=0, kxy=Q, kyx=-Q)
-                bearings.append(cross_coupling)
-
-                aux_rotor = Rotor(
-                    shaft_elements=self.rotor.shaft_elements,
-                    disk_elements=[],
-                    bearing_elements=bearings,
-                    rated_w=self.rotor.rated_w,
-                )
-                modal = aux_rotor.run_modal(speed=oper_speed * np.pi / 30)
-                non_backward = modal.whirl_direction() != "Backward"
-                log_dec[i] = modal.log_dec[non_backward][0]
+            nodes = [int(np.round(np.mean(self.rotor.nodes)))]
+            cross_coupling = cross_coupled_array[:, -1:]
 
         # Applying cross-coupling for each disk - API 684 - SP6.8.5.9
         else:
-            for i, Q in enumerate(cross_coupled_array[:, :-1]):
-                bearings = [copy(b) for b in bearing_list]
-                # cross-coupling introduced at overhung disks
-                for n, q in zip(self.disk_nodes, Q):
-                    cross_coupling = BearingElement(n=n, kxx=0, cxx=0, kxy=q, kyx=-q)
-                    bearings.append(cross_coupling)
-
-                aux_rotor = Rotor(
-                    shaft_elements=self.rotor.shaft_elements,
-                    disk_elements=[],
-                    bearing_elements=bearings,
-                    rated_w=self.rotor.rated_w,
+            nodes = self.disk_nodes
+            cross_coupling = cross_coupled_array[:, :-1]
+
+        speed = oper_speed * np.pi / 30
+        log_dec = cached_arrays(
+            lambda: {
+                "log_dec": self._cross_coupled_log_dec(
+                    bearing_list, nodes, cross_coupling, speed
                 )
-                modal = aux_rotor.run_modal(speed=oper_speed * np.pi / 30)
-                non_backward = modal.whirl_direction() != "Backward"
-                log_dec[i] = modal.log_dec[non_backward][0]
+            },
+            "stability_level_1",
+            self.rotor.shaft_elements,
+            bearing_list,
+            nodes,
+            cross_coupling,
+            speed,
+        )["log_dec"]
 
         # verifies if log dec is greater than zero to begin extrapolation
         cross_coupled_Qa = cross_coupled_array[:, -1]
@@ -1346,7 +2283,7 @@ class Report:
         log_dec_a = log_dec[np.where(cross_coupled_Qa == Qa)][0]
 
         # CSR - Critical Speed Ratio
-        crit_speed = self.rotor.run_modal(speed=self.maxspeed).wn[0]
+        crit_speed = self._run_modal(self.maxspeed).wn[0]
         CSR = self.maxspeed / crit_speed
 
         # RHO_mean - Average gas density
@@ -1588,7 +2525,7 @@ class Report:
 
         return fig1, fig2
 
-    def stability_level_2(self):
+    def stability_level_2(self, n_jobs=1):
         """Stability analysis level 2.
 
         For the level 2 stability analysis additional sources that contribute
@@ -1598,6 +2535,17 @@ class Report:
         c)  impeller/blade flow aerodynamic effects;
         d)  internal friction.
 
+        The shaft and bearings matrices are assembled once and the disks and
+        seals matrices are added to them for each case analyzed, so the rotor
+        is not rebuilt for each component. The eigenvalue problems of the cases
+        are independent and can be solved in parallel processes.
+
+        Parameters
+        ----------
+        n_jobs : int, optional
+            Number of worker processes used to solve the cases.
+            If None, the number of processors is used. Default is 1.
+
         Returns
         -------
         df_logdec: pd.DataFrame
@@ -1609,6 +2557,8 @@ class Report:
         >>> report = rs.report_example()
         >>> dataframe = report.stability_level_2()
         """
+        speed = self.maxspeed
+
         # Build a list of seals
         seal_list = [
             copy(b) for b in self.rotor.bearing_elements if isinstance(b, SealElement)
@@ -1620,89 +2570,128 @@ class Report:
             if not isinstance(b, SealElement)
         ]
 
-        log_dec_seal = []
-        log_dec_disk = []
-        log_dec_full = []
-        data_seal = {}
-        data_disk = {}
-        data_rotor = {}
+        disk_list = [copy(disk) for disk in self.rotor.disk_elements]
+
+        # rotor with the shaft, disks, bearings and seals, which sets the global
+        # dofs of each element. As in the analysis of each component, the point
+        # masses are not included.
+        aux_rotor = Rotor(
+            shaft_elements=self.rotor.shaft_elements,
+            disk_elements=disk_list,
+            bearing_elements=bearing_list + seal_list,
+            rated_w=self.maxspeed,
+        )
+        rotor_data = (
+            aux_rotor.ndof,
+            aux_rotor.nodes,
+            aux_rotor.nodes_pos,
+            aux_rotor.shaft_elements_length,
+        )
+
+        def add_matrices(matrices, elements):
+            matrices = [m.copy() for m in matrices]
+            for elm in elements:
+                index = np.ix_(elm.dof_global_index, elm.dof_global_index)
+                matrices[0][index] += elm.M()
+                matrices[3][index] += elm.G()
+                # only the bearings and seals matrices depend on the frequency
+                if isinstance(elm, BearingElement):
+                    matrices[1][index] += elm.K(speed)
+                    matrices[2][index] += elm.C(speed)
+                else:
+                    matrices[1][index] += elm.K()
+                    matrices[2][index] += elm.C()
+            return matrices
+
+        # shaft and bearings matrices, shared by all the cases
+        ndof = aux_rotor.ndof
+        base = add_matrices(
+            [np.zeros((ndof, ndof)) for _ in range(4)],
+            aux_rotor.shaft_elements + bearing_list,
+        )
+
+        def component_matrices(elements):
+            return add_matrices(base, elements)
+
+        disk_tags = []
+        seal_tags = []
+        cases = []
 
         # Evaluate log dec for each component - Disks
         if len(self.rotor.disk_elements):
-            for disk in self.rotor.disk_elements:
-                aux_rotor = Rotor(
-                    shaft_elements=self.rotor.shaft_elements,
-                    disk_elements=[disk],
-                    bearing_elements=bearing_list,
-                    rated_w=self.maxspeed,
-                )
-                modal = aux_rotor.run_modal(speed=self.maxspeed)
-                non_backward = modal.whirl_direction() != "Backward"
-                log_dec_disk.append(modal.log_dec[non_backward][0])
-
-            # Evaluate log dec for group bearings + disks
-            disk_tags = [
-                "Shaft + Bearings + " + disk.tag for disk in self.rotor.disk_elements
-            ]
+            for disk in disk_list:
+                disk_tags.append("Shaft + Bearings + " + disk.tag)
+                cases.append([disk])
 
             # Evaluate log dec for group bearings + all disks
-            if len(self.rotor.disk_elements) > 1:
-                all_disks_tag = " + ".join(
-                    [disk.tag for disk in self.rotor.disk_elements]
-                )
+            if len(disk_list) > 1:
+                all_disks_tag = " + ".join([disk.tag for disk in disk_list])
                 disk_tags.append("Shaft + Bearings + " + all_disks_tag)
-
-                aux_rotor = Rotor(
-                    shaft_elements=self.rotor.shaft_elements,
-                    disk_elements=self.rotor.disk_elements,
-                    bearing_elements=bearing_list,
-                    rated_w=self.maxspeed,
-                )
-                modal = aux_rotor.run_modal(speed=self.maxspeed)
-                non_backward = modal.whirl_direction() != "Backward"
-                log_dec_disk.append(modal.log_dec[non_backward][0])
-
-            data_disk = {"tags": disk_tags, "log_dec": log_dec_disk}
+                cases.append(disk_list)
 
         # Evaluate log dec for each component - Seals
         if len(seal_list):
             for seal in seal_list:
-                bearings_seal = deepcopy(bearing_list)
-                bearings_seal.append(seal)
-
-                aux_rotor = Rotor(
-                    shaft_elements=self.rotor.shaft_elements,
-                    disk_elements=[],
-                    bearing_elements=bearings_seal,
-                    rated_w=self.maxspeed,
-                )
-                modal = aux_rotor.run_modal(speed=self.maxspeed)
-                non_backward = modal.whirl_direction() != "Backward"
-                log_dec_seal.append(modal.log_dec[non_backward][0])
-
-            seal_tags = ["Shaft + Bearings + " + seal.tag for seal in seal_list]
+                seal_tags.append("Shaft + Bearings + " + seal.tag)
+                cases.append([seal])
 
             if len(seal_list) > 1:
                 # Evaluate log dec for group bearings + seals
                 all_seals_tag = " + ".join([seal.tag for seal in seal_list])
                 seal_tags.append("Shaft + Bearings + " + all_seals_tag)
+                cases.append(seal_list)
 
-                aux_rotor = Rotor(
-                    shaft_elements=self.rotor.shaft_elements,
-                    disk_elements=[],
-                    bearing_elements=self.rotor.bearing_elements,
-                    rated_w=self.maxspeed,
+        cases_matrices = [component_matrices(elements) for elements in cases]
+
+        # cases already solved for identical matrices are loaded from the cache
+        log_dec = [None] * len(cases)
+        cache = get_cache()
+        if cache is not None:
+            keys = [
+                content_hash("stability_level_2", *matrices, speed, rotor_data)
+                for matrices in cases_matrices
+            ]
+            for i, key in enumerate(keys):
+                arrays = cache.get(key)
+                if arrays is not None:
+                    log_dec[i] = float(arrays["log_dec"])
+        missing = [i for i, ld in enumerate(log_dec) if ld is None]
+
+        if n_jobs == 1 or len(missing) < 2:
+            missing_log_dec = [
+                _stability_variant_log_dec(*cases_matrices[i], speed, rotor_data)
+                for i in missing
+            ]
+        else:
+            n_workers = min(n_jobs or os.cpu_count(), len(missing))
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                missing_log_dec = list(
+                    executor.map(
+                        _stability_variant_log_dec,
+                        *zip(*[cases_matrices[i] for i in missing]),
+                        [speed] * len(missing),
+                        [rotor_data] * len(missing),
+                    )
                 )
-                modal = aux_rotor.run_modal(speed=self.maxspeed)
-                non_backward = modal.whirl_direction() != "Backward"
-                log_dec_seal.append(modal.log_dec[non_backward][0])
 
+        for i, ld in zip(missing, missing_log_dec):
+            log_dec[i] = ld
+            if cache is not None and ld is not None:
+                cache.set(keys[i], log_dec=np.array(ld))
+
+        log_dec_disk = log_dec[: len(disk_tags)]
+        log_dec_seal = log_dec[len(disk_tags) :]
+        data_disk = {}
+        data_seal = {}
+        if len(disk_tags):
+            data_disk = {"tags": disk_tags, "log_dec": log_dec_disk}
+        if len(seal_tags):
             data_seal = {"tags": seal_tags, "log_dec": log_dec_seal}
 
         # Evaluate log dec for all components
-        modal = self.rotor.run_modal(speed=self.maxspeed)
+        modal = self._run_modal(self.maxspeed)
         non_backward = modal.whirl_direction() != "Backward"
-        log_dec_full.append(modal.log_dec[non_backward][0])
+        log_dec_full = [modal.log_dec[non_backward][0]]
         rotor_tags = [self.tag]
 
         data_rotor = {"tags": rotor_tags, "log_dec": log_dec_full}
@@ -7,6 +7,7 @@ and 2 element options with 8 or 12 degrees of freedom.
 # fmt: off
 import os
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -96,6 +97,21 @@ class _Coefficient:
         else:
             self.interpolated = lambda x: np.array(self.coefficient[0])
 
+    def __reduce__(self):
+        """Pickle the coefficient by its constructor arguments.
+
+        The interpolation function may be a lambda, which can not be pickled, so
+        it is created again when the coefficient is unpickled.
+
+        Examples
+        --------
+        >>> import pickle
+        >>> bearing = bearing_example()
+        >>> pickle.loads(pickle.dumps(bearing.kxx)) == bearing.kxx
+        True
+        """
+        return self.__class__, (self.coefficient, self.frequency)
+
     def __eq__(self, other):
         """Equality method for comparasions.
 
@@ -294,6 +310,47 @@ class _Damping_Coefficient(_Coefficient):
         return fig
 
 
+def _fluid_flow_coefficients(fluid_flow_kwargs, operating_points):
+    """Calculate short bearing coefficients for a sequence of operating points.
+
+    A single FluidFlow is created and reused for all points, only its operating
+    conditions are changed between them. The coefficients are the analytical
+    short bearing ones, so the numerical pressure field is not calculated. This function is module level
+    so that it can be sent to worker processes.
+
+    Parameters
+    ----------
+    fluid_flow_kwargs : dict
+        Geometry and fluid arguments used to instantiate the FluidFlow.
+    operating_points : list
+        List of (omega, load, eccentricity) tuples.
+
+    Returns
+    -------
+    coefficients : list
+        List with [kxx, kxy, kyx, kyy, cxx, cxy, cyx, cyy] for each point.
+    """
+    fluid_flow = None
+    coefficients = []
+    for omega, load, eccentricity in operating_points:
+        if fluid_flow is None:
+            fluid_flow = flow.FluidFlow(
+                omega=omega,
+                load=load,
+                eccentricity=eccentricity,
+                immediately_calculate_pressure_matrix_numerically=False,
+                **fluid_flow_kwargs,
+            )
+        else:
+            fluid_flow.set_operating_conditions(
+                omega, load=load, eccentricity=eccentricity
+            )
+        k = calculate_stiffness_matrix(fluid_flow, force_type="short")
+        c = calculate_damping_matrix(fluid_flow, force_type="short")
+        coefficients.append(k + c)
+    return coefficients
+
+
 class BearingElement(Element):
     """A bearing element.
 
@@ -525,30 +582,36 @@ class BearingElement(Element):
         >>> bearing.save(Path(os.getcwd()))
         """
         data = self.get_data(Path(file_name) / "BearingElement.toml")
+        data["BearingElement"].update(self._save_data()["BearingElement"])
+        self.dump_data(data, Path(file_name) / "BearingElement.toml")
 
+    def _save_data(self):
+        """Return the element entry of the BearingElement table."""
         if type(self.frequency) == np.ndarray:
             try:
                 self.frequency[0]
-                frequency = list(self.frequency)
+                frequency = self.frequency.tolist()
             except IndexError:
                 frequency = None
 
-        data["BearingElement"][str(self.n)] = {
+        # numpy arrays and scalars are converted to python floats,
+        # otherwise toml dumps them as strings
+        entry = {
             "n": self.n,
-            "kxx": self.kxx.coefficient,
-            "cxx": self.cxx.coefficient,
-            "kyy": self.kyy.coefficient,
-            "kxy": self.kxy.coefficient,
-            "kyx": self.kyx.coefficient,
-            "cyy": self.cyy.coefficient,
-            "cxy": self.cxy.coefficient,
-            "cyx": self.cyx.coefficient,
+            "kxx": np.array(self.kxx.coefficient, dtype=np.float64).tolist(),
+            "cxx": np.array(self.cxx.coefficient, dtype=np.float64).tolist(),
+            "kyy": np.array(self.kyy.coefficient, dtype=np.float64).tolist(),
+            "kxy": np.array(self.kxy.coefficient, dtype=np.float64).tolist(),
+            "kyx": np.array(self.kyx.coefficient, dtype=np.float64).tolist(),
+            "cyy": np.array(self.cyy.coefficient, dtype=np.float64).tolist(),
+            "cxy": np.array(self.cxy.coefficient, dtype=np.float64).tolist(),
+            "cyx": np.array(self.cyx.coefficient, dtype=np.float64).tolist(),
             "frequency": frequency,
             "tag": self.tag,
             "n_link": self.n_link,
             "scale_factor": self.scale_factor,
         }
-        self.dump_data(data, Path(file_name) / "BearingElement.toml")
+        return {"BearingElement": {str(self.n): entry}}
 
     @staticmethod
     def load(file_name=""):
@@ -1112,6 +1175,159 @@ class BearingElement(Element):
             frequency=fluid_flow.omega,
         )
 
+    @classmethod
+    def from_fluid_flow_speed_range(
+        cls,
+        n,
+        nz,
+        ntheta,
+        nradius,
+        length,
+        omega,
+        p_in,
+        p_out,
+        radius_rotor,
+        radius_stator,
+        visc,
+        rho,
+        eccentricity=None,
+        load=None,
+        n_jobs=1,
+        file_name=None,
+        tag=None,
+        n_link=None,
+        scale_factor=1,
+        color="#355d7a",
+    ):
+        """Instantiate a speed dependent bearing from its fluid flow.
+
+        The stiffness and damping coefficients are calculated for each speed in
+        omega, optionally in parallel worker processes. Each worker creates a single
+        FluidFlow object and only updates its operating conditions between speeds.
+
+        Only the analytical short bearing coefficients are provided, with a single
+        load (or eccentricity) for each speed. The pressure field is not calculated
+        on the numerical grid, so nz, ntheta and nradius do not change the
+        coefficients. For numerical coefficients or several loads per speed, use
+        BearingElement.from_fluid_flow for each operating point.
+
+        Parameters
+        ----------
+        n : int
+            The node in which the bearing will be located in the rotor.
+        nz, ntheta, nradius, length, p_in, p_out, radius_rotor, radius_stator,
+        visc, rho :
+            Grid, geometry and fluid data. See BearingElement.from_fluid_flow.
+        omega : array
+            Rotation speeds (rad/s) in which the coefficients are calculated.
+        eccentricity : float, array, optional
+            Eccentricity (m) for all speeds or for each speed.
+        load : float, array, optional
+            Load applied to the rotor (N) for all speeds or for each speed.
+            Either load or eccentricity must be given.
+        n_jobs : int, optional
+            Number of worker processes. If 1, the coefficients are calculated in
+            the current process. If None, the number of processors is used.
+            Default is 1.
+        file_name : str, pathlib.Path, optional
+            Folder in which the bearing coefficient table is saved. It can be
+            reloaded with BearingElement.load without being recalculated.
+            Default is None.
+        tag : str, optional
+            A tag to name the element.
+            Default is None.
+        n_link : int, optional
+            Node to which the bearing will connect. If None the bearing is connected to
+            ground.
+            Default is None.
+        scale_factor : float, optional
+            The scale factor is used to scale the bearing drawing.
+            Default is 1.
+        color : str, optional
+            A color to be used when the element is represented.
+            Default is '#355d7a' (Cardinal).
+
+        Returns
+        -------
+        bearing: rs.BearingElement
+            A bearing object with coefficients for each speed.
+
+        Examples
+        --------
+        >>> omega = np.linspace(100, 300, 5)
+        >>> bearing = BearingElement.from_fluid_flow_speed_range(
+        ...     0, nz=30, ntheta=20, nradius=11, length=0.03, omega=omega, p_in=0.,
+        ...     p_out=0., radius_rotor=0.0499, radius_stator=0.05, visc=0.1,
+        ...     rho=860., load=525)
+        >>> bearing.frequency
+        array([100., 150., 200., 250., 300.])
+        """
+        if load is None and eccentricity is None:
+            raise ValueError("Either load or eccentricity must be given.")
+
+        omega = np.array(omega, dtype=np.float64)
+        loads = np.broadcast_to(np.array(load, dtype=object), omega.shape)
+        eccentricities = np.broadcast_to(
+            np.array(eccentricity, dtype=object), omega.shape
+        )
+        operating_points = list(zip(omega, loads, eccentricities))
+
+        fluid_flow_kwargs = dict(
+            nz=nz,
+            ntheta=ntheta,
+            nradius=nradius,
+            length=length,
+            p_in=p_in,
+            p_out=p_out,
+            radius_rotor=radius_rotor,
+            radius_stator=radius_stator,
+            viscosity=visc,
+            density=rho,
+        )
+
+        if n_jobs == 1:
+            coefficients = _fluid_flow_coefficients(fluid_flow_kwargs, operating_points)
+        else:
+            n_chunks = min(n_jobs or os.cpu_count(), len(operating_points))
+            chunks = [
+                [operating_points[i] for i in idx]
+                for idx in np.array_split(np.arange(len(operating_points)), n_chunks)
+            ]
+            with ProcessPoolExecutor(max_workers=n_chunks) as executor:
+                coefficients = [
+                    coef
+                    for chunk in executor.map(
+                        _fluid_flow_coefficients,
+                        [fluid_flow_kwargs] * n_chunks,
+                        chunks,
+                    )
+                    for coef in chunk
+                ]
+
+        coefficients = np.array(coefficients)
+        bearing = cls(
+            n,
+            kxx=coefficients[:, 0],
+            kxy=coefficients[:, 1],
+            kyx=coefficients[:, 2],
+            kyy=coefficients[:, 3],
+            cxx=coefficients[:, 4],
+            cxy=coefficients[:, 5],
+            cyx=coefficients[:, 6],
+            cyy=coefficients[:, 7],
+            frequency=omega,
+            tag=tag,
+            n_link=n_link,
+            scale_factor=scale_factor,
+            color=color,
+        )
+
+        if file_name is not None:
+            Path(file_name).mkdir(parents=True, exist_ok=True)
+            bearing.save(file_name)
+
+        return bearing
+
 
 class SealElement(BearingElement):
     """A seal element.
@@ -1830,33 +2046,16 @@ class BearingElement6DoF(BearingElement):
         >>> bearing.save(Path(os.getcwd()))
         """
         data = self.get_data(Path(file_name) / "BearingElement6DoF.toml")
-
-        if type(self.frequency) == np.ndarray:
-            try:
-                self.frequency[0]
-                frequency = list(self.frequency)
-            except IndexError:
-                frequency = None
-
-        data["BearingElement6DoF"][str(self.n)] = {
-            "n": self.n,
-            "kxx": self.kxx.coefficient,
-            "cxx": self.cxx.coefficient,
-            "kyy": self.kyy.coefficient,
-            "kxy": self.kxy.coefficient,
-            "kyx": self.kyx.coefficient,
-            "kzz": self.kzz.coefficient,
-            "cyy": self.cyy.coefficient,
-            "cxy": self.cxy.coefficient,
-            "cyx": self.cyx.coefficient,
-            "czz": self.czz.coefficient,
-            "frequency": frequency,
-            "tag": self.tag,
-            "n_link": self.n_link,
-            "scale_factor": self.scale_factor,
-        }
+        data["BearingElement6DoF"].update(self._save_data()["BearingElement6DoF"])
         self.dump_data(data, Path(file_name) / "BearingElement6DoF.toml")
 
+    def _save_data(self):
+        """Return the element entry of the BearingElement6DoF table."""
+        entry = super()._save_data()["BearingElement"][str(self.n)]
+        entry["kzz"] = np.array(self.kzz.coefficient, dtype=np.float64).tolist()
+        entry["czz"] = np.array(self.czz.coefficient, dtype=np.float64).tolist()
+        return {"BearingElement6DoF": {str(self.n): entry}}
+
     @staticmethod
     def load(file_name=""):
         """Load a list of bearing elements saved in a toml format.
@@ -0,0 +1,352 @@
+"""Results cache module.
+
+This module stores analyses results on disk, keyed by a hash of the rotor
+content and of the analysis arguments, so that the results are reused when the
+same analysis is run again for an identical rotor, even in another session.
+
+The cache is disabled by default and is enabled with enable_cache().
+"""
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from ross import __version__
+
+__all__ = [
+    "ResultsCache",
+    "content_hash",
+    "disable_cache",
+    "enable_cache",
+    "get_cache",
+]
+
+# attributes that do not change the analyses results
+_SKIPPED_ATTRIBUTES = {"dof_global_index", "tag", "color", "scale_factor"}
+
+_cache = None
+
+# True while a cached analysis is computed, so that the analyses it runs (e.g.
+# the modal analyses of a frequency response) are not stored individually
+_computing = False
+
+
+def _update_hash(h, obj, visited):
+    """Feed a canonical representation of an object to a hash.
+
+    Parameters
+    ----------
+    h : hashlib object
+        Hash to be updated.
+    obj : object
+        Object to be hashed. Numbers, strings, arrays and containers are hashed
+        by value; other objects are hashed by class name and attributes.
+    visited : set
+        Ids of the objects already hashed, to avoid infinite recursion.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, complex, str, bytes)):
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+    elif isinstance(obj, (np.ndarray, np.generic)):
+        arr = np.ascontiguousarray(obj)
+        if arr.dtype == object:
+            _update_hash(h, arr.tolist(), visited)
+        else:
+            h.update(f"array:{arr.dtype.str}:{arr.shape};".encode())
+            h.update(arr.tobytes())
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"{type(obj).__name__}:{len(obj)}[".encode())
+        for item in obj:
+            _update_hash(h, item, visited)
+        h.update(b"]")
+    elif isinstance(obj, dict):
+        h.update(f"dict:{len(obj)}{{".encode())
+        for key in sorted(obj, key=str):
+            _update_hash(h, str(key), visited)
+            _update_hash(h, obj[key], visited)
+        h.update(b"}")
+    elif isinstance(obj, (set, frozenset)):
+        _update_hash(h, sorted(obj, key=repr), visited)
+    elif callable(obj):
+        # functions and interpolators are derived from the hashed attributes
+        h.update(b"callable;")
+    elif hasattr(obj, "_content"):
+        h.update(f"{type(obj).__qualname__}(".encode())
+        _update_hash(h, obj._content(), visited)
+        h.update(b")")
+    elif hasattr(obj, "__dict__"):
+        if id(obj) in visited:
+            h.update(b"visited;")
+            return
+        visited.add(id(obj))
+        attributes = {
+            k: v for k, v in vars(obj).items() if k not in _SKIPPED_ATTRIBUTES
+        }
+        h.update(f"{type(obj).__module__}.{type(obj).__qualname__}(".encode())
+        _update_hash(h, attributes, visited)
+        h.update(b")")
+    else:
+        h.update(f"{type(obj).__qualname__}:{obj!r};".encode())
+
+
+def content_hash(*args):
+    """Return a stable hash of the objects content.
+
+    The hash does not depend on the objects identity or on the Python session,
+    so it can be used as a key for results stored on disk. Elements are hashed
+    by their parameters and rotors by their elements and parameters. Tags,
+    colors and the dof indexes assigned during the rotor assembly are ignored.
+    The ross version is part of the hash, so that results stored by other
+    versions are not reused.
+
+    Parameters
+    ----------
+    *args : objects
+        Objects to be hashed, e.g. a rotor and the analysis arguments.
+
+    Returns
+    -------
+    key : str
+        Hexadecimal SHA-256 digest.
+
+    Examples
+    --------
+    >>> from ross.rotor_assembly import rotor_example
+    >>> content_hash(rotor_example(), 100.0) == content_hash(rotor_example(), 100.0)
+    True
+    >>> content_hash(rotor_example(), 100.0) == content_hash(rotor_example(), 200.0)
+    False
+    """
+    h = hashlib.sha256()
+    h.update(f"ross:{__version__};".encode())
+    _update_hash(h, args, set())
+    return h.hexdigest()
+
+
+class ResultsCache:
+    """Cache of analyses results stored as compressed NumPy archives.
+
+    Each result is a set of arrays stored in a .npz file named after its key.
+    When the total size of the files exceeds max_size, the least recently used
+    files are removed.
+
+    Parameters
+    ----------
+    path : str, pathlib.Path
+        Directory where the results are stored. It is created if needed.
+    max_size : int, optional
+        Maximum size of the cache in bytes. Default is 1 GB.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> cache = ResultsCache(tempfile.mkdtemp())
+    >>> cache.set("key", x=np.arange(3))
+    >>> cache.get("key")["x"]
+    array([0, 1, 2])
+    >>> cache.get("other") is None
+    True
+    """
+
+    def __init__(self, path, max_size=2 ** 30):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self._size = self.size()
+
+    def _file(self, key):
+        return self.path / f"{key}.npz"
+
+    def get(self, key):
+        """Load the arrays stored for a key.
+
+        Parameters
+        ----------
+        key : str
+            Result key, usually obtained with content_hash().
+
+        Returns
+        -------
+        arrays : dict
+            Dictionary with the stored arrays, or None if the key is not cached.
+        """
+        file = self._file(key)
+        try:
+            with np.load(file, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+        except (OSError, ValueError):
+            return None
+
+        # the modification time is used to find the least recently used files
+        try:
+            os.utime(file)
+        except OSError:
+            pass
+
+        return arrays
+
+    def set(self, key, **arrays):
+        """Store arrays for a key.
+
+        Parameters
+        ----------
+        key : str
+            Result key, usually obtained with content_hash().
+        **arrays : np.ndarray
+            Arrays to be stored.
+        """
+        # write to a temporary file first, so that concurrent processes never
+        # read a partially written result
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(f, **arrays)
+            os.replace(tmp, self._file(key))
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+        # the directory is only scanned when the size limit may be exceeded
+        self._size += self._file(key).stat().st_size
+        if self._size > self.max_size:
+            self._evict()
+
+    def size(self):
+        """Return the total size of the stored results in bytes.
+
+        Returns
+        -------
+        size : int
+            Cache size in bytes.
+        """
+        return sum(f.stat().st_size for f in self.path.glob("*.npz"))
+
+    def _evict(self):
+        """Remove the least recently used results above the size limit."""
+        files = []
+        for file in self.path.glob("*.npz"):
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, file))
+
+        size = sum(f[1] for f in files)
+        for _, file_size, file in sorted(files, key=lambda f: f[0]):
+            if size <= self.max_size:
+                break
+            try:
+                file.unlink()
+            except FileNotFoundError:
+                pass
+            size -= file_size
+
+        self._size = size
+
+    def clear(self):
+        """Remove all the stored results."""
+        for file in self.path.glob("*.npz"):
+            try:
+                file.unlink()
+            except FileNotFoundError:
+                pass
+
+        self._size = 0
+
+
+def cached_arrays(compute, *key_args):
+    """Return the arrays of an analysis, reusing them from the cache if enabled.
+
+    Parameters
+    ----------
+    compute : callable
+        Function without arguments that runs the analysis and returns a
+        dictionary of arrays.
+    *key_args : objects
+        Objects that define the analysis results, e.g. the analysis name, the
+        rotor and the analysis arguments.
+        Analyses run by compute() are not cached individually.
+
+    Returns
+    -------
+    arrays : dict
+        Dictionary with the analysis arrays.
+
+    Examples
+    --------
+    >>> cached_arrays(lambda: {"x": np.ones(2)}, "analysis", 1.0)["x"]
+    array([1., 1.])
+    """
+    global _computing
+
+    cache = get_cache()
+    if cache is None or _computing:
+        return compute()
+
+    key = content_hash(*key_args)
+    arrays = cache.get(key)
+    if arrays is None:
+        _computing = True
+        try:
+            arrays = compute()
+        finally:
+            _computing = False
+        cache.set(key, **arrays)
+
+    return arrays
+
+
+def enable_cache(path=None, max_size=2 ** 30):
+    """Enable the results cache.
+
+    When the cache is enabled, Rotor.run_modal(), Rotor.run_freq_response() and
+    the Report stability analyses store their results on disk and reuse them
+    for identical rotors and arguments.
+
+    Parameters
+    ----------
+    path : str, pathlib.Path, optional
+        Directory where the results are stored. Default is ~/.cache/ross.
+    max_size : int, optional
+        Maximum size of the cache in bytes. Default is 1 GB.
+
+    Returns
+    -------
+    cache : ResultsCache
+        The enabled cache.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> import ross as rs
+    >>> cache = rs.enable_cache(tempfile.mkdtemp())
+    >>> rotor = rs.rotor_example()
+    >>> modal = rotor.run_modal(speed=0)
+    >>> len(list(cache.path.glob("*.npz")))
+    1
+    >>> rs.disable_cache()
+    """
+    global _cache
+    if path is None:
+        path = Path.home() / ".cache" / "ross"
+    _cache = ResultsCache(path, max_size=max_size)
+    return _cache
+
+
+def disable_cache():
+    """Disable the results cache. The stored results are kept on disk."""
+    global _cache
+    _cache = None
+
+
+def get_cache():
+    """Return the enabled results cache.
+
+    Returns
+    -------
+    cache : ResultsCache
+        The enabled cache, or None if the cache is disabled.
+    """
+    return _cache
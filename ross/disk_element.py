@@ -142,7 +142,12 @@ class DiskElement(Element):
         >>> disk.save()
         """
         data = self.get_data(Path(file_name) / "DiskElement.toml")
-        data["DiskElement"][str(self.n)] = {
+        data["DiskElement"].update(self._save_data()["DiskElement"])
+        self.dump_data(data, Path(file_name) / "DiskElement.toml")
+
+    def _save_data(self):
+        """Return the element entry of the DiskElement table."""
+        entry = {
             "n": self.n,
             "m": self.m,
             "Id": self.Id,
@@ -151,7 +156,7 @@ class DiskElement(Element):
             "scale_factor": self.scale_factor,
             "color": self.color,
         }
-        self.dump_data(data, Path(file_name) / "DiskElement.toml")
+        return {"DiskElement": {str(self.n): entry}}
 
     @staticmethod
     def load(file_name=os.getcwd()):
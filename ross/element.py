@@ -18,6 +18,34 @@ class Element(ABC):
         self.dof_mapping = None
         pass
 
+    def __getstate__(self):
+        """Return the element state for pickling.
+
+        The global dof index is a namedtuple created by the rotor the element
+        belongs to, which can not be pickled. It is assigned again when the element
+        is used to build a new rotor.
+
+        Returns
+        -------
+        state : dict
+            The element attributes, with dof_global_index set to None.
+
+        Examples
+        --------
+        >>> import pickle
+        >>> from ross.rotor_assembly import rotor_example
+        >>> rotor = rotor_example()
+        >>> disk = pickle.loads(pickle.dumps(rotor.disk_elements[0]))
+        >>> disk.m == rotor.disk_elements[0].m
+        True
+        >>> disk.dof_global_index is None
+        True
+        """
+        state = self.__dict__.copy()
+        if "dof_global_index" in state:
+            state["dof_global_index"] = None
+        return state
+
     def save(self, file_name):
         """Save the element in a file.
 
@@ -35,6 +63,20 @@ class Element(ABC):
         """
         pass
 
+    def _save_data(self):
+        """Return the element data to be saved.
+
+        Rotor.save() merges the data of all the elements and writes each table
+        once, so that saving a rotor is linear in the number of elements.
+
+        Returns
+        -------
+        data : dict
+            Dictionary {table_name: {element_number: parameters}} in the
+            format read by Rotor.load().
+        """
+        return {}
+
     @staticmethod
     def load(file_name):
         """Load elements saved in a file.
@@ -1,5 +1,7 @@
 # fmt: off
+import inspect
 import sys
+import warnings
 
 import numpy as np
 import scipy as sp
@@ -13,6 +15,11 @@ from ross.fluid_flow.fluid_flow_geometry import (calculate_attitude_angle,
 
 # fmt: on
 
+# scipy >= 1.12 renamed the relative tolerance of the iterative solvers to rtol
+_RTOL = (
+    "rtol" if "rtol" in inspect.signature(sp.sparse.linalg.gmres).parameters else "tol"
+)
+
 
 class FluidFlow:
     r"""Generate dynamic coefficients for bearings and seals.
@@ -75,6 +82,19 @@ class FluidFlow:
     Commands that can be passed as arguments.
     immediately_calculate_pressure_matrix_numerically: bool, optional
         If set True, calculates the pressure matrix numerically immediately.
+    solver: str, optional
+        Solver used for the linear system of the numerical pressure matrix.
+        The system is assembled as a sparse matrix for every solver.
+        'direct' (default) uses a sparse LU factorization. 'gmres' or 'bicgstab'
+        use an iterative Krylov solver preconditioned with an incomplete LU
+        factorization, which avoids the fill-in of the full factorization. The
+        preconditioner is computed once for the grid and reused while it converges.
+    solver_tolerance: float, optional
+        Relative residual tolerance of the iterative solvers. Default is 1e-10.
+    warm_start: bool, optional
+        If True (default), the iterative solvers start from the previous pressure
+        field, which converges in few iterations when the rotor center only
+        moved slightly.
 
     Returns
     -------
@@ -140,6 +160,10 @@ class FluidFlow:
         True if analytically calculated pressure matrix is available.
     numerical_pressure_matrix_available: bool
         True if numerically calculated pressure matrix is available.
+    solver_iterations: int
+        Number of iterations of the last iterative solve (0 for the direct solver).
+    solver_residual: float
+        Relative residual norm of the last solve.
 
     Examples
     --------
@@ -192,9 +216,19 @@ class FluidFlow:
         eccentricity=None,
         load=None,
         immediately_calculate_pressure_matrix_numerically=True,
+        solver="direct",
+        solver_tolerance=1e-10,
+        warm_start=True,
     ):
         if load is None and eccentricity is None:
             sys.exit("Either load or eccentricity must be given.")
+        if solver not in ["direct", "gmres", "bicgstab"]:
+            raise ValueError("solver should be 'direct', 'gmres' or 'bicgstab'.")
+        self.solver = solver
+        self.solver_tolerance = solver_tolerance
+        self.warm_start = warm_start
+        self.solver_iterations = 0
+        self.solver_residual = None
         self.nz = nz
         self.ntheta = ntheta
         self.nradius = nradius
@@ -206,14 +240,12 @@ class FluidFlow:
         self.dz = length / self.n_interv_z
         self.dtheta = self.ltheta / self.n_interv_theta
         self.ntotal = self.nz * self.ntheta
-        self.omega = omega
         self.p_in = p_in
         self.p_out = p_out
         self.radius_rotor = radius_rotor
         self.radius_stator = radius_stator
         self.viscosity = viscosity
         self.density = density
-        self.characteristic_speed = self.omega * self.radius_rotor
         self.radial_clearance = self.radius_stator - self.radius_rotor
         self.bearing_type = ""
         if self.length / (2 * self.radius_stator) <= 1 / 4:
@@ -222,8 +254,61 @@ class FluidFlow:
             self.bearing_type = "long_bearing"
         else:
             self.bearing_type = "medium_size"
+        self.set_operating_conditions(
+            omega, load=load, eccentricity=eccentricity, attitude_angle=attitude_angle
+        )
+        self.re = np.zeros([self.nz, self.ntheta])
+        self.ri = np.zeros([self.nz, self.ntheta])
+        self.z_list = np.zeros(self.nz)
+        self.xre = np.zeros([self.nz, self.ntheta])
+        self.xri = np.zeros([self.nz, self.ntheta])
+        self.yre = np.zeros([self.nz, self.ntheta])
+        self.yri = np.zeros([self.nz, self.ntheta])
+        self.p_mat_analytical = np.zeros([self.nz, self.ntheta])
+        self.c1 = np.zeros([self.nz, self.ntheta])
+        self.c2 = np.zeros([self.nz, self.ntheta])
+        self.c0w = np.zeros([self.nz, self.ntheta])
+        self.M = sp.sparse.csc_matrix((self.ntotal, self.ntotal))
+        self.f = np.zeros([self.ntotal, 1])
+        self._preconditioner = None
+        self.P = np.zeros([self.ntotal, 1])
+        self.p_mat_numerical = np.zeros([self.nz, self.ntheta])
+        self.gama = np.zeros([self.nz, self.ntheta])
+        self.calculate_coefficients()
+        self.analytical_pressure_matrix_available = False
+        self.numerical_pressure_matrix_available = False
+        self.calculate_pressure_matrix_numerical()
+        if immediately_calculate_pressure_matrix_numerically:
+            self.calculate_pressure_matrix_numerical()
+
+    def set_operating_conditions(
+        self, omega, load=None, eccentricity=None, attitude_angle=None
+    ):
+        """This function sets the rotation, load and rotor center of the fluid flow.
+        When only one of load or eccentricity is given, the other is calculated with
+        the short bearing approximation. The grid is not recalculated: call
+        calculate_coefficients and one of the calculate_pressure_matrix functions
+        afterwards to update the pressure field.
+        Parameters
+        ----------
+        omega: float
+            Rotation of the rotor (rad/s).
+        load: float, optional
+            Load applied to the rotor (N).
+        eccentricity: float, optional
+            Eccentricity (m) is the euclidean distance between rotor and stator centers.
+        attitude_angle: float, optional
+            Attitude angle. Angle between the load line and the eccentricity (rad).
+        Examples
+        --------
+        >>> my_fluid_flow = fluid_flow_example2()
+        >>> my_fluid_flow.set_operating_conditions(2 * my_fluid_flow.omega, load=525)
+        >>> my_fluid_flow.eccentricity_ratio # doctest: +ELLIPSIS
+        0.14...
+        """
+        self.omega = omega
+        self.characteristic_speed = self.omega * self.radius_rotor
         self.eccentricity = eccentricity
-        self.eccentricity_ratio = None
         self.load = load
         if self.eccentricity is None:
             modified_s = modified_sommerfeld_number(
@@ -253,28 +338,6 @@ class FluidFlow:
             self.attitude_angle = attitude_angle
         self.xi = self.eccentricity * np.cos(3 * np.pi / 2 + self.attitude_angle)
         self.yi = self.eccentricity * np.sin(3 * np.pi / 2 + self.attitude_angle)
-        self.re = np.zeros([self.nz, self.ntheta])
-        self.ri = np.zeros([self.nz, self.ntheta])
-        self.z_list = np.zeros(self.nz)
-        self.xre = np.zeros([self.nz, self.ntheta])
-        self.xri = np.zeros([self.nz, self.ntheta])
-        self.yre = np.zeros([self.nz, self.ntheta])
-        self.yri = np.zeros([self.nz, self.ntheta])
-        self.p_mat_analytical = np.zeros([self.nz, self.ntheta])
-        self.c1 = np.zeros([self.nz, self.ntheta])
-        self.c2 = np.zeros([self.nz, self.ntheta])
-        self.c0w = np.zeros([self.nz, self.ntheta])
-        self.M = np.zeros([self.ntotal, self.ntotal])
-        self.f = np.zeros([self.ntotal, 1])
-        self.P = np.zeros([self.ntotal, 1])
-        self.p_mat_numerical = np.zeros([self.nz, self.ntheta])
-        self.gama = np.zeros([self.nz, self.ntheta])
-        self.calculate_coefficients()
-        self.analytical_pressure_matrix_available = False
-        self.numerical_pressure_matrix_available = False
-        self.calculate_pressure_matrix_numerical()
-        if immediately_calculate_pressure_matrix_numerically:
-            self.calculate_pressure_matrix_numerical()
 
     def calculate_pressure_matrix_analytical(self, method=0, force_type=None):
         """This function calculates the pressure matrix analytically.
@@ -300,70 +363,110 @@ class FluidFlow:
         >>> my_fluid_flow.calculate_pressure_matrix_analytical() # doctest: +ELLIPSIS
         array([[...
         """
+        p_mat_analytical = self._pressure_analytical(
+            self.eccentricity_ratio, self.ri, method, force_type
+        )
+        if p_mat_analytical is not None:
+            self.p_mat_analytical = p_mat_analytical
+        self.analytical_pressure_matrix_available = True
+        return self.p_mat_analytical
+
+    def calculate_pressure_matrices_analytical(
+        self, eccentricity_ratios, method=0, force_type=None
+    ):
+        """This function calculates the pressure matrix analytically for several
+        eccentricity ratios at once. The fluid flow itself is not modified.
+        Parameters
+        ----------
+        eccentricity_ratios: array
+            Eccentricity ratios in which the pressure is calculated.
+        method: int
+            Analytical method to be used. See calculate_pressure_matrix_analytical.
+        force_type: str
+            If set, calculates the pressure matrix analytically considering the chosen type: 'short' or 'long'.
+        Returns
+        -------
+        p_mat_analytical: array of float
+            Pressure matrices stacked in an array of shape (n, nz, ntheta),
+            n being the number of eccentricity ratios.
+        Examples
+        --------
+        >>> my_fluid_flow = fluid_flow_example()
+        >>> my_fluid_flow.calculate_pressure_matrices_analytical([0.1, 0.2, 0.3]).shape
+        (3, 8, 32)
+        """
+        eccentricity_ratios = np.array(eccentricity_ratios, dtype=np.float64)
+        eccentricity_ratios = eccentricity_ratios.reshape(-1, 1, 1)
+        theta = np.arange(self.ntheta) * self.dtheta
+        # internal radius of the grid for each eccentricity, as in internal_radius_function
+        alpha = np.where(
+            (theta > 0) & (theta < np.pi), np.abs(np.pi - theta), theta + np.pi
+        )
+        eccentricity = eccentricity_ratios * self.radial_clearance
+        ri = np.sqrt(
+            self.radius_rotor ** 2 - (eccentricity * np.sin(alpha)) ** 2
+        ) + eccentricity * np.cos(alpha)
+        ri = np.broadcast_to(ri, (len(eccentricity_ratios), self.nz, self.ntheta))
+        p_mat_analytical = self._pressure_analytical(
+            eccentricity_ratios, ri, method, force_type
+        )
+        if p_mat_analytical is None:
+            raise ValueError("Method " + str(method) + " is not available.")
+        return p_mat_analytical
+
+    def _pressure_analytical(self, eccentricity_ratio, ri, method, force_type):
+        """Analytical pressure formulas evaluated on the whole grid.
+        eccentricity_ratio and ri are broadcast against the (nz, ntheta) grid.
+        Returns None if the method is not available for the bearing type.
+        """
+        z = (np.arange(self.nz) * self.dz).reshape(-1, 1)
+        theta = np.arange(self.ntheta) * self.dtheta
+        p_mat = None
         if self.bearing_type == "short_bearing" or force_type == "short":
             if method == 0:
-                for i in range(0, self.nz):
-                    for j in range(0, self.ntheta):
-                        # fmt: off
-                        self.p_mat_analytical[i][j] = (
-                                ((-3 * self.viscosity * self.omega) / self.radial_clearance ** 2) *
-                                ((i * self.dz - (self.length / 2)) ** 2 - (self.length ** 2) / 4) *
-                                (self.eccentricity_ratio * np.sin(j * self.dtheta)) /
-                                (1 + self.eccentricity_ratio * np.cos(j * self.dtheta)) ** 3)
-                        # fmt: on
-                        if self.p_mat_analytical[i][j] < 0:
-                            self.p_mat_analytical[i][j] = 0
+                # fmt: off
+                p_mat = (((-3 * self.viscosity * self.omega) / self.radial_clearance ** 2) *
+                         ((z - (self.length / 2)) ** 2 - (self.length ** 2) / 4) *
+                         (eccentricity_ratio * np.sin(theta)) /
+                         (1 + eccentricity_ratio * np.cos(theta)) ** 3)
+                # fmt: on
             elif method == 1:
-                for i in range(0, self.nz):
-                    for j in range(0, self.ntheta):
-                        # fmt: off
-                        self.p_mat_analytical[i][j] = (3 * self.viscosity / ((self.radial_clearance ** 2) *
-                                                                             (1. + self.eccentricity_ratio * np.cos(
-                                                                                 j * self.dtheta)) ** 3)) * \
-                                                      (-self.eccentricity_ratio * self.omega * np.sin(
-                                                          j * self.dtheta)) * \
-                                                      (((i * self.dz - (self.length / 2)) ** 2) - (
-                                                              self.length ** 2) / 4)
-                        # fmt: on
-                        if self.p_mat_analytical[i][j] < 0:
-                            self.p_mat_analytical[i][j] = 0
+                # fmt: off
+                p_mat = (3 * self.viscosity / ((self.radial_clearance ** 2) *
+                                               (1. + eccentricity_ratio * np.cos(theta)) ** 3)) * \
+                        (-eccentricity_ratio * self.omega * np.sin(theta)) * \
+                        (((z - (self.length / 2)) ** 2) - (self.length ** 2) / 4)
+                # fmt: on
         elif self.bearing_type == "long_bearing" or force_type == "long":
             if method == 0:
-                for i in range(0, self.nz):
-                    for j in range(0, self.ntheta):
-                        self.p_mat_analytical[i][j] = (
-                            (
-                                6
-                                * self.viscosity
-                                * self.omega
-                                * (self.ri[i][j] / self.radial_clearance) ** 2
-                                * self.eccentricity_ratio
-                                * np.sin(self.dtheta * j)
-                                * (
-                                    2
-                                    + self.eccentricity_ratio * np.cos(self.dtheta * j)
-                                )
-                            )
-                            / (
-                                (2 + self.eccentricity_ratio ** 2)
-                                * (
-                                    1
-                                    + self.eccentricity_ratio * np.cos(self.dtheta * j)
-                                )
-                                ** 2
-                            )
-                            + self.p_in
-                        )
-                        if self.p_mat_analytical[i][j] < 0:
-                            self.p_mat_analytical[i][j] = 0
+                p_mat = (
+                    (
+                        6
+                        * self.viscosity
+                        * self.omega
+                        * (ri / self.radial_clearance) ** 2
+                        * eccentricity_ratio
+                        * np.sin(theta)
+                        * (2 + eccentricity_ratio * np.cos(theta))
+                    )
+                    / (
+                        (2 + eccentricity_ratio ** 2)
+                        * (1 + eccentricity_ratio * np.cos(theta)) ** 2
+                    )
+                    + self.p_in
+                )
         elif self.bearing_type == "medium_size":
             raise ValueError(
                 "The pressure matrix for a bearing that is neither short or long can only be calculated "
                 "numerically. Try calling calculate_pressure_matrix_numerical or setting force_type "
                 "to either 'short' or 'long' in calculate_pressure_matrix_analytical."
             )
-        self.analytical_pressure_matrix_available = True
-        return self.p_mat_analytical
+        if p_mat is not None:
+            p_mat = np.array(
+                np.broadcast_to(p_mat, np.broadcast(p_mat, ri).shape), dtype=np.float64
+            )
+            p_mat[p_mat < 0] = 0
+        return p_mat
 
     def calculate_coefficients(self):
         """This function calculates the constants that form the Poisson equation
@@ -429,69 +532,55 @@ class FluidFlow:
                 )
 
     def mounting_matrix(self):
-        """This function assembles the matrix M and the independent vector f.
+        """This function assembles the sparse matrix M and the independent vector f.
         Examples
         --------
         >>> my_fluid_flow = fluid_flow_example()
         >>> my_fluid_flow.mounting_matrix()
-        >>> my_fluid_flow.M # doctest: +ELLIPSIS
-        array([[...
+        >>> my_fluid_flow.M.shape
+        (256, 256)
         """
-        # fmt: off
-        count = 0
-        for x in range(self.ntheta):
-            self.M[count][count] = 1
-            self.f[count][0] = self.p_in
-            count = count + self.nz - 1
-            self.M[count][count] = 1
-            self.f[count][0] = self.p_out
-            count = count + 1
-        count = 0
-        for x in range(self.nz - 2):
-            self.M[self.ntotal - self.nz + 1 + count][1 + count] = 1
-            self.M[self.ntotal - self.nz + 1 + count][self.ntotal - self.nz + 1 + count] = -1
-            count = count + 1
-        count = 1
-        j = 0
-        for i in range(1, self.nz - 1):
-            a = (1 / self.dtheta ** 2) * (self.c1[i][self.ntheta - 1])
-            self.M[count][self.ntotal - 2 * self.nz + count] = a
-            b = (1 / self.dz ** 2) * (self.c2[i - 1, j])
-            self.M[count][count - 1] = b
-            c = -((1 / self.dtheta ** 2) * ((self.c1[i][j]) + self.c1[i][self.ntheta - 1])
-                  + (1 / self.dz ** 2) * (self.c2[i][j] + self.c2[i - 1][j]))
-            self.M[count, count] = c
-            d = (1 / self.dz ** 2) * (self.c2[i][j])
-            self.M[count][count + 1] = d
-            e = (1 / self.dtheta ** 2) * (self.c1[i][j])
-            self.M[count][count + self.nz] = e
-            count = count + 1
-        count = self.nz + 1
-        for j in range(1, self.ntheta - 1):
-            for i in range(1, self.nz - 1):
-                a = (1 / self.dtheta ** 2) * (self.c1[i, j - 1])
-                self.M[count][count - self.nz] = a
-                b = (1 / self.dz ** 2) * (self.c2[i - 1][j])
-                self.M[count][count - 1] = b
-                c = -((1 / self.dtheta ** 2) * ((self.c1[i][j]) + self.c1[i][j - 1])
-                      + (1 / self.dz ** 2) * (self.c2[i][j] + self.c2[i - 1][j]))
-                self.M[count, count] = c
-                d = (1 / self.dz ** 2) * (self.c2[i][j])
-                self.M[count][count + 1] = d
-                e = (1 / self.dtheta ** 2) * (self.c1[i][j])
-                self.M[count][count + self.nz] = e
-                count = count + 1
-            count = count + 2
-        count = 1
-        for j in range(self.ntheta - 1):
-            for i in range(1, self.nz - 1):
-                if j == 0:
-                    self.f[count][0] = (self.c0w[i][j] - self.c0w[i][self.ntheta - 1]) / self.dtheta
-                else:
-                    self.f[count][0] = (self.c0w[i, j] - self.c0w[i, j - 1]) / self.dtheta
-                count = count + 1
-            count = count + 2
-        # fmt: on
+        nz, ntheta, ntotal = self.nz, self.ntheta, self.ntotal
+
+        # inner nodes, numbered k = j * nz + i. The node before j = 0 in the theta
+        # direction is the node of j = ntheta - 2, since the last column of the grid
+        # repeats the first one.
+        i, j = np.meshgrid(np.arange(1, nz - 1), np.arange(ntheta - 1), indexing="ij")
+        i = i.ravel()
+        j = j.ravel()
+        k = j * nz + i
+        k_prev = np.where(j == 0, (ntheta - 2) * nz + i, k - nz)
+
+        c1 = self.c1[i, j]
+        c1_prev = self.c1[i, j - 1]
+        c2 = self.c2[i, j]
+        c2_prev = self.c2[i - 1, j]
+        a = c1_prev / self.dtheta ** 2
+        b = c2_prev / self.dz ** 2
+        c = -((c1 + c1_prev) / self.dtheta ** 2 + (c2 + c2_prev) / self.dz ** 2)
+        d = c2 / self.dz ** 2
+        e = c1 / self.dtheta ** 2
+
+        # pressure at the inlet and outlet of the grid
+        k_in = np.arange(ntheta) * nz
+        k_out = k_in + nz - 1
+        # the last column of the grid equals the first one
+        k_periodic = ntotal - nz + np.arange(1, nz - 1)
+
+        rows = np.concatenate([k_in, k_out, k_periodic, k_periodic] + [k] * 5)
+        cols = np.concatenate(
+            [k_in, k_out, k_periodic - ntotal + nz, k_periodic]
+            + [k_prev, k - 1, k, k + 1, k + nz]
+        )
+        values = np.concatenate(
+            [np.ones(2 * ntheta), np.ones(nz - 2), -np.ones(nz - 2), a, b, c, d, e,]
+        )
+        self.M = sp.sparse.csc_matrix((values, (rows, cols)), shape=(ntotal, ntotal))
+
+        self.f = np.zeros([ntotal, 1])
+        self.f[k_in, 0] = self.p_in
+        self.f[k_out, 0] = self.p_out
+        self.f[k, 0] = (self.c0w[i, j] - self.c0w[i, j - 1]) / self.dtheta
 
     def resolves_matrix(self):
         """This function resolves the linear system [M]{P} = {f}.
@@ -503,10 +592,68 @@ class FluidFlow:
         >>> my_fluid_flow.P # doctest: +ELLIPSIS
         array([[...
         """
-        sparse_matrix = sp.sparse.csc_matrix(self.M)
-        self.P = sp.sparse.linalg.spsolve(sparse_matrix, self.f)
+        if self.solver == "direct":
+            self.P = sp.sparse.linalg.spsolve(self.M, self.f)
+            self.solver_iterations = 0
+        else:
+            x0 = None
+            if self.warm_start and self.numerical_pressure_matrix_available:
+                x0 = self.P.ravel()
+            # the preconditioner of the first matrix of the grid is reused, since
+            # moving the rotor center only changes the matrix coefficients
+            reused = self._preconditioner is not None
+            if not reused:
+                self._preconditioner = self._ilu_preconditioner()
+            info = self._iterative_solve(x0)
+            if info > 0 and reused:
+                self._preconditioner = self._ilu_preconditioner()
+                info = self._iterative_solve(x0)
+            if info > 0:
+                warnings.warn(
+                    "The " + self.solver + " solver did not converge to the "
+                    "tolerance after " + str(info) + " iterations."
+                )
+            elif info < 0:
+                raise ValueError(
+                    "The " + self.solver + " solver failed. Try solver='direct'."
+                )
+        self.solver_residual = np.linalg.norm(
+            self.M @ self.P - self.f.ravel()
+        ) / np.linalg.norm(self.f)
         self.P.shape = (self.P.size, 1)
 
+    def _ilu_preconditioner(self):
+        """Return an incomplete LU preconditioner of the matrix M."""
+        ilu = sp.sparse.linalg.spilu(self.M)
+        return sp.sparse.linalg.LinearOperator(self.M.shape, ilu.solve)
+
+    def _iterative_solve(self, x0):
+        """Solve [M]{P} = {f} with the iterative solver and return its info flag."""
+        iterations = []
+        if self.solver == "gmres":
+            self.P, info = sp.sparse.linalg.gmres(
+                self.M,
+                self.f.ravel(),
+                x0=x0,
+                atol=0,
+                M=self._preconditioner,
+                callback=iterations.append,
+                callback_type="pr_norm",
+                **{_RTOL: self.solver_tolerance},
+            )
+        else:
+            self.P, info = sp.sparse.linalg.bicgstab(
+                self.M,
+                self.f.ravel(),
+                x0=x0,
+                atol=0,
+                M=self._preconditioner,
+                callback=iterations.append,
+                **{_RTOL: self.solver_tolerance},
+            )
+        self.solver_iterations = len(iterations)
+        return info
+
     def calculate_pressure_matrix_numerical(self):
         """This function calculates the pressure matrix numerically.
         Returns
@@ -1,11 +1,14 @@
 import warnings
-from math import isnan
 
 import numpy as np
 from scipy import integrate
 
 from ross.fluid_flow.fluid_flow_geometry import move_rotor_center
 
+# maximum number of times a Newton step is halved to keep the rotor center
+# inside the radial clearance
+_MAX_STEP_HALVINGS = 50
+
 
 def calculate_oil_film_force(fluid_flow_object, force_type=None):
     """This function calculates the forces of the oil film in the N and T directions, ie in the
@@ -98,38 +101,33 @@ def calculate_oil_film_force(fluid_flow_object, force_type=None):
         )
     else:
         p_mat = fluid_flow_object.p_mat_numerical
-        a = np.zeros([fluid_flow_object.nz, fluid_flow_object.ntheta])
-        b = np.zeros([fluid_flow_object.nz, fluid_flow_object.ntheta])
-        g1 = np.zeros(fluid_flow_object.nz)
-        g2 = np.zeros(fluid_flow_object.nz)
+        half = int(fluid_flow_object.ntheta / 2)
         base_vector = np.array(
             [
                 fluid_flow_object.xre[0][0] - fluid_flow_object.xi,
                 fluid_flow_object.yre[0][0] - fluid_flow_object.yi,
             ]
         )
-        for i in range(fluid_flow_object.nz):
-            for j in range(int(fluid_flow_object.ntheta / 2)):
-                vector_from_rotor = np.array(
-                    [
-                        fluid_flow_object.xre[i][j] - fluid_flow_object.xi,
-                        fluid_flow_object.yre[i][j] - fluid_flow_object.yi,
-                    ]
-                )
-                angle_between_vectors = np.arccos(
-                    np.dot(base_vector, vector_from_rotor)
-                    / (np.linalg.norm(base_vector) * np.linalg.norm(vector_from_rotor))
-                )
-                if isnan(angle_between_vectors):
-                    angle_between_vectors = 0
-                if angle_between_vectors != 0 and j * fluid_flow_object.dtheta > np.pi:
-                    angle_between_vectors += np.pi
-                a[i][j] = p_mat[i][j] * np.cos(angle_between_vectors)
-                b[i][j] = p_mat[i][j] * np.sin(angle_between_vectors)
+        vector_x = fluid_flow_object.xre[:, :half] - fluid_flow_object.xi
+        vector_y = fluid_flow_object.yre[:, :half] - fluid_flow_object.yi
+        with np.errstate(invalid="ignore"):
+            angle_between_vectors = np.arccos(
+                (base_vector[0] * vector_x + base_vector[1] * vector_y)
+                / (np.linalg.norm(base_vector) * np.hypot(vector_x, vector_y))
+            )
+        angle_between_vectors[np.isnan(angle_between_vectors)] = 0
+        beyond_pi = (angle_between_vectors != 0) & (
+            np.arange(half) * fluid_flow_object.dtheta > np.pi
+        )
+        angle_between_vectors[beyond_pi] += np.pi
+
+        a = np.zeros([fluid_flow_object.nz, fluid_flow_object.ntheta])
+        b = np.zeros([fluid_flow_object.nz, fluid_flow_object.ntheta])
+        a[:, :half] = p_mat[:, :half] * np.cos(angle_between_vectors)
+        b[:, :half] = p_mat[:, :half] * np.sin(angle_between_vectors)
 
-        for i in range(fluid_flow_object.nz):
-            g1[i] = integrate.simps(a[i][:], fluid_flow_object.gama[0])
-            g2[i] = integrate.simps(b[i][:], fluid_flow_object.gama[0])
+        g1 = integrate.simps(a, fluid_flow_object.gama[0], axis=1)
+        g2 = integrate.simps(b, fluid_flow_object.gama[0], axis=1)
 
         integral1 = integrate.simps(g1, fluid_flow_object.z_list)
         integral2 = integrate.simps(g2, fluid_flow_object.z_list)
@@ -501,3 +499,170 @@ def find_equilibrium_position(
         print(map_vector)
     if return_iteration_map:
         return map_vector
+
+
+def _equilibrium_residual(fluid_flow_object):
+    """Recalculates the pressure field at the current rotor center and returns the
+    force unbalance [force_x, force_y - load] of the oil film.
+    """
+    fluid_flow_object.calculate_coefficients()
+    fluid_flow_object.calculate_pressure_matrix_numerical()
+    r_force, t_force, force_x, force_y = calculate_oil_film_force(
+        fluid_flow_object, force_type="numerical"
+    )
+    return np.array([force_x, force_y - fluid_flow_object.load])
+
+
+def find_equilibrium_position_newton(
+    fluid_flow_object,
+    tolerance=1e-05,
+    max_iterations=20,
+    jacobian="broyden",
+    stiffness_force_type="numerical",
+    print_along=False,
+    return_iteration_map=False,
+):
+    """This function moves the rotor center to the equilibrium position using a
+    Newton or a Broyden iteration.
+    The oil film stiffness matrix is used as the jacobian of the force unbalance
+    [force_x, force_y - load], so that eccentricity and attitude angle are corrected
+    simultaneously. With jacobian='broyden' the stiffness is calculated only once
+    and then updated from the forces of each step; with jacobian='newton' it is
+    recalculated at every iteration.
+    Parameters
+    ----------
+    fluid_flow_object: A FluidFlow object.
+    tolerance: float, optional
+        Maximum force error (N) accepted in both x and y directions.
+    max_iterations: int, optional
+        Maximum number of steps of the rotor center.
+    jacobian: str, optional
+        'broyden' (default) or 'newton'.
+    stiffness_force_type: str, optional
+        force_type passed to calculate_stiffness_matrix to get the jacobian.
+        'numerical' (default) uses the perturbation stiffness, 'short' uses the
+        analytical short bearing stiffness.
+    print_along: bool, optional
+        If True, prints the iteration process.
+    return_iteration_map: bool, optional
+        If True, the function will return a map of position and errors in each
+        step of the iteration.
+    Returns
+    -------
+    None, or
+    List of lists of floats
+        A list [n, 6], being n the number of evaluated positions. Each line contains
+        the x and y of the rotor center, the eccentricity, the attitude angle and the
+        errors in force x and force y.
+    Raises
+    ------
+    ValueError
+        If the rotor center is not inside the radial clearance, or a step can not
+        be kept inside it.
+    Examples
+    --------
+    >>> from ross.fluid_flow.fluid_flow import fluid_flow_example2
+    >>> my_fluid_flow = fluid_flow_example2()
+    >>> iteration_map = find_equilibrium_position_newton(my_fluid_flow, tolerance=0.1,
+    ...                                                  return_iteration_map=True)
+    >>> len(iteration_map) < 10
+    True
+    """
+    if jacobian not in ["broyden", "newton"]:
+        raise ValueError("jacobian should be either 'broyden' or 'newton'.")
+    if (
+        np.hypot(fluid_flow_object.xi, fluid_flow_object.yi)
+        >= fluid_flow_object.radial_clearance
+    ):
+        raise ValueError("The rotor center should be inside the radial clearance.")
+
+    # the numerical stiffness perturbs the rotor center, which leaves the pressure
+    # field of a perturbed position in the fluid flow object
+    perturbs_pressure = stiffness_force_type != "short"
+
+    residual = _equilibrium_residual(fluid_flow_object)
+    stiffness = np.reshape(
+        calculate_stiffness_matrix(fluid_flow_object, force_type=stiffness_force_type),
+        (2, 2),
+    )
+    stale_pressure = perturbs_pressure
+    map_vector = [
+        [
+            fluid_flow_object.xi,
+            fluid_flow_object.yi,
+            fluid_flow_object.eccentricity,
+            fluid_flow_object.attitude_angle,
+            residual[0],
+            residual[1],
+        ]
+    ]
+    k = 0
+    while np.max(np.abs(residual)) > tolerance and k < max_iterations:
+        k += 1
+        # the stiffness is the negative derivative of the force, K @ step = residual
+        step = np.linalg.solve(stiffness, residual)
+        halvings = 0
+        while (
+            np.hypot(fluid_flow_object.xi + step[0], fluid_flow_object.yi + step[1])
+            >= fluid_flow_object.radial_clearance
+        ):
+            if halvings == _MAX_STEP_HALVINGS:
+                raise ValueError(
+                    "The step of the rotor center could not be kept inside the "
+                    "radial clearance."
+                )
+            step = step / 2
+            halvings += 1
+        move_rotor_center(fluid_flow_object, step[0], step[1])
+        new_residual = _equilibrium_residual(fluid_flow_object)
+        stale_pressure = False
+
+        if jacobian == "newton":
+            stiffness = np.reshape(
+                calculate_stiffness_matrix(
+                    fluid_flow_object, force_type=stiffness_force_type
+                ),
+                (2, 2),
+            )
+            stale_pressure = perturbs_pressure
+        else:
+            stiffness = stiffness - np.outer(
+                new_residual - residual + stiffness @ step, step
+            ) / (step @ step)
+        residual = new_residual
+
+        map_vector.append(
+            [
+                fluid_flow_object.xi,
+                fluid_flow_object.yi,
+                fluid_flow_object.eccentricity,
+                fluid_flow_object.attitude_angle,
+                residual[0],
+                residual[1],
+            ]
+        )
+        if print_along:
+            print("Iteration " + str(k))
+            print("Error x: " + str(residual[0]))
+            print("Error y: " + str(residual[1]))
+            print(
+                "Current x, y: ("
+                + str(fluid_flow_object.xi)
+                + ", "
+                + str(fluid_flow_object.yi)
+                + ")\n"
+            )
+
+    if np.max(np.abs(residual)) > tolerance:
+        warnings.warn(
+            "Equilibrium position did not converge after "
+            + str(max_iterations)
+            + " iterations."
+        )
+    elif stale_pressure:
+        # pressure field and coefficients must match the final position
+        fluid_flow_object.calculate_coefficients()
+        fluid_flow_object.calculate_pressure_matrix_numerical()
+
+    if return_iteration_map:
+        return map_vector
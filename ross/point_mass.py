@@ -129,14 +129,19 @@ class PointMass(Element):
         >>> point_mass.save()
         """
         data = self.get_data(Path(file_name) / "PointMass.toml")
-        data["PointMass"][str(self.n)] = {
+        data["PointMass"].update(self._save_data()["PointMass"])
+        self.dump_data(data, Path(file_name) / "PointMass.toml")
+
+    def _save_data(self):
+        """Return the element entry of the PointMass table."""
+        entry = {
             "n": self.n,
             "m": self.m,
             "mx": self.mx,
             "my": self.my,
             "tag": self.tag,
         }
-        self.dump_data(data, Path(file_name) / "PointMass.toml")
+        return {"PointMass": {str(self.n): entry}}
 
     @staticmethod
     def load(file_name=os.getcwd()):
@@ -0,0 +1,553 @@
+"""Batch report module.
+
+This module runs the API report for a directory of rotors saved with
+Rotor.save(), without a notebook. Each report runs in its own worker process,
+which is stopped if it exceeds the timeout, and the figures, summary tables and
+the time spent in each analysis stage are written to an output directory.
+
+The batch can be run from the command line with:
+
+    $ python -m ross.report_batch rotors parameters.toml -o reports
+
+or with the ross-report command installed with the package.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from multiprocessing.connection import wait
+from pathlib import Path
+
+import pandas as pd
+import toml
+
+from ross.api_report import Report
+from ross.bearing_seal_element import BearingElement
+from ross.cache import enable_cache
+
+__all__ = ["load_report_parameters", "run_report_batch"]
+
+# modes analyzed by Report.run() for each bearing clearance case
+_REPORT_MODES = [0, 2]
+
+
+def load_report_parameters(path):
+    """Load the report parameters from a toml or json file.
+
+    The file has a "report" table with the Report arguments (speed_range,
+    tripspeed, bearing_stiffness_range, machine_type and speed_units), a
+    "stability" table with the Report.run() arguments (D, H, HP, oper_speed,
+    RHO_ratio, RHOs, RHOd and unit) and, optionally, a "clearance" array of
+    tables with the bearings of each clearance case. Each bearing is given by
+    the BearingElement arguments. If the clearance cases are not given, the
+    rotor bearings are used.
+
+    Parameters
+    ----------
+    path : str, pathlib.Path
+        Parameters file. Files with the .json suffix are read as json, other
+        files as toml.
+
+    Returns
+    -------
+    parameters : dict
+        Dictionary with the "report", "stability" and "clearance" parameters.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> file = Path(tempfile.mkdtemp()) / "parameters.toml"
+    >>> _ = file.write_text('''
+    ... [report]
+    ... speed_range = [400, 1000]
+    ... tripspeed = 1200
+    ... speed_units = "rad/s"
+    ...
+    ... [stability]
+    ... D = [0.35, 0.35]
+    ... H = [0.08, 0.08]
+    ... HP = [10000, 10000]
+    ... oper_speed = 1000.0
+    ... RHO_ratio = [1.11, 1.14]
+    ... RHOs = 37.65
+    ... RHOd = 30.45
+    ...
+    ... [[clearance]]
+    ... bearings = [{n = 0, kxx = 1e7, cxx = 2e3}, {n = 6, kxx = 1e7, cxx = 2e3}]
+    ... ''')
+    >>> parameters = load_report_parameters(file)
+    >>> parameters["report"]["tripspeed"]
+    1200
+    >>> len(parameters["clearance"][0]["bearings"])
+    2
+    """
+    path = Path(path)
+    with open(path, "r") as f:
+        if path.suffix == ".json":
+            parameters = json.load(f)
+        else:
+            parameters = toml.load(f)
+
+    for table in ["report", "stability"]:
+        if table not in parameters:
+            raise ValueError(f"The parameters file has no '{table}' table.")
+
+    parameters.setdefault("clearance", [])
+
+    return parameters
+
+
+def _write_figure(fig, path, figure_formats, include_plotlyjs):
+    """Write a figure in the given formats.
+
+    Parameters
+    ----------
+    fig : plotly.graph_objects.Figure
+        Figure to be written.
+    path : pathlib.Path
+        Figure file path, without suffix.
+    figure_formats : list
+        Formats to be written. Options are "html" and "json".
+    include_plotlyjs : str
+        How plotly.js is included in the html files. See
+        plotly.io.write_html().
+    """
+    if "html" in figure_formats:
+        fig.write_html(
+            str(path.with_suffix(".html")), include_plotlyjs=include_plotlyjs
+        )
+    if "json" in figure_formats:
+        fig.write_json(str(path.with_suffix(".json")))
+
+
+def _write_report(results, df_ucs, output_path, figure_formats, include_plotlyjs):
+    """Write the Report.run() figures and tables.
+
+    Parameters
+    ----------
+    results : tuple
+        Results returned by Report.run().
+    df_ucs : list
+        Critical speeds at the bearing stiffness of each clearance case.
+    output_path : pathlib.Path
+        Directory where the figures and tables are written.
+    figure_formats : list
+        Formats of the figures. Options are "html" and "json".
+    include_plotlyjs : str
+        How plotly.js is included in the html files.
+    """
+    (
+        fig_ucs,
+        fig_mode_shape,
+        fig_unbalance,
+        df_unbalance,
+        fig_a_lvl1,
+        fig_b_lvl1,
+        df_lvl2,
+        summaries,
+    ) = results
+
+    figures_path = output_path / "figures"
+    tables_path = output_path / "tables"
+    figures_path.mkdir(parents=True, exist_ok=True)
+    tables_path.mkdir(parents=True, exist_ok=True)
+
+    figures = {}
+    n_modes = len(_REPORT_MODES)
+    for case, fig in enumerate(fig_ucs):
+        figures[f"ucs_case{case}"] = fig
+        for i, mode in enumerate(_REPORT_MODES):
+            figures[f"mode_shape_case{case}_mode{mode}"] = fig_mode_shape[
+                case * n_modes + i
+            ]
+            figures[f"unbalance_response_case{case}_mode{mode}"] = fig_unbalance[
+                case * n_modes + i
+            ]
+        figures[f"stability_level_1_cross_coupling_case{case}"] = fig_a_lvl1[case]
+        figures[f"stability_level_1_csr_case{case}"] = fig_b_lvl1[case]
+
+    if figure_formats:
+        for name, fig in figures.items():
+            _write_figure(fig, figures_path / name, figure_formats, include_plotlyjs)
+
+    df_unbalance.to_csv(tables_path / "unbalance_response.csv", index=False)
+    df_ucs = pd.concat(df_ucs, keys=range(len(df_ucs)), names=["case", None])
+    df_ucs.reset_index(level=0).to_csv(
+        tables_path / "ucs_critical_speeds.csv", index=False
+    )
+    df_lvl2.to_csv(tables_path / "stability_level_2.csv", index=False)
+    for level in [0, 1]:
+        df_summary = pd.concat(
+            [summary[level] for summary in summaries],
+            keys=range(len(summaries)),
+            names=["case", None],
+        ).reset_index(level=0)
+        df_summary.to_csv(tables_path / f"summary_level_{level + 1}.csv", index=False)
+
+
+def _write_timing(timing, output_path):
+    """Write the timing summary of a report as json."""
+    output_path.mkdir(parents=True, exist_ok=True)
+    with open(output_path / "timing.json", "w") as f:
+        json.dump(timing, f, indent=2)
+
+
+def _report_job(
+    rotor_path, output_path, parameters, figure_formats, include_plotlyjs, cache_path
+):
+    """Run and write the report of a saved rotor.
+
+    This function is module level so that it can be run in worker processes.
+    Errors are recorded in the timing summary written to the output directory.
+
+    Parameters
+    ----------
+    rotor_path : pathlib.Path
+        Rotor folder created with Rotor.save().
+    output_path : pathlib.Path
+        Directory where the report is written.
+    parameters : dict
+        Report parameters. See load_report_parameters().
+    figure_formats : list
+        Formats of the figures. Options are "html" and "json".
+    include_plotlyjs : str
+        How plotly.js is included in the html files.
+    cache_path : pathlib.Path
+        Results cache directory, or None if the cache is not used.
+    """
+    timing = dict(rotor=rotor_path.name, status="ok", message="", stages={})
+    stages = timing["stages"]
+    start_job = time.perf_counter()
+
+    try:
+        if cache_path is not None:
+            enable_cache(cache_path)
+
+        start = time.perf_counter()
+        bearing_clearance_lists = [
+            [BearingElement(**bearing) for bearing in case["bearings"]]
+            for case in parameters["clearance"]
+        ]
+        report = Report.from_saved_rotors(
+            rotor_path,
+            bearing_clearance_lists=bearing_clearance_lists or None,
+            tag=rotor_path.name,
+            **parameters["report"],
+        )
+        if not bearing_clearance_lists:
+            report.bearing_clearance_lists = [report.rotor.bearing_elements]
+        stages["load"] = time.perf_counter() - start
+
+        results = report.run(**parameters["stability"])
+
+        # analysis stages added over the clearance cases
+        for case_timing in report.timing:
+            for stage, seconds in case_timing.items():
+                stages[stage] = stages.get(stage, 0.0) + seconds
+        timing["clearance_cases"] = report.timing
+
+        start = time.perf_counter()
+        _write_report(
+            results, report.df_ucs, output_path, figure_formats, include_plotlyjs
+        )
+        stages["write"] = time.perf_counter() - start
+    except Exception as exc:
+        timing["status"] = "error"
+        timing["message"] = f"{type(exc).__name__}: {exc}"
+        output_path.mkdir(parents=True, exist_ok=True)
+        (output_path / "error.log").write_text(traceback.format_exc())
+
+    timing["total"] = time.perf_counter() - start_job
+    _write_timing(timing, output_path)
+
+
+def _saved_rotors(path):
+    """Return the rotor folders saved with Rotor.save() in a directory."""
+    return sorted(p for p in Path(path).iterdir() if (p / "properties.toml").is_file())
+
+
+def run_report_batch(
+    rotors_path,
+    parameters,
+    output_path,
+    n_jobs=None,
+    timeout=None,
+    figure_formats=("html", "json"),
+    include_plotlyjs="cdn",
+    cache_path=None,
+    verbose=False,
+):
+    """Run the API report for a directory of saved rotors.
+
+    Each rotor folder created with Rotor.save() in rotors_path is analyzed with
+    Report.run() in a worker process. The results of each rotor are written
+    to a folder with the rotor name in output_path, with:
+
+    - figures: the report figures as static html and/or plotly json files;
+    - tables: csv files with the unbalance response, the critical speeds at
+      the bearing stiffness, stability level 2 and the stability summaries of
+      each clearance case;
+    - timing.json: the time spent in each analysis stage, in seconds.
+
+    A timing.json file with the timing summaries of all rotors and a
+    summary.csv table with the status and stage times of each rotor are
+    written to output_path.
+
+    Parameters
+    ----------
+    rotors_path : str, pathlib.Path
+        Directory with the rotor folders created with Rotor.save().
+    parameters : dict, str, pathlib.Path
+        Report parameters, or the file they are loaded from.
+        See load_report_parameters().
+    output_path : str, pathlib.Path
+        Directory where the reports are written. It is created if needed.
+    n_jobs : int, optional
+        Number of reports run at the same time. If None, the number of
+        processors is used. Default is None.
+    timeout : float, optional
+        Maximum time for each report, in seconds. The worker process of a
+        report that exceeds the timeout is stopped and its status is set to
+        "timeout". Default is None, without a time limit.
+    figure_formats : list, optional
+        Formats of the figures. Options are "html" and "json". If empty, the
+        figures are not written. Default is ("html", "json").
+    include_plotlyjs : str, optional
+        How plotly.js is included in the html files: "cdn" loads it from the
+        internet, "directory" writes a plotly.min.js file next to the figures
+        and "inline" embeds it in each file. Default is "cdn".
+    cache_path : str, pathlib.Path, optional
+        Directory of the results cache shared by the reports. If None, the
+        cache is not used. Default is None.
+    verbose : bool, optional
+        If True, the status of each report is printed when it finishes.
+        Default is False.
+
+    Returns
+    -------
+    summary : pd.DataFrame
+        Dataframe with the status, the error message, the total time and the
+        time of each analysis stage for each rotor.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> import ross as rs
+    >>> rotors_path = Path(tempfile.mkdtemp())
+    >>> rs.rotor_example().save("rotor_example", rotors_path)
+    >>> parameters = {
+    ...     "report": {"speed_range": [400, 1000], "tripspeed": 1200},
+    ...     "stability": {
+    ...         "D": [0.35, 0.35],
+    ...         "H": [0.08, 0.08],
+    ...         "HP": [10000, 10000],
+    ...         "oper_speed": 1000.0,
+    ...         "RHO_ratio": [1.11, 1.14],
+    ...         "RHOs": 37.65,
+    ...         "RHOd": 30.45,
+    ...     },
+    ...     "clearance": [
+    ...         {
+    ...             "bearings": [
+    ...                 {"n": 0, "kxx": 1e7, "cxx": 2e3},
+    ...                 {"n": 6, "kxx": 1e7, "cxx": 2e3},
+    ...             ]
+    ...         }
+    ...     ],
+    ... }
+    >>> output_path = Path(tempfile.mkdtemp())
+    >>> summary = run_report_batch(
+    ...     rotors_path, parameters, output_path, timeout=600, figure_formats=()
+    ... )
+    >>> summary[["rotor", "status"]].values.tolist()
+    [['rotor_example', 'ok']]
+    """
+    if not isinstance(parameters, dict):
+        parameters = load_report_parameters(parameters)
+    parameters = dict(parameters)
+    parameters.setdefault("clearance", [])
+
+    for figure_format in figure_formats:
+        if figure_format not in ["html", "json"]:
+            raise ValueError(
+                f"Figure format '{figure_format}' is not supported. "
+                f"Options are 'html' and 'json'."
+            )
+
+    rotors = _saved_rotors(rotors_path)
+    output_path = Path(output_path)
+    output_path.mkdir(parents=True, exist_ok=True)
+    cache_path = None if cache_path is None else Path(cache_path)
+
+    n_workers = max(1, min(n_jobs or os.cpu_count(), len(rotors)))
+    pending = list(rotors)
+    running = {}
+    timings = {}
+
+    # each report has its own process, so that it can be stopped at the timeout
+    while pending or running:
+        while pending and len(running) < n_workers:
+            rotor_path = pending.pop(0)
+            process = multiprocessing.Process(
+                target=_report_job,
+                args=(
+                    rotor_path,
+                    output_path / rotor_path.name,
+                    parameters,
+                    list(figure_formats),
+                    include_plotlyjs,
+                    cache_path,
+                ),
+            )
+            process.start()
+            running[rotor_path] = (process, time.perf_counter())
+
+        wait([process.sentinel for process, _ in running.values()], timeout=0.1)
+
+        for rotor_path, (process, start) in list(running.items()):
+            elapsed = time.perf_counter() - start
+            rotor_output_path = output_path / rotor_path.name
+            if process.is_alive():
+                if timeout is None or elapsed < timeout:
+                    continue
+                process.terminate()
+                process.join()
+                timing = dict(
+                    rotor=rotor_path.name,
+                    status="timeout",
+                    message=f"Report exceeded the timeout of {timeout} s.",
+                    stages={},
+                    total=elapsed,
+                )
+                _write_timing(timing, rotor_output_path)
+            else:
+                process.join()
+                try:
+                    with open(rotor_output_path / "timing.json", "r") as f:
+                        timing = json.load(f)
+                except (OSError, ValueError):
+                    timing = dict(
+                        rotor=rotor_path.name,
+                        status="error",
+                        message=f"Worker exited with code {process.exitcode}.",
+                        stages={},
+                        total=elapsed,
+                    )
+                    _write_timing(timing, rotor_output_path)
+
+            del running[rotor_path]
+            timings[rotor_path] = timing
+            if verbose:
+                print(
+                    f"{timing['rotor']}: {timing['status']} "
+                    f"({timing['total']:.1f} s) {timing['message']}".rstrip()
+                )
+
+    timings = [timings[rotor_path] for rotor_path in rotors]
+    with open(output_path / "timing.json", "w") as f:
+        json.dump(timings, f, indent=2)
+
+    summary = pd.DataFrame(
+        [
+            dict(
+                rotor=timing["rotor"],
+                status=timing["status"],
+                message=timing["message"],
+                total=timing["total"],
+                **timing["stages"],
+            )
+            for timing in timings
+        ]
+    ).reindex(columns=_summary_columns(timings))
+    summary.to_csv(output_path / "summary.csv", index=False)
+
+    return summary
+
+
+def _summary_columns(timings):
+    """Return the summary columns, with the stages in order of appearance."""
+    columns = ["rotor", "status", "message", "total"]
+    for timing in timings:
+        for stage in timing["stages"]:
+            if stage not in columns:
+                columns.append(stage)
+    return columns
+
+
+def main(argv=None):
+    """Run the batch report from the command line.
+
+    Parameters
+    ----------
+    argv : list, optional
+        Command line arguments. Default is sys.argv[1:].
+
+    Returns
+    -------
+    exit_code : int
+        0 if all the reports succeeded, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        prog="ross-report",
+        description="Run the API report for a directory of saved rotors.",
+    )
+    parser.add_argument(
+        "rotors", help="directory with the rotor folders created with Rotor.save()"
+    )
+    parser.add_argument("parameters", help="report parameters file (toml or json)")
+    parser.add_argument(
+        "-o", "--output", default="reports", help="output directory (default: reports)"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of reports run at the same time (default: number of processors)",
+    )
+    parser.add_argument(
+        "-t",
+        "--timeout",
+        type=float,
+        default=None,
+        help="maximum time for each report in seconds (default: no limit)",
+    )
+    parser.add_argument(
+        "--figures",
+        nargs="*",
+        choices=["html", "json"],
+        default=["html", "json"],
+        help="figure formats; with no format the figures are not written "
+        "(default: html json)",
+    )
+    parser.add_argument(
+        "--include-plotlyjs",
+        choices=["cdn", "directory", "inline"],
+        default="cdn",
+        help="how plotly.js is included in the html figures (default: cdn)",
+    )
+    parser.add_argument(
+        "--cache", default=None, help="results cache directory (default: no cache)"
+    )
+    args = parser.parse_args(argv)
+
+    summary = run_report_batch(
+        args.rotors,
+        args.parameters,
+        args.output,
+        n_jobs=args.jobs,
+        timeout=args.timeout,
+        figure_formats=args.figures,
+        include_plotlyjs=args.include_plotlyjs,
+        cache_path=args.cache,
+        verbose=True,
+    )
+
+    return int((summary["status"] != "ok").any())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,11 +18,13 @@ import scipy.linalg as la
 import scipy.signal as signal
 import scipy.sparse.linalg as las
 import toml
+from scipy.optimize import brentq
 
 from ross.bearing_seal_element import (BallBearingElement, BearingElement,
                                        BearingElement6DoF,
                                        MagneticBearingElement,
                                        RollerBearingElement, SealElement)
+from ross.cache import cached_arrays
 from ross.disk_element import DiskElement, DiskElement6DoF
 from ross.materials import steel
 from ross.results import (CampbellResults, ConvergenceResults,
@@ -132,7 +134,8 @@ class Rotor(object):
             "rated_w": rated_w,
         }
         if tag is None:
-            self.tag = "Rotor 0"
+            tag = "Rotor 0"
+        self.tag = tag
 
         ####################################################
         # Config attributes
@@ -557,6 +560,26 @@ class Rotor(object):
         else:
             return False
 
+    def _content(self):
+        """Return the rotor content that defines the analyses results.
+
+        It is used by ross.cache.content_hash() to identify the rotor.
+
+        Returns
+        -------
+        content : dict
+            Dictionary with the rotor elements and parameters.
+        """
+        return dict(
+            shaft_elements=self.shaft_elements,
+            disk_elements=self.disk_elements,
+            bearing_elements=self.bearing_elements,
+            point_mass_elements=self.point_mass_elements,
+            sparse=self.sparse,
+            n_eigen=self.n_eigen,
+            number_dof=self.number_dof,
+        )
+
     def run_modal(self, speed):
         """Run modal analysis.
 
@@ -590,7 +613,13 @@ class Rotor(object):
         array([91.79655318, 96.28899977])
         >>> fig = modal.plot_mode3D(0)
         """
-        evalues, evectors = self._eigen(speed)
+        arrays = cached_arrays(
+            lambda: dict(zip(["evalues", "evectors"], self._eigen(speed))),
+            "run_modal",
+            self,
+            speed,
+        )
+        evalues, evectors = arrays["evalues"], arrays["evectors"]
         wn_len = len(evalues) // 2
         wn = (np.absolute(evalues))[:wn_len]
         wd = (np.imag(evalues))[:wn_len]
@@ -877,17 +906,70 @@ class Rotor(object):
         if frequency is None:
             frequency = speed
 
-        Z = np.zeros((self.ndof, self.ndof))
-        I = np.eye(self.ndof)
+        return self._state_matrix(
+            self.M(), self.K(frequency), self.C(frequency), self.G(), speed
+        )
+
+    @staticmethod
+    def _state_matrix(M, K, C, G, speed):
+        """State space matrix from the rotor global matrices.
+
+        Parameters
+        ----------
+        M, K, C, G : np.ndarray
+            Mass, stiffness, damping and gyroscopic matrices.
+        speed : float
+            Rotor speed.
+
+        Returns
+        -------
+        A : np.ndarray
+            State space matrix.
+        """
+        ndof = len(M)
+        Z = np.zeros((ndof, ndof))
+        I = np.eye(ndof)
 
         # fmt: off
         A = np.vstack(
             [np.hstack([Z, I]),
-             np.hstack([la.solve(-self.M(), self.K(frequency)), la.solve(-self.M(), (self.C(frequency) + self.G() * speed))])])
+             np.hstack([la.solve(-M, K), la.solve(-M, (C + G * speed))])])
         # fmt: on
 
         return A
 
+    @staticmethod
+    def _eigs(A, n_eigen=None, v0=None):
+        """Calculate unsorted eigenvalues and eigenvectors of a state space matrix.
+
+        Parameters
+        ----------
+        A : np.ndarray
+            State space matrix.
+        n_eigen : int, optional
+            If given, only the n_eigen eigenvalues closest to zero are calculated
+            with arpack. The dense solver is used if arpack fails.
+            Default is None (all the eigenvalues).
+        v0 : array, optional
+            Starting vector for arpack. Default is None.
+
+        Returns
+        -------
+        evalues: array
+            An array with the eigenvalues
+        evectors array
+            An array with the eigenvectors
+        """
+        if n_eigen is not None:
+            try:
+                return las.eigs(
+                    A, k=n_eigen, sigma=0, ncv=2 * n_eigen, which="LM", v0=v0
+                )
+            except las.ArpackError:
+                pass
+
+        return la.eig(A)
+
     @staticmethod
     def _index(eigenvalues):
         """Generate indexes to sort eigenvalues and eigenvectors.
@@ -969,22 +1051,12 @@ class Rotor(object):
             A = self.A(speed=speed, frequency=frequency)
 
         if self.sparse is True:
-            try:
-                evalues, evectors = las.eigs(
-                    A,
-                    k=self.n_eigen,
-                    sigma=0,
-                    ncv=2 * self.n_eigen,
-                    which="LM",
-                    v0=self._v0,
-                )
-                # store v0 as a linear combination of the previously
-                # calculated eigenvectors to use in the next call to eigs
-                self._v0 = np.real(sum(evectors.T))
-            except las.ArpackError:
-                evalues, evectors = la.eig(A)
+            evalues, evectors = self._eigs(A, self.n_eigen, v0=self._v0)
+            # store v0 as a linear combination of the previously
+            # calculated eigenvectors to use in the next call to eigs
+            self._v0 = np.real(sum(evectors.T))
         else:
-            evalues, evectors = la.eig(A)
+            evalues, evectors = self._eigs(A)
 
         if sorted_ is False:
             return evalues, evectors
@@ -1142,11 +1214,18 @@ class Rotor(object):
             modal = self.run_modal(0)
             speed_range = np.linspace(0, max(modal.evalues.imag) * 1.5, 1000)
 
-        freq_resp = np.empty((self.ndof, self.ndof, len(speed_range)), dtype=np.complex)
+        def compute():
+            freq_resp = np.empty(
+                (self.ndof, self.ndof, len(speed_range)), dtype=np.complex
+            )
+            for i, speed in enumerate(speed_range):
+                H = self.transfer_matrix(speed=speed, modes=modes)
+                freq_resp[..., i] = H
+            return {"freq_resp": freq_resp}
 
-        for i, speed in enumerate(speed_range):
-            H = self.transfer_matrix(speed=speed, modes=modes)
-            freq_resp[..., i] = H
+        freq_resp = cached_arrays(
+            compute, "run_freq_response", self, speed_range, modes
+        )["freq_resp"]
 
         results = FrequencyResponseResults(
             freq_resp=freq_resp,
@@ -1157,7 +1236,7 @@ class Rotor(object):
 
         return results
 
-    def forced_response(self, force=None, speed_range=None, modes=None):
+    def forced_response(self, force=None, speed_range=None, modes=None, freq_resp=None):
         """Unbalanced response for a mdof system.
 
         This method returns the unbalanced response for a mdof system
@@ -1173,6 +1252,9 @@ class Rotor(object):
         modes : list, optional
             Modes that will be used to calculate the frequency response
             (all modes will be used if a list is not given).
+        freq_resp : FrequencyResponseResults, optional
+            Frequency response previously calculated for speed_range. If given,
+            it is reused instead of calling run_freq_response().
 
         Returns
         -------
@@ -1194,7 +1276,8 @@ class Rotor(object):
         >>> resp.magnitude # doctest: +ELLIPSIS
         array([[0.00000000e+00, 5.06073311e-04, 2.10044826e-03, ...
         """
-        freq_resp = self.run_freq_response(speed_range=speed_range, modes=modes)
+        if freq_resp is None:
+            freq_resp = self.run_freq_response(speed_range=speed_range, modes=modes)
 
         forced_resp = np.zeros(
             (self.ndof, len(freq_resp.speed_range)), dtype=np.complex
@@ -1557,7 +1640,7 @@ class Rotor(object):
 
         return results
 
-    def plot_ucs(self, stiffness_range=None, num=20, **kwargs):
+    def plot_ucs(self, stiffness_range=None, num=20, critical_speeds=False, **kwargs):
         """Plot undamped critical speed map.
 
         This method will plot the undamped critical speed map for a given range
@@ -1571,6 +1654,11 @@ class Rotor(object):
         num : int
             Number of steps in the range.
             Default is 20.
+        critical_speeds : bool, optional
+            If True, the critical speeds at the bearing stiffness, calculated
+            with ucs_critical_speeds(), are marked on the map. Finding them
+            takes a modal analysis for each bracketing and refinement step.
+            Default is False.
         kwargs : optional
             Additional key word arguments can be passed to change the plot layout only
             (e.g. width=1000, height=800, ...).
@@ -1670,6 +1758,22 @@ class Rotor(object):
                     showlegend=False,
                 )
             )
+        # critical speeds at the bearing stiffness
+        if critical_speeds:
+            df_critical = self.ucs_critical_speeds()
+            fig.add_trace(
+                go.Scatter(
+                    x=df_critical["stiffness"],
+                    y=df_critical["critical_speed"],
+                    mode="markers",
+                    marker=dict(size=12, symbol="x", color="black"),
+                    name="Critical Speeds",
+                    hovertemplate=(
+                        "Stiffness: %{x:.2e}<br>" + "Critical Speed: %{y:.2f}"
+                    ),
+                )
+            )
+
         fig.update_xaxes(
             title_text="<b>Bearing Stiffness</b>",
             title_font=dict(size=16),
@@ -1710,6 +1814,127 @@ class Rotor(object):
 
         return fig
 
+    def ucs_critical_speeds(self, num=10):
+        """Calculate the critical speeds at the bearing stiffness.
+
+        The critical speeds are the intersections of the undamped critical
+        speed map curves wn(k) with the stiffness of the first bearing
+        k(w), given by the kxx and kyy interpolated coefficients. They are
+        found with Brent's method applied to wn(k(w)) - w, so they do not depend
+        on the number of points used to plot the map.
+
+        Parameters
+        ----------
+        num : int, optional
+            Number of frequencies, along the bearing coefficients frequency
+            range, used to bracket the intersections. A curve that crosses the
+            bearing coefficient twice between two of these frequencies has no
+            sign change there and is missed, so num should be increased for
+            coefficients that vary quickly with the frequency. Default is 10.
+
+        Returns
+        -------
+        df : pd.DataFrame
+            Dataframe with the map curve (mode), the bearing coefficient
+            ("kxx" or "kyy"), the bearing stiffness and the critical speed of
+            each intersection. If a curve does not intersect the bearing
+            coefficient within its frequency range, where the coefficient is
+            positive, the stiffness and critical speed are NaN.
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> df = rotor.ucs_critical_speeds()
+        >>> df[df["coefficient"] == "kxx"]["critical_speed"].round(2).tolist()
+        [96.29, 296.5, 765.0, 1103.63]
+        """
+        bearings_elements = []  # exclude the seals
+        for bearing in self.bearing_elements:
+            if type(bearing) == BearingElement:
+                bearings_elements.append(bearing)
+
+        bearing0 = bearings_elements[0]
+        n_modes = int(self.number_dof)
+        modes_step = int(self.number_dof / 2)
+        ucs_wn = {}
+
+        def wn(k):
+            # natural frequencies with all the bearings stiffness equal to k
+            if k not in ucs_wn:
+                bearings = [
+                    BearingElement(b.n, kxx=k, cxx=0) for b in bearings_elements
+                ]
+                rotor = self.__class__(
+                    self.shaft_elements, self.disk_elements, bearings, n_eigen=16
+                )
+                modal = rotor.run_modal(speed=0)
+                ucs_wn[k] = modal.wn[: int(self.number_dof * 2) : modes_step]
+            return ucs_wn[k]
+
+        def compute():
+            rows = []
+            for i, name in enumerate(["kxx", "kyy"]):
+                coefficient = getattr(bearing0, name)
+
+                if len(coefficient.coefficient) == 1:
+                    k = float(coefficient.coefficient[0])
+                    for j, w in enumerate(wn(k)):
+                        rows.append([j, i, k, w])
+                    continue
+
+                def stiffness(w):
+                    return float(coefficient.interpolated(w))
+
+                freq = np.linspace(
+                    min(coefficient.frequency), max(coefficient.frequency), num
+                )
+                k = np.array([stiffness(w) for w in freq])
+
+                # the interpolated coefficient may not be positive in the
+                # whole frequency range
+                valid = k > 0
+                f = np.full((num, n_modes), np.nan)
+                f[valid] = [wn(k_i) for k_i in k[valid]]
+                f -= freq[:, np.newaxis]
+                valid = valid[:-1] & valid[1:]
+
+                for j in range(n_modes):
+                    idx = np.flatnonzero(
+                        valid & (np.sign(f[:-1, j]) != np.sign(f[1:, j]))
+                    )
+                    if len(idx) == 0:
+                        rows.append([j, i, np.nan, np.nan])
+                    for m in idx:
+                        w = brentq(
+                            lambda w: wn(stiffness(w))[j] - w,
+                            freq[m],
+                            freq[m + 1],
+                            xtol=1e-10 * freq[-1],
+                        )
+                        rows.append([j, i, stiffness(w), w])
+
+            return {"rows": np.array(rows, dtype=float)}
+
+        # the intersections are not calculated again if they are cached
+        rows = cached_arrays(
+            compute,
+            "ucs_critical_speeds",
+            self.__class__.__name__,
+            self.shaft_elements,
+            self.disk_elements,
+            bearings_elements,
+            num,
+        )["rows"]
+
+        return pd.DataFrame(
+            dict(
+                mode=rows[:, 0].astype(int),
+                coefficient=np.array(["kxx", "kyy"])[rows[:, 1].astype(int)],
+                stiffness=rows[:, 2],
+                critical_speed=rows[:, 3],
+            )
+        )
+
     def plot_level1(self, n=5, stiffness_range=None, num=5, **kwargs):
         """Plot level 1 stability analysis.
 
@@ -1957,8 +2182,16 @@ class Rotor(object):
 
         elements_folder = rotor_folder / "elements"
 
+        # the tables are built in memory and written once, instead of reading
+        # and rewriting the file of each element class for every element
+        tables = {}
         for element in self.elements:
-            element.save(elements_folder)
+            for table, entries in element._save_data().items():
+                tables.setdefault(table, {}).update(entries)
+
+        for table, entries in tables.items():
+            with open(elements_folder / f"{table}.toml", "w") as f:
+                toml.dump({table: entries}, f)
 
     @staticmethod
     def load(file_path):
@@ -2704,7 +2937,8 @@ class CoAxialRotor(Rotor):
             "rated_w": rated_w,
         }
         if tag is None:
-            self.tag = "Rotor 0"
+            tag = "Rotor 0"
+        self.tag = tag
 
         ####################################################
         # Config attributes
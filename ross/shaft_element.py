@@ -397,7 +397,12 @@ class ShaftElement(Element):
         >>> shaft1.save()
         """
         data = self.get_data(Path(file_name) / "ShaftElement.toml")
-        data["ShaftElement"][str(self.n)] = {
+        data["ShaftElement"].update(self._save_data()["ShaftElement"])
+        self.dump_data(data, Path(file_name) / "ShaftElement.toml")
+
+    def _save_data(self):
+        """Return the element entry of the ShaftElement table."""
+        entry = {
             "L": self.L,
             "idl": self.idl,
             "odl": self.odl,
@@ -412,7 +417,7 @@ class ShaftElement(Element):
             "gyroscopic": self.gyroscopic,
             "shear_method_calc": self.shear_method_calc,
         }
-        self.dump_data(data, Path(file_name) / "ShaftElement.toml")
+        return {"ShaftElement": {str(self.n): entry}}
 
     @staticmethod
     def load(file_name="ShaftElement"):
@@ -1505,7 +1510,12 @@ class ShaftElement6DoF(ShaftElement):
         >>> shaft1.save()
         """
         data = self.get_data(Path(file_name) / "ShaftElement6DoF.toml")
-        data["ShaftElement6DoF"][str(self.n)] = {
+        data["ShaftElement6DoF"].update(self._save_data()["ShaftElement6DoF"])
+        self.dump_data(data, Path(file_name) / "ShaftElement6DoF.toml")
+
+    def _save_data(self):
+        """Return the element entry of the ShaftElement6DoF table."""
+        entry = {
             "L": self.L,
             "idl": self.idl,
             "odl": self.odl,
@@ -1521,7 +1531,7 @@ class ShaftElement6DoF(ShaftElement):
             "rotary_inertia": self.rotary_inertia,
             "gyroscopic": self.gyroscopic,
         }
-        self.dump_data(data, Path(file_name) / "ShaftElement6DoF.toml")
+        return {"ShaftElement6DoF": {str(self.n): entry}}
 
     @staticmethod
     def load(file_name="ShaftElement6DoF"):
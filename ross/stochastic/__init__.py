@@ -3,4 +3,8 @@ from .st_disk_element import *
 from .st_materials import *
 from .st_point_mass import *
 from .st_rotor_assembly import *
+from .st_sampling import *
+from .st_sensitivity import *
 from .st_shaft_element import *
+from .st_statistics import *
+from .st_surrogate import *
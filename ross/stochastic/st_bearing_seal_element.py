@@ -3,12 +3,15 @@
 This module creates an instance of random bearing for stochastic analysis.
 """
 # fmt: off
+from collections.abc import Iterable
+
 import numpy as np
 
 from ross.bearing_seal_element import BearingElement
 from ross.fluid_flow import fluid_flow as flow
 from ross.fluid_flow.fluid_flow_coefficients import (
     calculate_damping_matrix, calculate_stiffness_matrix)
+from ross.stochastic.st_element import ST_Element
 from ross.stochastic.st_results_elements import plot_histogram
 
 # fmt: on
@@ -16,7 +19,7 @@ from ross.stochastic.st_results_elements import plot_histogram
 __all__ = ["ST_BearingElement", "st_bearing_example"]
 
 
-class ST_BearingElement:
+class ST_BearingElement(ST_Element):
     """Random bearing element.
 
     Creates an object containing a list with random instances of
@@ -110,6 +113,8 @@ class ST_BearingElement:
     5
     """
 
+    element_class = BearingElement
+
     def __init__(
         self,
         n,
@@ -174,6 +179,42 @@ class ST_BearingElement:
         """
         return iter(self.random_var(self.is_random, self.attribute_dict))
 
+    def __len__(self):
+        """Return the number of random samples.
+
+        Examples
+        --------
+        >>> import ross.stochastic as srs
+        >>> bearing = srs.st_bearing_example()
+        >>> len(bearing)
+        2
+        """
+        value = self.attribute_dict[self.is_random[0]]
+        if isinstance(value[0], Iterable):
+            return len(value[0])
+        return len(value)
+
+    def _sample_value(self, value, idx):
+        """Return the value of a random attribute for a single random sample.
+
+        The random coefficients hold a list of random values for each
+        frequency.
+
+        Parameters
+        ----------
+        value : list
+            Random values of the attribute.
+        idx : int
+            Sample index.
+
+        Returns
+        -------
+        The attribute value for the idx-th random sample.
+        """
+        if isinstance(self.attribute_dict[self.is_random[0]][0], Iterable):
+            return [v[idx] for v in value]
+        return value[idx]
+
     def __getitem__(self, key):
         """Return the value for a given key from attribute_dict.
 
@@ -6,13 +6,14 @@ analysis.
 import numpy as np
 
 from ross.disk_element import DiskElement
+from ross.stochastic.st_element import ST_Element
 from ross.stochastic.st_materials import ST_Material
 from ross.stochastic.st_results_elements import plot_histogram
 
 __all__ = ["ST_DiskElement", "st_disk_example"]
 
 
-class ST_DiskElement:
+class ST_DiskElement(ST_Element):
     """Random disk element.
 
     Creates an object containing a list with random instances of DiskElement.
@@ -55,6 +56,8 @@ class ST_DiskElement:
     5
     """
 
+    element_class = DiskElement
+
     def __init__(
         self, n, m, Id, Ip, tag=None, color="Firebrick", is_random=None,
     ):
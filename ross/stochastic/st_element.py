@@ -0,0 +1,73 @@
+"""Element module for STOCHASTIC ROSS.
+
+This module defines the base class of the random elements, which creates the
+deterministic element of each random sample on demand.
+"""
+
+
+class ST_Element:
+    """Random element base class.
+
+    The random elements store the arguments of the deterministic element in
+    attribute_dict, with lists of random values for the attributes in
+    is_random. Subclasses set element_class to the deterministic element class.
+    """
+
+    element_class = None
+
+    def __len__(self):
+        """Return the number of random samples.
+
+        Examples
+        --------
+        >>> import ross.stochastic as srs
+        >>> elm = srs.st_disk_example()
+        >>> len(elm)
+        2
+        """
+        return len(self.attribute_dict[self.is_random[0]])
+
+    def _sample_value(self, value, idx):
+        """Return the value of a random attribute for a single random sample.
+
+        Parameters
+        ----------
+        value : list
+            Random values of the attribute.
+        idx : int
+            Sample index.
+
+        Returns
+        -------
+        The attribute value for the idx-th random sample.
+        """
+        return value[idx]
+
+    def sample(self, idx):
+        """Create the element of a single random sample.
+
+        The element is created on demand, so that the random samples do not
+        need to be stored as a list of elements.
+
+        Parameters
+        ----------
+        idx : int
+            Sample index.
+
+        Returns
+        -------
+        Element object for the idx-th random sample.
+
+        Examples
+        --------
+        >>> import ross.stochastic as srs
+        >>> elm = srs.st_disk_example()
+        >>> elm.sample(1) == list(iter(elm))[1]
+        True
+        """
+        args = [
+            self._sample_value(value, idx) if key in self.is_random else value
+            for key, value in self.attribute_dict.items()
+        ]
+
+        return self.element_class(*args)
@@ -4,12 +4,13 @@ This module creates an instance of random point mass for stochastic
 analysis.
 """
 from ross.point_mass import PointMass
+from ross.stochastic.st_element import ST_Element
 from ross.stochastic.st_results_elements import plot_histogram
 
 __all__ = ["ST_PointMass", "st_pointmass_example"]
 
 
-class ST_PointMass:
+class ST_PointMass(ST_Element):
     """Random point mass element.
 
     Creates an object containing a list with random instances of PointMass.
@@ -56,6 +57,8 @@ class ST_PointMass:
     5
     """
 
+    element_class = PointMass
+
     def __init__(
         self, n, m=None, mx=None, my=None, tag=None, color="DarkSalmon", is_random=None,
     ):
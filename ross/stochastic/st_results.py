@@ -8,6 +8,8 @@ import plotly.graph_objects as go
 import plotly.io as pio
 from plotly.subplots import make_subplots
 
+from ross.stochastic.st_results_elements import plot_histogram
+
 pio.renderers.default = "browser"
 
 # set Plotly palette of colors
@@ -32,6 +34,9 @@ class ST_CampbellResults:
     log_dec : array
         Array with the Logarithmic decrement
 
+    wd and log_dec can also be ST_StreamingStatistics objects when the samples
+    were not stored.
+
     Returns
     -------
     subplots : Plotly graph_objects.make_subplots()
@@ -361,6 +366,9 @@ class ST_FrequencyResponseResults:
         Array with the frequencies, phase of the frequency
         response for each pair input/output.
 
+    magnitude and phase can also be ST_StreamingStatistics objects when the
+    samples were not stored.
+
     Returns
     -------
     subplots : Plotly graph_objects.make_subplots()
@@ -1318,6 +1326,9 @@ class ST_ForcedResponseResults:
     phase : array
         Phase of the frequency response for node for each frequency
 
+    force_resp, magnitude and phase can also be ST_StreamingStatistics objects
+    when the samples were not stored.
+
     Returns
     -------
     subplots : Plotly graph_objects.make_subplots()
@@ -1609,8 +1620,8 @@ class ST_ForcedResponseResults:
 
         fig.add_trace(
             go.Scatterpolar(
-                r=np.mean(self.magnitude[..., dof], axis=1),
-                theta=np.mean(self.phase[..., dof], axis=1),
+                r=np.mean(self.magnitude[..., dof], axis=0),
+                theta=np.mean(self.phase[..., dof], axis=0),
                 customdata=self.frequency_range,
                 thetaunit="radians",
                 line=dict(width=3.0, color="black"),
@@ -1627,8 +1638,8 @@ class ST_ForcedResponseResults:
         for i, p in enumerate(percentile):
             fig.add_trace(
                 go.Scatterpolar(
-                    r=np.percentile(self.magnitude[..., dof], p, axis=1),
-                    theta=np.percentile(self.phase[..., dof], p, axis=1),
+                    r=np.percentile(self.magnitude[..., dof], p, axis=0),
+                    theta=np.percentile(self.phase[..., dof], p, axis=0),
                     customdata=self.frequency_range,
                     thetaunit="radians",
                     opacity=0.6,
@@ -1644,10 +1655,10 @@ class ST_ForcedResponseResults:
                 )
             )
         for i, p in enumerate(conf_interval):
-            p1 = np.percentile(self.magnitude[..., dof], 50 + p / 2, axis=1)
-            p2 = np.percentile(self.magnitude[..., dof], 50 - p / 2, axis=1)
-            p3 = np.percentile(self.phase[..., dof], 50 + p / 2, axis=1)
-            p4 = np.percentile(self.phase[..., dof], 50 - p / 2, axis=1)
+            p1 = np.percentile(self.magnitude[..., dof], 50 + p / 2, axis=0)
+            p2 = np.percentile(self.magnitude[..., dof], 50 - p / 2, axis=0)
+            p3 = np.percentile(self.phase[..., dof], 50 + p / 2, axis=0)
+            p4 = np.percentile(self.phase[..., dof], 50 - p / 2, axis=0)
             fig.add_trace(
                 go.Scatterpolar(
                     r=np.concatenate((p1, p2[::-1])),
@@ -1756,3 +1767,307 @@ class ST_ForcedResponseResults:
         )
 
         return subplots
+
+
+class ST_ModalResults:
+    """Store stochastic results and provide plots for Modal Analysis.
+
+    Parameters
+    ----------
+    speed : float
+        Rotor speed.
+    wn : array
+        Array with the undamped natural frequencies with shape
+        (n_modes, RV_size).
+    wd : array
+        Array with the damped natural frequencies with shape (n_modes, RV_size).
+    log_dec : array
+        Array with the logarithmic decrement with shape (n_modes, RV_size).
+
+    Returns
+    -------
+    fig : Plotly graph_objects.make_subplots()
+        A figure with the histogram plots.
+    """
+
+    def __init__(self, speed, wn, wd, log_dec):
+        self.speed = speed
+        self.wn = wn
+        self.wd = wd
+        self.log_dec = log_dec
+
+    def plot(
+        self,
+        mode=0,
+        var_list=["wn", "wd", "log_dec"],
+        histogram_kwargs={},
+        plot_kwargs={},
+    ):
+        """Plot the histograms of the modal parameters of a mode.
+
+        Parameters
+        ----------
+        mode : int, optional
+            Mode to be plotted. Default is 0.
+        var_list : list, optional
+            List of modal parameters to plot. Options are "wn", "wd" and
+            "log_dec". Default is all of them.
+        histogram_kwargs : dict, optional
+            Additional key word arguments can be passed to change
+            the plotly.go.histogram (e.g. histnorm="probability density", nbinsx=20...).
+            *See Plotly API to more information.
+        plot_kwargs : dict, optional
+            Additional key word arguments can be passed to change the plotly go.figure
+            (e.g. line=dict(width=4.0, color="royalblue"), opacity=1.0, ...).
+            *See Plotly API to more information.
+
+        Returns
+        -------
+        fig : Plotly graph_objects.make_subplots()
+            A figure with the histogram plots.
+        """
+        label = dict(
+            wn="Undamped natural frequency - Mode {}".format(mode + 1),
+            wd="Damped natural frequency - Mode {}".format(mode + 1),
+            log_dec="Logarithmic decrement - Mode {}".format(mode + 1),
+        )
+        attribute_dict = dict(
+            wn=self.wn[mode], wd=self.wd[mode], log_dec=self.log_dec[mode]
+        )
+
+        return plot_histogram(
+            attribute_dict,
+            label,
+            var_list,
+            histogram_kwargs=dict(histogram_kwargs),
+            plot_kwargs=dict(plot_kwargs),
+        )
+
+
+class ST_StaticResults:
+    """Store stochastic results and provide plots for Static Analysis.
+
+    Parameters
+    ----------
+    disp_y : array
+        Array with the shaft static displacement in the gravity direction with
+        shape (RV_size, n_nodes).
+    nodes_pos : list
+        List with the nodal axial positions.
+
+    Returns
+    -------
+    fig : Plotly graph_objects.Figure()
+        The figure object with the plot.
+    """
+
+    def __init__(self, disp_y, nodes_pos):
+        self.disp_y = disp_y
+        self.nodes_pos = nodes_pos
+
+    def plot_deformation(self, percentile=[], conf_interval=[], **kwargs):
+        """Plot the shaft static deformation.
+
+        Parameters
+        ----------
+        percentile : list, optional
+            Sequence of percentiles to compute, which must be between
+            0 and 100 inclusive.
+        conf_interval : list, optional
+            Sequence of confidence intervals to compute, which must be between
+            0% and 100% inclusive.
+        kwargs : optional
+            Additional key word arguments can be passed to change the plot
+            (e.g. line=dict(width=4.0, color="royalblue"), opacity=1.0, ...)
+            *See Plotly Python Figure Reference for more information.
+
+        Returns
+        -------
+        fig : Plotly graph_objects.Figure()
+            The figure object with the plot.
+        """
+        default_values = dict(mode="lines")
+        conf_interval = np.sort(conf_interval)
+        percentile = np.sort(percentile)
+
+        for k, v in default_values.items():
+            kwargs.setdefault(k, v)
+
+        fig = go.Figure()
+        nodes_pos = np.asarray(self.nodes_pos)
+
+        fig.add_trace(
+            go.Scatter(
+                x=nodes_pos,
+                y=np.mean(self.disp_y, axis=0),
+                opacity=1.0,
+                name="Mean",
+                line=dict(width=3, color="black"),
+                legendgroup="mean",
+                hovertemplate=("Shaft length: %{x:.2f}<br>" + "Displacement: %{y:.2e}"),
+                **kwargs,
+            )
+        )
+        for i, p in enumerate(percentile):
+            fig.add_trace(
+                go.Scatter(
+                    x=nodes_pos,
+                    y=np.percentile(self.disp_y, p, axis=0),
+                    opacity=0.6,
+                    line=dict(width=2.5, color=colors2[i]),
+                    name="percentile: {}%".format(p),
+                    legendgroup="percentile{}".format(i),
+                    hovertemplate=(
+                        "Shaft length: %{x:.2f}<br>" + "Displacement: %{y:.2e}"
+                    ),
+                    **kwargs,
+                )
+            )
+
+        x = np.concatenate((nodes_pos, nodes_pos[::-1]))
+        for i, p in enumerate(conf_interval):
+            p1 = np.percentile(self.disp_y, 50 + p / 2, axis=0)
+            p2 = np.percentile(self.disp_y, 50 - p / 2, axis=0)
+            fig.add_trace(
+                go.Scatter(
+                    x=x,
+                    y=np.concatenate((p1, p2[::-1])),
+                    line=dict(width=1, color=colors1[i]),
+                    fill="toself",
+                    fillcolor=colors1[i],
+                    opacity=0.5,
+                    name="confidence interval: {}%".format(p),
+                    legendgroup="conf{}".format(i),
+                    hovertemplate=(
+                        "Shaft length: %{x:.2f}<br>" + "Displacement: %{y:.2e}"
+                    ),
+                    **kwargs,
+                )
+            )
+
+        fig.update_xaxes(
+            title_text="<b>Shaft Length</b>",
+            title_font=dict(family="Arial", size=20),
+            tickfont=dict(size=16),
+            gridcolor="lightgray",
+            showline=True,
+            linewidth=2.5,
+            linecolor="black",
+            mirror=True,
+        )
+        fig.update_yaxes(
+            title_text="<b>Displacement</b>",
+            title_font=dict(family="Arial", size=20),
+            tickfont=dict(size=16),
+            gridcolor="lightgray",
+            showline=True,
+            linewidth=2.5,
+            linecolor="black",
+            mirror=True,
+        )
+        fig.update_layout(
+            width=1200,
+            height=900,
+            plot_bgcolor="white",
+            legend=dict(
+                font=dict(family="sans-serif", size=14),
+                bgcolor="white",
+                bordercolor="black",
+                borderwidth=2,
+            ),
+        )
+
+        return fig
+
+
+class ST_SensitivityResults:
+    """Store sensitivity indices and provide plots for Sensitivity Analysis.
+
+    Parameters
+    ----------
+    names : list
+        Random variables names.
+    indices : dict
+        Dictionary with the indices names as keys (e.g. "S1" and "ST") and
+        arrays with shape (n_variables, ...) as values, for each output point.
+
+    Returns
+    -------
+    fig : Plotly graph_objects.Figure()
+        The figure object with the plot.
+    """
+
+    def __init__(self, names, indices):
+        self.names = names
+        self.indices = indices
+
+    def plot(self, output=(), indices=None, **kwargs):
+        """Plot the sensitivity indices of each random variable.
+
+        Parameters
+        ----------
+        output : int, tuple, optional
+            Index of the output point. Default is () for a scalar output.
+        indices : list, optional
+            Indices to be plotted. Default is all of them.
+        kwargs : optional
+            Additional key word arguments can be passed to change the plot
+            (e.g. opacity=1.0, ...)
+            *See Plotly Python Figure Reference for more information.
+
+        Returns
+        -------
+        fig : Plotly graph_objects.Figure()
+            The figure object with the plot.
+        """
+        if indices is None:
+            indices = list(self.indices.keys())
+        key = (slice(None),) + np.index_exp[output]
+
+        fig = go.Figure()
+        for i, index in enumerate(indices):
+            fig.add_trace(
+                go.Bar(
+                    x=self.names,
+                    y=self.indices[index][key],
+                    name=index,
+                    marker_color=colors1[i],
+                    hovertemplate=("Variable: %{x}<br>" + "Index: %{y:.3f}"),
+                    **kwargs,
+                )
+            )
+
+        fig.update_xaxes(
+            title_text="<b>Random variables</b>",
+            title_font=dict(family="Arial", size=20),
+            tickfont=dict(size=16),
+            gridcolor="lightgray",
+            showline=True,
+            linewidth=2.5,
+            linecolor="black",
+            mirror=True,
+        )
+        fig.update_yaxes(
+            title_text="<b>Sensitivity index</b>",
+            title_font=dict(family="Arial", size=20),
+            tickfont=dict(size=16),
+            gridcolor="lightgray",
+            showline=True,
+            linewidth=2.5,
+            linecolor="black",
+            mirror=True,
+        )
+        fig.update_layout(
+            barmode="group",
+            width=1200,
+            height=900,
+            plot_bgcolor="white",
+            legend=dict(
+                font=dict(family="sans-serif", size=14),
+                bgcolor="white",
+                bordercolor="black",
+                borderwidth=2,
+            ),
+        )
+
+        return fig
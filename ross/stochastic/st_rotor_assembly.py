@@ -3,10 +3,18 @@
 This module creates random rotor instances and run stochastic analysis.
 """
 # fmt: off
+import os
+import pickle
+import warnings
+from collections import deque
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
+import scipy.linalg as la
 
+from ross.bearing_seal_element import BearingElement
+from ross.cache import content_hash
 from ross.rotor_assembly import Rotor
 from ross.stochastic.st_bearing_seal_element import ST_BearingElement
 from ross.stochastic.st_disk_element import ST_DiskElement
@@ -14,13 +22,154 @@ from ross.stochastic.st_point_mass import ST_PointMass
 from ross.stochastic.st_results import (ST_CampbellResults,
                                         ST_ForcedResponseResults,
                                         ST_FrequencyResponseResults,
+                                        ST_ModalResults, ST_StaticResults,
                                         ST_TimeResponseResults)
 from ross.stochastic.st_shaft_element import ST_ShaftElement
+from ross.stochastic.st_statistics import (DEFAULT_PERCENTILES,
+                                           ST_StreamingStatistics)
 
 # fmt: on
 
 __all__ = ["ST_Rotor", "st_rotor_example"]
 
+_ST_ELEMENTS = (ST_ShaftElement, ST_DiskElement, ST_BearingElement, ST_PointMass)
+
+# number of samples whose matrices are stacked at a time in batched analyses
+_BATCH_CHUNK_SIZE = 64
+
+
+def _random_inputs(elements):
+    """Collect the random inputs values of stochastic elements.
+
+    Parameters
+    ----------
+    elements : list
+        List of stochastic elements.
+
+    Returns
+    -------
+    inputs : np.ndarray
+        Array with shape (RV_size, n_inputs) with the values of the random
+        attributes. Constant and repeated attributes are removed.
+    """
+    columns = []
+    for elm in elements:
+        for key in elm.is_random:
+            value = elm.attribute_dict[key]
+            if key == "material":
+                for attr in ["rho", "E", "G_s"]:
+                    columns.append([getattr(mat, attr) for mat in value])
+            else:
+                value = np.asarray(value, dtype=float)
+                columns.extend(value.reshape(-1, value.shape[-1]))
+
+    if not columns:
+        return None
+
+    columns = np.array(columns, dtype=float)
+    columns = columns[np.ptp(columns, axis=1) > 0]
+    columns = np.unique(columns, axis=0)
+
+    return columns.T
+
+
+def _evaluate_samples(st_rotor, func, indexes, samples_args):
+    """Evaluate a function for a group of random rotor samples.
+
+    This function is module level so that it can be sent to worker processes.
+
+    Parameters
+    ----------
+    st_rotor : ST_Rotor
+        The random rotor object.
+    func : callable
+        Module level function called as func(rotor, *args) for each sample.
+    indexes : list
+        Indexes of the samples to be evaluated.
+    samples_args : list
+        Arguments passed to func for each sample.
+
+    Returns
+    -------
+    results : list
+        List with func results for each sample, in the same order as indexes.
+    """
+    return [
+        func(st_rotor._sample_rotor(idx), *args)
+        for idx, args in zip(indexes, samples_args)
+    ]
+
+
+def _campbell_sample(rotor, speed_range, frequencies, frequency_type):
+    results = rotor.run_campbell(speed_range, frequencies, frequency_type)
+    return results.wd.T, results.log_dec.T
+
+
+def _freq_response_sample(rotor, speed_range, modes, inp, out):
+    results = rotor.run_freq_response(speed_range, modes)
+    return results.magnitude[inp, out, :], results.phase[inp, out, :]
+
+
+def _time_response_sample(rotor, speed, force, time_range, ic):
+    t_, y, x = rotor.time_response(speed, force, time_range, ic)
+    return y, x
+
+
+def _unbalance_response_sample(rotor, node, magnitude, phase, frequency_range):
+    results = rotor.run_unbalance_response(node, magnitude, phase, frequency_range)
+    return results.forced_resp.T, results.magnitude.T, results.phase.T
+
+
+def _unbalance_response_chunk(
+    st_rotor, indexes, unit_forces, coefficients, frequency_range
+):
+    """Unbalance response of a group of samples with batched linear algebra.
+
+    This function is module level so that it can be sent to worker processes.
+
+    Parameters
+    ----------
+    st_rotor : ST_Rotor
+        The random rotor object.
+    indexes : list
+        Indexes of the samples to be evaluated.
+    unit_forces : np.ndarray
+        Unit unbalance force vectors with shape (ndof, n_nodes).
+    coefficients : np.ndarray
+        Unbalance coefficients m * exp(j * phase) of the samples, with shape
+        (len(indexes), n_nodes).
+    frequency_range : array
+        Array with the frequencies.
+
+    Returns
+    -------
+    forced_resp : np.ndarray
+        Complex response with shape (len(indexes), freq_size, ndof).
+    """
+    # only the bearings matrices depend on the frequency, the other
+    # elements are assembled once
+    keys = ["shaft_elements", "disk_elements", "point_mass_elements"]
+    brg = ["bearing_elements"]
+    M = st_rotor._assemble("M", indexes=indexes)
+    G = st_rotor._assemble("G", indexes=indexes)
+    K = st_rotor._assemble("K", keys=keys, indexes=indexes)
+    C = st_rotor._assemble("C", keys=keys, indexes=indexes)
+
+    forced_resp = np.zeros(
+        (len(indexes), len(frequency_range), st_rotor.ndof), dtype=complex
+    )
+    for i, w in enumerate(frequency_range):
+        K_brg = st_rotor._assemble("K", w, keys=brg, indexes=indexes)
+        C_brg = st_rotor._assemble("C", w, keys=brg, indexes=indexes)
+        Z = K + K_brg - w ** 2 * M + 1j * w * (C + C_brg + w * G)
+        columns = np.linalg.solve(
+            Z,
+            np.broadcast_to(w ** 2 * unit_forces, (len(indexes),) + unit_forces.shape),
+        )
+        forced_resp[:, i] = np.einsum("sdk,sk->sd", columns, coefficients)
+
+    return forced_resp
+
 
 class ST_Rotor(object):
     r"""A random rotor object.
@@ -123,8 +272,8 @@ class ST_Rotor(object):
             it = iter(
                 [elm for elm in shaft_elements if isinstance(elm, ST_ShaftElement)]
             )
-            len_sh = len(list(next(iter(it))))
-            if not all(len(list(l)) == len_sh for l in it):
+            len_sh = len(next(it))
+            if not all(len(l) == len_sh for l in it):
                 raise ValueError(
                     "not all random shaft elements lists have same length."
                 )
@@ -134,8 +283,8 @@ class ST_Rotor(object):
             is_random.append("disk_elements")
 
             it = iter([elm for elm in disk_elements if isinstance(elm, ST_DiskElement)])
-            len_dk = len(list(next(iter(it))))
-            if not all(len(list(l)) == len_dk for l in it):
+            len_dk = len(next(it))
+            if not all(len(l) == len_dk for l in it):
                 raise ValueError("not all random disk elements lists have same length.")
             len_list.append(len_dk)
 
@@ -145,8 +294,8 @@ class ST_Rotor(object):
             it = iter(
                 [elm for elm in bearing_elements if isinstance(elm, ST_BearingElement)]
             )
-            len_brg = len(list(next(iter(it))))
-            if not all(len(list(l)) == len_brg for l in it):
+            len_brg = len(next(it))
+            if not all(len(l) == len_brg for l in it):
                 raise ValueError(
                     "not all random bearing elements lists have same length."
                 )
@@ -158,8 +307,8 @@ class ST_Rotor(object):
             it = iter(
                 [elm for elm in point_mass_elements if isinstance(elm, ST_PointMass)]
             )
-            len_pm = len(list(next(iter(it))))
-            if not all(len(list(l)) == len_pm for l in it):
+            len_pm = len(next(it))
+            if not all(len(l) == len_pm for l in it):
                 raise ValueError("not all random point mass lists have same length.")
             len_list.append(len_pm)
 
@@ -168,27 +317,25 @@ class ST_Rotor(object):
         else:
             raise ValueError("not all the random elements lists have the same length.")
 
-        for i, elm in enumerate(shaft_elements):
-            if isinstance(elm, ST_ShaftElement):
-                shaft_elements[i] = list(iter(elm))
-
-        for i, elm in enumerate(disk_elements):
-            if isinstance(elm, ST_DiskElement):
-                disk_elements[i] = list(iter(elm))
-
-        for i, elm in enumerate(bearing_elements):
-            if isinstance(elm, ST_BearingElement):
-                bearing_elements[i] = list(iter(elm))
-
-        for i, elm in enumerate(point_mass_elements):
-            if isinstance(elm, ST_PointMass):
-                point_mass_elements[i] = list(iter(elm))
-
+        random_elements = [
+            elm
+            for elm in [
+                *shaft_elements,
+                *disk_elements,
+                *bearing_elements,
+                *point_mass_elements,
+            ]
+            if isinstance(elm, _ST_ELEMENTS)
+        ]
+        self.random_inputs = _random_inputs(random_elements)
+
+        # random elements are kept as stochastic objects and each sample element
+        # is created only when a rotor sample is built
         attribute_dict = dict(
-            shaft_elements=shaft_elements,
-            disk_elements=disk_elements,
-            bearing_elements=bearing_elements,
-            point_mass_elements=point_mass_elements,
+            shaft_elements=list(shaft_elements),
+            disk_elements=list(disk_elements),
+            bearing_elements=list(bearing_elements),
+            point_mass_elements=list(point_mass_elements),
             sparse=sparse,
             n_eigen=n_eigen,
             min_w=min_w,
@@ -203,6 +350,7 @@ class ST_Rotor(object):
 
         # common parameters
         self.RV_size = RV_size
+        self._assembly = None
 
         # collect a series of attributes from a rotor instance
         self._get_rotor_args()
@@ -221,7 +369,7 @@ class ST_Rotor(object):
         >>> len(list(iter(rotors)))
         10
         """
-        return iter(self.use_random_var(Rotor, self.is_random, self.attribute_dict))
+        return (self._sample_rotor(i) for i in range(self.RV_size))
 
     def __getitem__(self, key):
         """Return the value for a given key from attribute_dict.
@@ -282,6 +430,7 @@ class ST_Rotor(object):
         if key not in self.attribute_dict.keys():
             raise KeyError("Object does not have parameter: {}.".format(key))
         self.attribute_dict[key] = value
+        self._assembly = None
 
     def _get_rotor_args(self):
         """Get relevant attributes from a rotor system.
@@ -291,8 +440,7 @@ class ST_Rotor(object):
         to the stochastic rotor as attribute. If an attribute is somehow afected by a
         random variable, the function returns its mean.
         """
-        self.iter_break = True
-        aux_rotor = list(iter(self))[0]
+        aux_rotor = self._sample_rotor(0)
 
         self.ndof = aux_rotor.ndof
         self.nodes = aux_rotor.nodes
@@ -304,10 +452,28 @@ class ST_Rotor(object):
                 for sh in self.attribute_dict["shaft_elements"]
                 if isinstance(sh, ST_ShaftElement)
             ):
-                nodes_pos_matrix = np.zeros(len(self.nodes), self.RV_size)
-                for i, rotor in enumerate(iter(self)):
-                    nodes_pos_matrix[:, i] = rotor.nodes_pos
-                self.nodes_pos = np.mean(nodes_pos_matrix, axis=1)
+                # the nodes positions are a sum of the elements lengths, so their
+                # mean is given by a single rotor with the mean lengths
+                shaft_elements = []
+                for sh in self.attribute_dict["shaft_elements"]:
+                    if isinstance(sh, ST_ShaftElement):
+                        args = {
+                            key: sh._sample_value(value, 0)
+                            if key in sh.is_random
+                            else value
+                            for key, value in sh.attribute_dict.items()
+                        }
+                        if "L" in sh.is_random:
+                            args["L"] = np.mean(sh["L"])
+                        sh = sh.element_class(*args.values())
+                    shaft_elements.append(sh)
+                mean_rotor = Rotor(
+                    shaft_elements,
+                    aux_rotor.disk_elements,
+                    aux_rotor.bearing_elements,
+                    aux_rotor.point_mass_elements,
+                )
+                self.nodes_pos = mean_rotor.nodes_pos
             else:
                 self.nodes_pos = aux_rotor.nodes_pos
         else:
@@ -345,7 +511,9 @@ class ST_Rotor(object):
         """
         new_args = []
         for arg in list(args[0]):
-            if isinstance(arg, Iterable):
+            if isinstance(arg, _ST_ELEMENTS):
+                new_args.append(arg.sample(idx))
+            elif isinstance(arg, Iterable):
                 new_args.append(arg[idx])
             else:
                 new_args.append(arg)
@@ -375,17 +543,13 @@ class ST_Rotor(object):
         args_dict = args[0]
         new_args = []
 
-        if self.iter_break is True:
-            var_size = 1
-            self.iter_break = False
-        else:
-            for v in list(map(args_dict.get, is_random))[0]:
-                if isinstance(v, Iterable):
-                    var_size = len(v)
-                    break
-                else:
-                    var_size = len(list(map(args_dict.get, is_random))[0])
-                    break
+        for v in list(map(args_dict.get, is_random))[0]:
+            if isinstance(v, Iterable):
+                var_size = len(v)
+                break
+            else:
+                var_size = len(list(map(args_dict.get, is_random))[0])
+                break
 
         for i in range(var_size):
             arg = []
@@ -428,7 +592,692 @@ class ST_Rotor(object):
 
         return f_list
 
-    def run_campbell(self, speed_range, frequencies=6, frequency_type="wd"):
+    def _sample_rotor(self, idx):
+        """Build the rotor instance of a single sample.
+
+        Parameters
+        ----------
+        idx : int
+            Sample index.
+
+        Returns
+        -------
+        rotor : ross.Rotor
+            The rotor built with the idx-th value of each random element.
+
+        Examples
+        --------
+        >>> import ross.stochastic as srs
+        >>> rotors = srs.st_rotor_example()
+        >>> rotors._sample_rotor(3) == list(iter(rotors))[3]
+        True
+        """
+        args = [
+            self._get_args(idx, value) if key in self.is_random else value
+            for key, value in self.attribute_dict.items()
+        ]
+        return Rotor(*args)
+
+    def _monte_carlo(self, func, samples_args, n_jobs=1, indexes=None, chunk_size=None):
+        """Evaluate a function for every random rotor sample.
+
+        The samples are split in chunks which are evaluated in worker processes.
+        Results are yielded in the samples order regardless of the number of
+        workers, and only a few chunks are kept in memory at a time.
+
+        Parameters
+        ----------
+        func : callable
+            Module level function called as func(rotor, *args) for each sample.
+        samples_args : list
+            List with the func arguments for each sample.
+        n_jobs : int, optional
+            Number of worker processes. If 1, the samples are evaluated in the
+            current process. If None, the number of processors is used.
+            Default is 1.
+        indexes : list, optional
+            Indexes of the samples to be evaluated. Default is all samples.
+        chunk_size : int, optional
+            Number of samples sent to a worker at a time. Default is to split
+            the samples in four chunks per worker.
+
+        Yields
+        ------
+        result : object
+            The func result for each sample.
+        """
+        if indexes is None:
+            indexes = range(self.RV_size)
+        indexes = list(indexes)
+        if not indexes:
+            return
+
+        if n_jobs == 1:
+            for idx in indexes:
+                yield from _evaluate_samples(self, func, [idx], [samples_args[idx]])
+            return
+
+        n_workers = min(n_jobs or os.cpu_count(), len(indexes))
+        if chunk_size is None:
+            n_chunks = min(4 * n_workers, len(indexes))
+        else:
+            n_chunks = int(np.ceil(len(indexes) / chunk_size))
+        chunks = np.array_split(indexes, n_chunks)
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = deque()
+            for chunk in chunks:
+                futures.append(
+                    executor.submit(
+                        _evaluate_samples,
+                        self,
+                        func,
+                        list(chunk),
+                        [samples_args[i] for i in chunk],
+                    )
+                )
+                if len(futures) >= 2 * n_workers:
+                    yield from futures.popleft().result()
+            while futures:
+                yield from futures.popleft().result()
+
+    def _surrogate_monte_carlo(
+        self, func, samples_args, surrogate, inputs=None, n_jobs=1
+    ):
+        """Estimate a function for every random rotor sample with a surrogate.
+
+        The function is evaluated only for the design of experiments chosen by
+        the surrogate. The surrogate is then fitted to each returned array and
+        evaluated for all the samples.
+
+        Parameters
+        ----------
+        func : callable
+            Module level function called as func(rotor, *args) for each sample.
+            It must return a tuple of arrays.
+        samples_args : list
+            List with the func arguments for each sample.
+        surrogate : ST_PolynomialChaos
+            Surrogate model.
+        inputs : np.ndarray, optional
+            Random inputs with shape (RV_size, n_inputs).
+            Default is the random_inputs attribute.
+        n_jobs : int, optional
+            Number of worker processes. Default is 1.
+
+        Yields
+        ------
+        result : tuple
+            The estimated func result for each sample.
+        """
+        if inputs is None:
+            inputs = self.random_inputs
+        if inputs is None:
+            raise ValueError("Surrogate models require random inputs.")
+
+        design = surrogate.design(inputs)
+        design_results = list(
+            self._monte_carlo(func, samples_args, n_jobs, indexes=design)
+        )
+
+        estimates = []
+        for outputs in zip(*design_results):
+            surrogate.fit(inputs[design], np.array(outputs))
+            estimates.append(surrogate.predict(inputs))
+
+        yield from zip(*estimates)
+
+    def _streaming_monte_carlo(
+        self,
+        func,
+        samples_args,
+        stats,
+        n_jobs=1,
+        batch_size=None,
+        tolerance=None,
+        checkpoint=None,
+        samples_results=None,
+    ):
+        """Update running statistics with the random rotor samples.
+
+        The samples are evaluated in batches. After each batch, the running
+        mean and percentiles are compared with the ones of the previous batch and
+        the evaluation stops when their relative change is less than the
+        tolerance. The statistics can be saved to a checkpoint file after each
+        batch, so that an interrupted run is resumed from the last batch.
+
+        Parameters
+        ----------
+        func : callable
+            Module level function called as func(rotor, *args) for each sample.
+            It must return a tuple with one array for each statistics object.
+        samples_args : list
+            List with the func arguments for each sample.
+        stats : list
+            List of ST_StreamingStatistics objects to be updated.
+        n_jobs : int, optional
+            Number of worker processes. Default is 1.
+        batch_size : int, optional
+            Number of samples evaluated between convergence checks and
+            checkpoints. Default is to evaluate all samples in one batch.
+        tolerance : float, optional
+            Relative change of the mean and percentiles between two batches
+            below which the evaluation stops. Default is None (all samples are
+            evaluated).
+        checkpoint : str, pathlib.Path, optional
+            File where the statistics are saved after each batch. If the file
+            exists, the evaluation is resumed from it. The checkpoint stores a
+            hash of the analysis, its arguments and the statistics
+            shapes and percentiles, and a checkpoint of a different analysis
+            raises an error. A run stopped by a tolerance is resumed when a
+            different tolerance is given. Default is None.
+        samples_results : iterable, optional
+            Results already available for all the samples (e.g. estimated by a
+            surrogate). If given, the statistics are only updated with them.
+
+        Returns
+        -------
+        stats : list
+            List with the updated ST_StreamingStatistics objects.
+        """
+        if samples_results is not None:
+            for sample in samples_results:
+                for st, value in zip(stats, sample):
+                    st.update(value)
+            return stats
+
+        start = 0
+        converged = False
+        if checkpoint is not None:
+            # statistics are only resumed for the same samples and estimates
+            key = content_hash(
+                func.__name__,
+                self.RV_size,
+                samples_args,
+                [
+                    (st.shape, st.sample_axis, st.percentiles, st.dtype.str)
+                    for st in stats
+                ],
+            )
+        if checkpoint is not None and os.path.exists(checkpoint):
+            with open(checkpoint, "rb") as f:
+                state = pickle.load(f)
+            if state.get("key") != key:
+                raise ValueError(
+                    f"Checkpoint {checkpoint} was not created by this analysis."
+                )
+            stats = state["stats"]
+            start = state["n"]
+            converged = state["converged"] and state["tolerance"] == tolerance
+
+        if batch_size is None:
+            batch_size = self.RV_size
+
+        def estimates():
+            return [st._estimates() for st in stats]
+
+        previous = estimates() if start else None
+        n = start
+        if not converged and start < self.RV_size:
+            chunk_size = max(1, batch_size // (n_jobs or os.cpu_count()))
+            results = self._monte_carlo(
+                func,
+                samples_args,
+                n_jobs,
+                indexes=range(start, self.RV_size),
+                chunk_size=chunk_size,
+            )
+            for sample in results:
+                for st, value in zip(stats, sample):
+                    st.update(value)
+                n += 1
+                if n % batch_size and n < self.RV_size:
+                    continue
+
+                current = estimates()
+                if tolerance is not None and previous is not None:
+                    converged = all(
+                        np.max(np.abs(new - old)) <= tolerance * np.max(np.abs(new))
+                        for new, old in zip(current, previous)
+                    )
+                previous = current
+
+                if checkpoint is not None:
+                    state = dict(
+                        key=key,
+                        n=n,
+                        converged=converged,
+                        tolerance=tolerance,
+                        stats=stats,
+                    )
+                    with open(checkpoint, "wb") as f:
+                        pickle.dump(state, f)
+
+                if converged:
+                    results.close()
+                    break
+
+        if tolerance is not None and not converged:
+            warnings.warn(
+                f"Monte Carlo statistics did not converge to tolerance {tolerance} "
+                f"with {n} samples."
+            )
+
+        return stats
+
+    def _assembly_template(self):
+        """Get the global degrees of freedom of each element.
+
+        A reference rotor is built once to map every element to its global
+        degrees of freedom. Deterministic and random elements are kept apart, so
+        that the deterministic part of the global matrices is assembled only once.
+
+        Returns
+        -------
+        deterministic : list
+            List of (key, dofs, element) tuples for the deterministic elements,
+            where key is the elements group (e.g. "shaft_elements").
+        random : list
+            List of (key, dofs, element) tuples for the random elements, where
+            element is the stochastic element.
+        """
+        if self._assembly is not None:
+            return self._assembly
+
+        keys = [
+            "shaft_elements",
+            "disk_elements",
+            "bearing_elements",
+            "point_mass_elements",
+        ]
+        samples = {
+            key: [
+                elm.sample(0) if isinstance(elm, _ST_ELEMENTS) else elm
+                for elm in self.attribute_dict[key]
+            ]
+            for key in keys
+        }
+        rotor = Rotor(
+            *[samples.get(key, value) for key, value in self.attribute_dict.items()]
+        )
+        shaft_dofs = {elm.n: elm.dof_global_index for elm in rotor.shaft_elements}
+
+        deterministic = []
+        random = []
+        for key in keys:
+            for i, (elm, sample) in enumerate(
+                zip(self.attribute_dict[key], samples[key])
+            ):
+                if key == "shaft_elements":
+                    dofs = shaft_dofs[i if sample.n is None else sample.n]
+                else:
+                    dofs = sample.dof_global_index
+                dofs = np.array(dofs, dtype=int)
+
+                if isinstance(elm, _ST_ELEMENTS):
+                    random.append((key, dofs, elm))
+                else:
+                    deterministic.append((key, dofs, elm))
+
+        self._assembly = (deterministic, random)
+
+        return self._assembly
+
+    def _assemble(self, matrix, *args, keys=None, indexes=None):
+        """Assemble a global matrix for every sample.
+
+        The deterministic elements are assembled once and the random elements
+        contributions are added to a stack of matrices, without building a
+        rotor for each sample.
+
+        Parameters
+        ----------
+        matrix : str
+            Element method name ("M", "K", "C" or "G").
+        *args : optional
+            Arguments passed to the bearing elements method (the frequency of
+            "K" and "C"). The other elements matrices do not take arguments.
+        keys : list, optional
+            Elements groups to be assembled (e.g. ["shaft_elements"]).
+            Default is None (all the elements).
+        indexes : list, optional
+            Indexes of the samples to be assembled. Default is all samples.
+
+        Returns
+        -------
+        stacked : np.ndarray
+            Array with shape (len(indexes), ndof, ndof).
+        """
+        deterministic, random = self._assembly_template()
+        if keys is not None:
+            deterministic = [item for item in deterministic if item[0] in keys]
+            random = [item for item in random if item[0] in keys]
+
+        def element_matrix(key, elm):
+            # only the bearings matrices depend on the frequency
+            if key == "bearing_elements":
+                return getattr(elm, matrix)(*args)
+            return getattr(elm, matrix)()
+
+        base = np.zeros((self.ndof, self.ndof))
+        for key, dofs, elm in deterministic:
+            base[np.ix_(dofs, dofs)] += element_matrix(key, elm)
+
+        if indexes is None:
+            indexes = range(self.RV_size)
+        stacked = np.repeat(base[np.newaxis], len(indexes), axis=0)
+        for key, dofs, elm in random:
+            blocks = np.array([element_matrix(key, elm.sample(i)) for i in indexes])
+            stacked[:, dofs[:, np.newaxis], dofs] += blocks
+
+        return stacked
+
+    def M(self):
+        """Mass matrices for the random rotor instances.
+
+        Returns
+        -------
+        M0 : np.ndarray
+            Mass matrices stacked with shape (RV_size, ndof, ndof).
+
+        Examples
+        --------
+        >>> import ross.stochastic as srs
+        >>> rotors = srs.st_rotor_example()
+        >>> rotors.M().shape
+        (10, 28, 28)
+        >>> np.allclose(rotors.M()[3], list(iter(rotors))[3].M())
+        True
+        """
+        return self._assemble("M")
+
+    def K(self, frequency):
+        """Stiffness matrices for the random rotor instances.
+
+        Parameters
+        ----------
+        frequency : float
+            Excitation frequency.
+
+        Returns
+        -------
+        K0 : np.ndarray
+            Stiffness matrices stacked with shape (RV_size, ndof, ndof).
+
+        Examples
+        --------
+        >>> import ross.stochastic as srs
+        >>> rotors = srs.st_rotor_example()
+        >>> np.allclose(rotors.K(0)[3], list(iter(rotors))[3].K(0))
+        True
+        """
+        return self._assemble("K", frequency)
+
+    def C(self, frequency):
+        """Damping matrices for the random rotor instances.
+
+        Parameters
+        ----------
+        frequency : float
+            Excitation frequency.
+
+        Returns
+        -------
+        C0 : np.ndarray
+            Damping matrices stacked with shape (RV_size, ndof, ndof).
+
+        Examples
+        --------
+        >>> import ross.stochastic as srs
+        >>> rotors = srs.st_rotor_example()
+        >>> np.allclose(rotors.C(0)[3], list(iter(rotors))[3].C(0))
+        True
+        """
+        return self._assemble("C", frequency)
+
+    def G(self):
+        """Gyroscopic matrices for the random rotor instances.
+
+        Returns
+        -------
+        G0 : np.ndarray
+            Gyroscopic matrices stacked with shape (RV_size, ndof, ndof).
+
+        Examples
+        --------
+        >>> import ross.stochastic as srs
+        >>> rotors = srs.st_rotor_example()
+        >>> np.allclose(rotors.G()[3], list(iter(rotors))[3].G())
+        True
+        """
+        return self._assemble("G")
+
+    def run_modal(self, speed, n_modes=6, frequency=None, basis_size=None):
+        """Stochastic modal analysis for multiples rotor systems.
+
+        The eigenvalue problem is solved once for the mean rotor, whose
+        matrices are the average of the random rotors matrices. The left and
+        right eigenvectors of the lowest modes, together with the static
+        response of the mean rotor to unit loads on the degrees of freedom of
+        the random elements, are then used as a reduced basis to project the
+        state space matrices of every random rotor. Only a small eigenvalue
+        problem is solved for each sample, and the static vectors account for
+        the truncated modes in the eigenvalues perturbation. Each mode of the
+        mean rotor is tracked to the closest eigenvalue of the sample. The accuracy
+        improves with the basis size and the results are exact if the basis
+        spans all the degrees of freedom.
+
+        Parameters
+        ----------
+        speed : float
+            Rotor speed.
+        n_modes : int, optional
+            Number of modes to be calculated. Default is 6.
+        frequency : float, optional
+            Excitation frequency used to evaluate the frequency dependent
+            bearing coefficients. Default is the rotor speed.
+        basis_size : int, optional
+            Number of mean rotor modes used in the reduced basis.
+            Default is twice the number of modes.
+
+        Returns
+        -------
+        results.wn : array
+            Undamped natural frequencies with shape (n_modes, RV_size).
+        results.wd : array
+            Damped natural frequencies with shape (n_modes, RV_size).
+        results.log_dec : array
+            Logarithmic decrement with shape (n_modes, RV_size).
+
+        Examples
+        --------
+        >>> import ross.stochastic as srs
+        >>> rotors = srs.st_rotor_example()
+        >>> results = rotors.run_modal(speed=0, n_modes=4)
+        >>> results.wn.shape
+        (4, 10)
+        >>> wn = np.array([rotor.run_modal(0).wn[:4] for rotor in iter(rotors)]).T
+        >>> np.allclose(results.wn, wn, rtol=1e-5)
+        True
+        >>> fig = results.plot(mode=0, var_list=["wn", "log_dec"])
+        >>> # fig.show()
+        """
+        ndof = self.ndof
+        if n_modes > ndof:
+            raise ValueError(
+                f"n_modes ({n_modes}) must not be greater than the number of "
+                f"degrees of freedom ({ndof})."
+            )
+        if basis_size is None:
+            basis_size = 2 * n_modes
+        basis_size = min(max(basis_size, n_modes), ndof)
+        if frequency is None:
+            frequency = speed
+
+        M = self.M()
+        K = self.K(frequency)
+        CG = self.C(frequency) + speed * self.G()
+
+        # reference eigenvalue problem A x = lambda B x for the mean rotor
+        Z = np.zeros((ndof, ndof))
+        I = np.eye(ndof)
+        A0 = np.block([[Z, I], [-K.mean(axis=0), -CG.mean(axis=0)]])
+        B0 = np.block([[I, Z], [Z, M.mean(axis=0)]])
+        evalues, evectors_l, evectors_r = la.eig(A0, B0, left=True, right=True)
+        idx = Rotor._index(evalues)[:basis_size]
+        reference = evalues[idx][:n_modes]
+
+        # static vectors for unit loads on the random elements degrees of freedom
+        _, random = self._assembly_template()
+        dofs = np.unique(
+            np.concatenate([np.zeros(0, dtype=int)] + [dofs for _, dofs, _ in random])
+        )
+        E = np.eye(2 * ndof)[:, np.concatenate([dofs, ndof + dofs])]
+        lu = la.lu_factor(A0)
+        static_r = la.lu_solve(lu, E)
+        static_l = la.lu_solve(lu, E, trans=1)
+
+        # real bases spanning the modes and their complex conjugates
+        Q = la.orth(
+            np.hstack([evectors_r[:, idx].real, evectors_r[:, idx].imag, static_r])
+        )
+        P = la.orth(
+            np.hstack([evectors_l[:, idx].real, evectors_l[:, idx].imag, static_l])
+        )
+        if P.shape != Q.shape:
+            P = Q
+        Q_t, Q_b = Q[:ndof], Q[ndof:]
+        P_t, P_b = P[:ndof], P[ndof:]
+
+        # reduced matrices for every sample
+        A_r = P_t.T @ Q_b - P_b.T @ (K @ Q_t + CG @ Q_b)
+        B_r = P_t.T @ Q_t + P_b.T @ M @ Q_b
+
+        wn = np.zeros((n_modes, self.RV_size))
+        wd = np.zeros((n_modes, self.RV_size))
+        log_dec = np.zeros((n_modes, self.RV_size))
+        for i in range(self.RV_size):
+            # each mean rotor mode is tracked to the closest sample eigenvalue
+            sample_evalues = la.eigvals(A_r[i], B_r[i])
+            evalues = np.zeros(n_modes, dtype=complex)
+            for j, evalue in enumerate(reference):
+                k = np.argmin(np.absolute(sample_evalues - evalue))
+                evalues[j] = sample_evalues[k]
+                sample_evalues = np.delete(sample_evalues, k)
+            evalues = evalues[np.lexsort((np.absolute(evalues), np.imag(evalues)))]
+            wn[:, i] = np.absolute(evalues)
+            wd[:, i] = np.imag(evalues)
+            damping_ratio = -np.real(evalues) / np.absolute(evalues)
+            log_dec[:, i] = 2 * np.pi * damping_ratio / np.sqrt(1 - damping_ratio ** 2)
+
+        results = ST_ModalResults(speed, wn, wd, log_dec)
+
+        return results
+
+    def run_static(self, tol=1e-8, max_iter=50):
+        """Stochastic static analysis for multiples rotor systems.
+
+        The static displacement due to gravity is calculated for every random
+        rotor, with the bearings replaced by rigid supports as in
+        Rotor.run_static(). The stiffness matrix of the mean rotor is factorized
+        once and used as a preconditioner for the iterative solution of each
+        sample system. Samples that do not converge are solved directly.
+
+        Parameters
+        ----------
+        tol : float, optional
+            Relative tolerance of the displacement correction.
+            Default is 1e-8.
+        max_iter : int, optional
+            Maximum number of iterations. Default is 50.
+
+        Returns
+        -------
+        results.disp_y : array
+            Shaft static displacement in the gravity direction with shape
+            (RV_size, n_nodes).
+        results.nodes_pos : list
+            Nodal axial positions.
+
+        Examples
+        --------
+        >>> import ross.stochastic as srs
+        >>> rotors = srs.st_rotor_example()
+        >>> results = rotors.run_static()
+        >>> disp_y = [rotor.run_static().disp_y for rotor in iter(rotors)]
+        >>> np.allclose(results.disp_y, disp_y)
+        True
+        >>> fig = results.plot_deformation(conf_interval=[90])
+        >>> # fig.show()
+        """
+        reference = self._sample_rotor(0)
+        if not len(reference.bearing_elements):
+            raise ValueError("Rotor has no bearings")
+
+        aux_brg = []
+        for elm in reference.bearing_elements:
+            if elm.n not in reference.nodes:
+                pass
+            elif elm.n_link in reference.nodes:
+                aux_brg.append(
+                    BearingElement(n=elm.n, n_link=elm.n_link, kxx=1e14, cxx=0)
+                )
+            else:
+                aux_brg.append(BearingElement(n=elm.n, kxx=1e14, cxx=0))
+        aux_rotor = Rotor(reference.shaft_elements, reference.disk_elements, aux_brg)
+        ndof = aux_rotor.ndof
+
+        K_brg = np.zeros((ndof, ndof))
+        for elm in aux_rotor.bearing_elements:
+            dofs = elm.dof_global_index
+            K_brg[np.ix_(dofs, dofs)] += elm.K(0)
+
+        keys = ["shaft_elements", "disk_elements"]
+        K = self._assemble("K", 0, keys=keys)[:, :ndof, :ndof] + K_brg
+        M = self._assemble("M", keys=keys)[:, :ndof, :ndof]
+
+        # gravity aceleration vector on shaft and disks nodes
+        g = 9.8065
+        grav = np.zeros(ndof)
+        grav[1 :: self.number_dof] = -g
+        F = M @ grav
+
+        # iterative solution preconditioned by the mean stiffness matrix
+        lu = la.lu_factor(K.mean(axis=0))
+        disp = la.lu_solve(lu, F.T).T
+        active = np.arange(self.RV_size)
+        for _ in range(max_iter):
+            residual = F[active] - np.einsum("sij,sj->si", K[active], disp[active])
+            correction = la.lu_solve(lu, residual.T).T
+            disp[active] += correction
+            converged = np.linalg.norm(correction, axis=1) <= tol * np.linalg.norm(
+                disp[active], axis=1
+            )
+            active = active[~converged]
+            if not len(active):
+                break
+
+        for i in active:
+            disp[i] = la.solve(K[i], F[i])
+
+        disp_y = disp[:, 1 :: self.number_dof]
+
+        results = ST_StaticResults(disp_y, self.nodes_pos)
+
+        return results
+
+    def run_campbell(
+        self,
+        speed_range,
+        frequencies=6,
+        frequency_type="wd",
+        n_jobs=1,
+        streaming=False,
+        percentiles=DEFAULT_PERCENTILES,
+        surrogate=None,
+        batch_size=None,
+        tolerance=None,
+        checkpoint=None,
+    ):
         """Stochastic Campbell diagram for multiples rotor systems.
 
         This function will calculate the damped or undamped natural frequencies
@@ -445,6 +1294,32 @@ class ST_Rotor(object):
             Choose between displaying results related to the undamped natural
             frequencies ("wn") or damped natural frequencies ("wd").
             The default is "wd".
+        n_jobs : int, optional
+            Number of worker processes used to evaluate the rotor samples.
+            If None, the number of processors is used. Default is 1.
+        streaming : bool, optional
+            If True, the samples are not stored. Running mean, variance and the
+            chosen percentiles are computed instead, so that memory does not
+            depend on the number of samples. Default is False.
+        percentiles : list, optional
+            Percentiles estimated when streaming is True. Only these percentiles
+            can be used by the results plots.
+            Default is (2.5, 5, 25, 50, 75, 95, 97.5).
+        surrogate : ST_PolynomialChaos, optional
+            If given, only the surrogate design of experiments is evaluated and
+            the results of the other samples are estimated with the surrogate
+            fitted to the random inputs. Default is None.
+        batch_size : int, optional
+            Number of samples evaluated between convergence checks and
+            checkpoints when streaming is True. Default is None (one batch).
+        tolerance : float, optional
+            If given and streaming is True, the evaluation stops when the mean
+            and percentiles change less than this relative tolerance between
+            two batches. Default is None.
+        checkpoint : str, pathlib.Path, optional
+            File used to save the statistics after each batch when streaming is
+            True. An existing checkpoint of the same analysis and arguments is
+            resumed. Default is None.
 
         Returns
         -------
@@ -474,21 +1349,59 @@ class ST_Rotor(object):
         """
         CAMP_size = len(speed_range)
         RV_size = self.RV_size
-        wd = np.zeros((frequencies, CAMP_size, RV_size))
-        log_dec = np.zeros((frequencies, CAMP_size, RV_size))
 
         # Monte Carlo - results storage
-        for i, rotor in enumerate(iter(self)):
-            results = rotor.run_campbell(speed_range, frequencies, frequency_type)
-            for j in range(frequencies):
-                wd[j, :, i] = results.wd[:, j]
-                log_dec[j, :, i] = results.log_dec[:, j]
+        samples_args = [(speed_range, frequencies, frequency_type)] * RV_size
+        if surrogate is None:
+            samples_results = None
+        else:
+            samples_results = self._surrogate_monte_carlo(
+                _campbell_sample, samples_args, surrogate, n_jobs=n_jobs
+            )
+        if streaming:
+            shape = (frequencies, CAMP_size)
+            wd, log_dec = self._streaming_monte_carlo(
+                _campbell_sample,
+                samples_args,
+                [
+                    ST_StreamingStatistics(shape, 2, percentiles),
+                    ST_StreamingStatistics(shape, 2, percentiles),
+                ],
+                n_jobs,
+                batch_size,
+                tolerance,
+                checkpoint,
+                samples_results,
+            )
+        else:
+            if samples_results is None:
+                samples_results = self._monte_carlo(
+                    _campbell_sample, samples_args, n_jobs
+                )
+            wd = np.zeros((frequencies, CAMP_size, RV_size))
+            log_dec = np.zeros((frequencies, CAMP_size, RV_size))
+            for i, (sample_wd, sample_log_dec) in enumerate(samples_results):
+                wd[..., i] = sample_wd
+                log_dec[..., i] = sample_log_dec
 
         results = ST_CampbellResults(speed_range, wd, log_dec)
 
         return results
 
-    def run_freq_response(self, speed_range, inp, out, modes=None):
+    def run_freq_response(
+        self,
+        speed_range,
+        inp,
+        out,
+        modes=None,
+        n_jobs=1,
+        streaming=False,
+        percentiles=DEFAULT_PERCENTILES,
+        surrogate=None,
+        batch_size=None,
+        tolerance=None,
+        checkpoint=None,
+    ):
         """Stochastic frequency response for multiples rotor systems.
 
         This method returns the frequency response for every rotor instance,
@@ -506,6 +1419,32 @@ class ST_Rotor(object):
         modes : list, optional
             Modes that will be used to calculate the frequency response
             (all modes will be used if a list is not given).
+        n_jobs : int, optional
+            Number of worker processes used to evaluate the rotor samples.
+            If None, the number of processors is used. Default is 1.
+        streaming : bool, optional
+            If True, the samples are not stored. Running mean, variance and the
+            chosen percentiles are computed instead, so that memory does not
+            depend on the number of samples. Default is False.
+        percentiles : list, optional
+            Percentiles estimated when streaming is True. Only these percentiles
+            can be used by the results plots.
+            Default is (2.5, 5, 25, 50, 75, 95, 97.5).
+        surrogate : ST_PolynomialChaos, optional
+            If given, only the surrogate design of experiments is evaluated and
+            the results of the other samples are estimated with the surrogate
+            fitted to the random inputs. Default is None.
+        batch_size : int, optional
+            Number of samples evaluated between convergence checks and
+            checkpoints when streaming is True. Default is None (one batch).
+        tolerance : float, optional
+            If given and streaming is True, the evaluation stops when the mean
+            and percentiles change less than this relative tolerance between
+            two batches. Default is None.
+        checkpoint : str, pathlib.Path, optional
+            File used to save the statistics after each batch when streaming is
+            True. An existing checkpoint of the same analysis and arguments is
+            resumed. Default is None.
 
         Returns
         -------
@@ -535,20 +1474,45 @@ class ST_Rotor(object):
         """
         FRF_size = len(speed_range)
         RV_size = self.RV_size
-        magnitude = np.zeros(((FRF_size, RV_size)))
-        phase = np.zeros(((FRF_size, RV_size)))
 
         # Monte Carlo - results storage
-        for i, rotor in enumerate(iter(self)):
-            results = rotor.run_freq_response(speed_range, modes)
-            magnitude[:, i] = results.magnitude[inp, out, :]
-            phase[:, i] = results.phase[inp, out, :]
+        samples_args = [(speed_range, modes, inp, out)] * RV_size
+        if surrogate is None:
+            samples_results = None
+        else:
+            samples_results = self._surrogate_monte_carlo(
+                _freq_response_sample, samples_args, surrogate, n_jobs=n_jobs,
+            )
+        if streaming:
+            magnitude, phase = self._streaming_monte_carlo(
+                _freq_response_sample,
+                samples_args,
+                [
+                    ST_StreamingStatistics((FRF_size,), 1, percentiles),
+                    ST_StreamingStatistics((FRF_size,), 1, percentiles),
+                ],
+                n_jobs,
+                batch_size,
+                tolerance,
+                checkpoint,
+                samples_results,
+            )
+        else:
+            if samples_results is None:
+                samples_results = self._monte_carlo(
+                    _freq_response_sample, samples_args, n_jobs
+                )
+            magnitude = np.zeros(((FRF_size, RV_size)))
+            phase = np.zeros(((FRF_size, RV_size)))
+            for i, (sample_magnitude, sample_phase) in enumerate(samples_results):
+                magnitude[:, i] = sample_magnitude
+                phase[:, i] = sample_phase
 
         results = ST_FrequencyResponseResults(speed_range, magnitude, phase)
 
         return results
 
-    def run_time_response(self, speed, force, time_range, ic=None):
+    def run_time_response(self, speed, force, time_range, ic=None, n_jobs=1):
         """Stochastic time response for multiples rotor systems.
 
         This function will take a rotor object and plot its time response
@@ -572,6 +1536,9 @@ class ST_Rotor(object):
             The initial conditions on the state vector (zero by default).
             Inputing a 2-dimensional array, the method considers the
             initial condition as a random variable.
+        n_jobs : int, optional
+            Number of worker processes used to evaluate the rotor samples.
+            If None, the number of processors is used. Default is 1.
 
         Returns
         -------
@@ -619,21 +1586,17 @@ class ST_Rotor(object):
 
         # force is not a random variable
         if len(force.shape) == 2:
-            # Monte Carlo - results storage
-            for i, rotor in enumerate(iter(self)):
-                t_, y, x = rotor.time_response(speed, force, time_range, ic)
-                xout[i] = x
-                yout[i] = y
+            samples_args = [(speed, force, time_range, ic)] * RV_size
 
         # force is a random variable
         if len(force.shape) == 3:
-            # Monte Carlo - results storage
-            i = 0
-            for rotor, F in zip(iter(self), force):
-                t_, y, x = rotor.time_response(speed, F, time_range, ic)
-                xout[i] = x
-                yout[i] = y
-                i += 1
+            samples_args = [(speed, F, time_range, ic) for F in force]
+
+        # Monte Carlo - results storage
+        samples_results = self._monte_carlo(_time_response_sample, samples_args, n_jobs)
+        for i, (y, x) in enumerate(samples_results):
+            xout[i] = x
+            yout[i] = y
 
         results = ST_TimeResponseResults(
             time_range, yout, xout, self.number_dof, self.nodes, self.nodes_pos
@@ -641,7 +1604,110 @@ class ST_Rotor(object):
 
         return results
 
-    def run_unbalance_response(self, node, magnitude, phase, frequency_range):
+    def _unbalance_response_batch(
+        self, samples_args, frequency_range, n_jobs=1, chunk_size=_BATCH_CHUNK_SIZE
+    ):
+        """Unbalance response of all the samples with batched linear algebra.
+
+        The response is linear in the unbalance forces, so the transfer columns
+        of the unbalance nodes are calculated once for each frequency, solving
+        the dynamic stiffness matrices stack, and the unbalance samples are
+        applied to all the rotor samples with a single complex product. The
+        samples are split in fixed size chunks, so that only a few matrices
+        stacks are kept in memory at a time, which are evaluated in worker
+        processes.
+
+        Parameters
+        ----------
+        samples_args : list
+            List with (node, magnitude, phase, frequency_range) for each sample.
+        frequency_range : array
+            Array with the frequencies.
+        n_jobs : int, optional
+            Number of worker processes. If 1, the samples are evaluated in the
+            current process. If None, the number of processors is used.
+            Default is 1.
+        chunk_size : int, optional
+            Number of samples whose matrices are stacked at a time.
+            Default is 64.
+
+        Returns
+        -------
+        forced_resp : np.ndarray
+            Complex response with shape (RV_size, freq_size, ndof).
+        """
+        ndof = self.ndof
+        node = samples_args[0][0]
+        nodes = np.atleast_1d(node)
+
+        # unbalance coefficients m * exp(j * phase) with shape (RV_size, n_nodes)
+        coefficients = np.array(
+            [
+                np.atleast_1d(magnitude) * np.exp(1j * np.atleast_1d(phase))
+                for _, magnitude, phase, _ in samples_args[: self.RV_size]
+            ]
+        )
+
+        # unit unbalance force vectors for each node
+        unit_forces = np.zeros((ndof, len(nodes)), dtype=complex)
+        for k, n in enumerate(nodes):
+            unit_forces[self.number_dof * n, k] += 1
+            unit_forces[self.number_dof * n + 1, k] += -1j
+
+        forced_resp = np.zeros(
+            (self.RV_size, len(frequency_range), ndof), dtype=complex
+        )
+        n_chunks = int(np.ceil(self.RV_size / chunk_size))
+        chunks = np.array_split(np.arange(self.RV_size), n_chunks)
+
+        if n_jobs == 1:
+            for chunk in chunks:
+                forced_resp[chunk] = _unbalance_response_chunk(
+                    self, list(chunk), unit_forces, coefficients[chunk], frequency_range
+                )
+            return forced_resp
+
+        n_workers = min(n_jobs or os.cpu_count(), n_chunks)
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = deque()
+            for chunk in chunks:
+                futures.append(
+                    (
+                        chunk,
+                        executor.submit(
+                            _unbalance_response_chunk,
+                            self,
+                            list(chunk),
+                            unit_forces,
+                            coefficients[chunk],
+                            frequency_range,
+                        ),
+                    )
+                )
+                if len(futures) >= 2 * n_workers:
+                    done, future = futures.popleft()
+                    forced_resp[done] = future.result()
+            while futures:
+                done, future = futures.popleft()
+                forced_resp[done] = future.result()
+
+        return forced_resp
+
+    def run_unbalance_response(
+        self,
+        node,
+        magnitude,
+        phase,
+        frequency_range,
+        n_jobs=1,
+        streaming=False,
+        percentiles=DEFAULT_PERCENTILES,
+        surrogate=None,
+        batch_size=None,
+        tolerance=None,
+        checkpoint=None,
+        batched=True,
+    ):
         """Stochastic unbalance response for multiples rotor systems.
 
         This method returns the unbalanced response for every rotor instance,
@@ -670,6 +1736,39 @@ class ST_Rotor(object):
             considered deterministic.
         frequency_range : list, float
             Array with the desired range of frequencies.
+        n_jobs : int, optional
+            Number of worker processes used to evaluate the rotor samples. With
+            batched=True, each worker solves a chunk of the samples.
+            If None, the number of processors is used. Default is 1.
+        streaming : bool, optional
+            If True, the samples are not stored. Running mean, variance and the
+            chosen percentiles are computed instead, so that memory does not
+            depend on the number of samples. Default is False.
+        percentiles : list, optional
+            Percentiles estimated when streaming is True. Only these percentiles
+            can be used by the results plots.
+            Default is (2.5, 5, 25, 50, 75, 95, 97.5).
+        surrogate : ST_PolynomialChaos, optional
+            If given, only the surrogate design of experiments is evaluated and
+            the results of the other samples are estimated with the surrogate
+            fitted to the random inputs. Default is None.
+        batch_size : int, optional
+            Number of samples evaluated between convergence checks and
+            checkpoints when streaming is True. Default is None (one batch).
+        tolerance : float, optional
+            If given and streaming is True, the evaluation stops when the mean
+            and percentiles change less than this relative tolerance between
+            two batches. Default is None.
+        checkpoint : str, pathlib.Path, optional
+            File used to save the statistics after each batch when streaming is
+            True. An existing checkpoint of the same analysis and arguments is
+            resumed. Default is None.
+        batched : bool, optional
+            If True and the samples are stored without a surrogate, the transfer
+            columns of the unbalance nodes are calculated once for each
+            frequency and all the unbalance samples are applied with a single
+            batched product, instead of evaluating each rotor sample with
+            Rotor.run_unbalance_response(). Default is True.
 
         Returns
         -------
@@ -707,10 +1806,6 @@ class ST_Rotor(object):
         args_dict = dict(
             node=node, magnitude=magnitude, phase=phase, frequency_range=frequency_range
         )
-
-        forced_resp = np.zeros((RV_size, freq_size, ndof), dtype=np.complex)
-        mag_resp = np.zeros((RV_size, freq_size, ndof))
-        phs_resp = np.zeros((RV_size, freq_size, ndof))
         is_random = []
 
         if (isinstance(node, int) and isinstance(magnitude, Iterable)) or (
@@ -725,22 +1820,64 @@ class ST_Rotor(object):
 
         # Monte Carlo - results storage
         if len(is_random):
-            i = 0
-            unbalance_args = self._random_var(is_random, args_dict)
-            for rotor, args in zip(iter(self), unbalance_args):
-                results = rotor.run_unbalance_response(*args)
-                forced_resp[i] = results.forced_resp.T
-                mag_resp[i] = results.magnitude.T
-                phs_resp[i] = results.phase.T
-                i += 1
+            samples_args = list(self._random_var(is_random, args_dict))
+        else:
+            samples_args = [(node, magnitude, phase, frequency_range)] * RV_size
+
+        if surrogate is None:
+            samples_results = None
+        else:
+            # unbalance magnitude and phase are surrogate inputs as well
+            inputs = np.array(
+                [
+                    np.hstack([np.ravel(arg[1]), np.ravel(arg[2])])
+                    for arg in samples_args
+                ]
+            )
+            if self.random_inputs is not None:
+                inputs = np.hstack([self.random_inputs, inputs])
+            inputs = inputs[:, np.ptp(inputs, axis=0) > 0]
+            samples_results = self._surrogate_monte_carlo(
+                _unbalance_response_sample, samples_args, surrogate, inputs, n_jobs,
+            )
+            # magnitude and phase are computed from the estimated response
+            samples_results = (
+                (resp, np.abs(resp), np.angle(resp)) for resp, _, _ in samples_results
+            )
+        if streaming:
+            shape = (freq_size, ndof)
+            forced_resp, mag_resp, phs_resp = self._streaming_monte_carlo(
+                _unbalance_response_sample,
+                samples_args,
+                [
+                    ST_StreamingStatistics(shape, 0, dtype=complex),
+                    ST_StreamingStatistics(shape, 0, percentiles),
+                    ST_StreamingStatistics(shape, 0, percentiles),
+                ],
+                n_jobs,
+                batch_size,
+                tolerance,
+                checkpoint,
+                samples_results,
+            )
+        elif batched and samples_results is None:
+            forced_resp = self._unbalance_response_batch(
+                samples_args, frequency_range, n_jobs
+            )
+            mag_resp = np.abs(forced_resp)
+            phs_resp = np.angle(forced_resp)
         else:
-            for i, rotor in enumerate(iter(self)):
-                results = rotor.run_unbalance_response(
-                    node, magnitude, phase, frequency_range
+            if samples_results is None:
+                samples_results = self._monte_carlo(
+                    _unbalance_response_sample, samples_args, n_jobs
                 )
-                forced_resp[i] = results.forced_resp.T
-                mag_resp[i] = results.magnitude.T
-                phs_resp[i] = results.phase.T
+            forced_resp = np.zeros((RV_size, freq_size, ndof), dtype=complex)
+            mag_resp = np.zeros((RV_size, freq_size, ndof))
+            phs_resp = np.zeros((RV_size, freq_size, ndof))
+            for i, (sample_resp, sample_mag, sample_phs) in enumerate(samples_results):
+                forced_resp[i] = sample_resp
+                mag_resp[i] = sample_mag
+                phs_resp[i] = sample_phs
 
         results = ST_ForcedResponseResults(
             forced_resp=forced_resp,
@@ -0,0 +1,108 @@
+"""STOCHASTIC ROSS sampling module.
+
+This module generates samples for the random variables of stochastic elements
+from their probability distributions.
+"""
+import numpy as np
+from scipy import stats
+
+__all__ = ["st_sampling"]
+
+
+def st_sampling(distributions, size, method="lhs", correlation=None, seed=None):
+    """Sample random variables from their probability distributions.
+
+    All the random variables are sampled together with a single design, so the
+    samples fill the joint input space evenly and the same confidence intervals
+    are reached with fewer rotor evaluations than with plain random sampling.
+
+    Correlations between the random variables are imposed with a Gaussian
+    copula: the design is mapped to standard normal space, correlated with the
+    Cholesky factor of the correlation matrix and mapped to each variable with
+    its inverse cumulative distribution function. The marginal distributions
+    are kept and the correlation matrix is the one of the underlying normal
+    variables. The correlated variables are no longer stratified: a Latin
+    hypercube design keeps one sample per interval only for the independent
+    variables, since the copula mixes the coordinates of the design.
+
+    Parameters
+    ----------
+    distributions : dict
+        Dictionary with the random variables names as keys and the frozen
+        scipy.stats distributions as values
+        (e.g. {"kxx": scipy.stats.norm(1e6, 1e5)}).
+    size : int
+        Number of samples.
+    method : str, optional
+        Sampling method. Options are "random" (plain Monte Carlo), "lhs"
+        (Latin hypercube), "sobol" and "halton". The last three use
+        scipy.stats.qmc, which requires scipy >= 1.7.
+        Default is "lhs".
+    correlation : array, optional
+        Correlation matrix between the random variables, in the same order of
+        the distributions dictionary. Default is None (independent variables).
+    seed : int, optional
+        Seed for the random number generator. Default is None.
+
+    Returns
+    -------
+    samples : dict
+        Dictionary with the random variables names as keys and the arrays of
+        samples as values, which can be passed to the stochastic elements.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import scipy.stats as st
+    >>> import ross.stochastic as srs
+    >>> samples = srs.st_sampling(
+    ...     {"kxx": st.norm(1e6, 1e5), "cxx": st.uniform(1e3, 1e2)},
+    ...     size=16,
+    ...     method="sobol",
+    ...     correlation=[[1, 0.8], [0.8, 1]],
+    ...     seed=0,
+    ... )
+    >>> samples["kxx"].shape
+    (16,)
+    >>> bearing = srs.ST_BearingElement(
+    ...     n=0, kxx=samples["kxx"], cxx=samples["cxx"], is_random=["kxx", "cxx"]
+    ... )
+    >>> len(list(iter(bearing)))
+    16
+    """
+    names = list(distributions.keys())
+    dim = len(names)
+
+    if method not in ["random", "lhs", "sobol", "halton"]:
+        raise ValueError(
+            f"Sampling method {method} is not available. "
+            f"Options are 'random', 'lhs', 'sobol' and 'halton'."
+        )
+
+    if method == "random":
+        u = np.random.default_rng(seed).random((size, dim))
+    else:
+        # imported here so that ross.stochastic can be used with scipy < 1.7
+        from scipy.stats import qmc
+
+        if method == "lhs":
+            u = qmc.LatinHypercube(d=dim, seed=seed).random(size)
+        elif method == "sobol":
+            u = qmc.Sobol(d=dim, seed=seed).random(size)
+        else:
+            u = qmc.Halton(d=dim, seed=seed).random(size)
+
+    if correlation is not None:
+        correlation = np.asarray(correlation, dtype=float)
+        if correlation.shape != (dim, dim):
+            raise ValueError(
+                f"Correlation matrix shape {correlation.shape} does not match "
+                f"the number of random variables ({dim})."
+            )
+        L = np.linalg.cholesky(correlation)
+        z = stats.norm.ppf(np.clip(u, 1e-12, 1 - 1e-12))
+        u = stats.norm.cdf(z @ L.T)
+
+    samples = {name: distributions[name].ppf(u[:, i]) for i, name in enumerate(names)}
+
+    return samples
@@ -0,0 +1,294 @@
+"""STOCHASTIC ROSS sensitivity module.
+
+This module computes global sensitivity indices of the random rotors outputs,
+showing which random variables drive the results scatter.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ross.stochastic.st_results import ST_SensitivityResults
+
+__all__ = ["st_sobol", "st_morris"]
+
+
+def _evaluate_design(rotor_func, output_func, names, design):
+    """Evaluate the output for a group of random variables samples.
+
+    This function is module level so that it can be sent to worker processes.
+
+    Parameters
+    ----------
+    rotor_func : callable
+        Function called as rotor_func(**samples), with an array of samples for
+        each random variable, returning the random rotors (e.g. an ST_Rotor).
+    output_func : callable
+        Function called as output_func(rotors) returning the outputs with the
+        samples in the first axis.
+    names : list
+        Random variables names.
+    design : np.ndarray
+        Random variables samples with shape (n_samples, n_variables).
+
+    Returns
+    -------
+    outputs : np.ndarray
+        Outputs with shape (n_samples, ...).
+    """
+    rotors = rotor_func(**{name: design[:, i] for i, name in enumerate(names)})
+    outputs = np.asarray(output_func(rotors))
+    if outputs.shape[:1] != (len(design),):
+        raise ValueError(
+            f"output_func must return the samples in the first axis. Expected "
+            f"{len(design)} samples, got an array with shape {outputs.shape}."
+        )
+    return outputs
+
+
+def _evaluate(rotor_func, output_func, names, design, n_jobs):
+    """Evaluate the output for all the samples, splitting them among processes.
+
+    Parameters
+    ----------
+    rotor_func, output_func, names, design
+        See _evaluate_design().
+    n_jobs : int
+        Number of worker processes. If None, the number of processors is used.
+
+    Returns
+    -------
+    outputs : np.ndarray
+        Outputs with shape (n_samples, ...).
+    """
+    if n_jobs == 1:
+        return _evaluate_design(rotor_func, output_func, names, design)
+
+    n_workers = min(n_jobs or os.cpu_count(), len(design))
+    chunks = np.array_split(design, n_workers)
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        outputs = list(
+            executor.map(
+                _evaluate_design,
+                [rotor_func] * n_workers,
+                [output_func] * n_workers,
+                [names] * n_workers,
+                chunks,
+            )
+        )
+
+    return np.concatenate(outputs)
+
+
+def _ppf(distributions, names, u):
+    """Map unit hypercube samples to the random variables distributions."""
+    u = np.clip(u, 1e-12, 1 - 1e-12)
+    return np.column_stack(
+        [distributions[name].ppf(u[:, i]) for i, name in enumerate(names)]
+    )
+
+
+def st_sobol(rotor_func, output_func, distributions, size, seed=None, n_jobs=1):
+    """Sobol sensitivity indices of the random rotors outputs.
+
+    The first order and total indices are estimated with Saltelli's sampling
+    scheme: two independent Sobol sequence designs A and B are combined into
+    the designs AB_i, where the column of the i-th random variable of A is
+    taken from B. The output is evaluated for size * (n_variables + 2)
+    samples, and the indices are obtained with the Saltelli (first order) and
+    Jansen (total) estimators.
+
+    The first order index is the fraction of the output variance due to a
+    random variable alone, and the total index also includes its interactions
+    with the other variables. Random variables with small total indices can be
+    fixed at their nominal values without changing the output distribution.
+
+    Parameters
+    ----------
+    rotor_func : callable
+        Function called as rotor_func(**samples), with an array of samples for
+        each random variable, returning the random rotors (e.g. an ST_Rotor).
+        It must be module level if n_jobs is not 1.
+    output_func : callable
+        Function called as output_func(rotors) returning the real outputs with
+        the samples in the first axis, e.g. the natural frequencies
+        rotors.run_modal(speed=0).wn.T. It must be module level if n_jobs is
+        not 1.
+    distributions : dict
+        Dictionary with the random variables names as keys and the frozen
+        scipy.stats distributions as values.
+    size : int
+        Number of samples of the base designs, preferably a power of 2.
+    seed : int, optional
+        Seed for the Sobol sequence scrambling. Default is None.
+        The Sobol sequence is generated with scipy.stats.qmc, which requires
+        scipy >= 1.7.
+    n_jobs : int, optional
+        Number of worker processes used to evaluate the samples.
+        If None, the number of processors is used. Default is 1.
+
+    Returns
+    -------
+    results : ST_SensitivityResults
+        Results with the "S1" (first order) and "ST" (total) indices, with
+        shape (n_variables, ...) for each output point.
+
+    Examples
+    --------
+    >>> import scipy.stats as st
+    >>> import ross.stochastic as srs
+    >>> def rotor_func(x1, x2, x3):
+    ...     return np.column_stack([x1, x2, x3])
+    >>> def output_func(x):
+    ...     return x[:, 0] + 2 * x[:, 1] + x[:, 0] * x[:, 1]
+    >>> results = srs.st_sobol(
+    ...     rotor_func,
+    ...     output_func,
+    ...     {name: st.uniform(0, 1) for name in ["x1", "x2", "x3"]},
+    ...     size=1024,
+    ...     seed=0,
+    ... )
+    >>> np.round(results.indices["ST"], 2)
+    array([0.27, 0.74, 0.  ])
+    """
+    # imported here so that ross.stochastic can be used with scipy < 1.7
+    from scipy.stats import qmc
+
+    names = list(distributions.keys())
+    dim = len(names)
+
+    u = qmc.Sobol(d=2 * dim, seed=seed).random(size)
+    A = _ppf(distributions, names, u[:, :dim])
+    B = _ppf(distributions, names, u[:, dim:])
+    AB = []
+    for i in range(dim):
+        AB_i = A.copy()
+        AB_i[:, i] = B[:, i]
+        AB.append(AB_i)
+    design = np.vstack([A, B] + AB)
+
+    outputs = _evaluate(rotor_func, output_func, names, design, n_jobs)
+    f_A = outputs[:size]
+    f_B = outputs[size : 2 * size]
+    f_AB = outputs[2 * size :].reshape((dim, size) + outputs.shape[1:])
+
+    variance = np.var(outputs[: 2 * size], axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        S1 = np.mean(f_B * (f_AB - f_A), axis=1) / variance
+        ST = 0.5 * np.mean((f_A - f_AB) ** 2, axis=1) / variance
+
+    return ST_SensitivityResults(names, dict(S1=S1, ST=ST))
+
+
+def st_morris(
+    rotor_func,
+    output_func,
+    distributions,
+    trajectories=10,
+    levels=4,
+    seed=None,
+    n_jobs=1,
+):
+    """Morris elementary effects screening of the random rotors outputs.
+
+    Each trajectory starts at a random point of a grid in the unit hypercube
+    and moves one random variable at a time, so the output is evaluated for
+    trajectories * (n_variables + 1) samples. The mean of the absolute
+    elementary effects (mu_star) ranks the random variables influence and
+    their standard deviation (sigma) shows nonlinear or interaction effects.
+    It is cheaper than the Sobol indices and suited to screen a large number
+    of random variables.
+
+    Parameters
+    ----------
+    rotor_func : callable
+        Function called as rotor_func(**samples), with an array of samples for
+        each random variable, returning the random rotors (e.g. an ST_Rotor).
+        It must be module level if n_jobs is not 1.
+    output_func : callable
+        Function called as output_func(rotors) returning the real outputs with
+        the samples in the first axis. It must be module level if n_jobs is
+        not 1.
+    distributions : dict
+        Dictionary with the random variables names as keys and the frozen
+        scipy.stats distributions as values. The grid levels are mapped to the
+        distributions quantiles.
+    trajectories : int, optional
+        Number of trajectories. Default is 10.
+    levels : int, optional
+        Number of grid levels, which should be even. Default is 4.
+    seed : int, optional
+        Seed for the random number generator. Default is None.
+    n_jobs : int, optional
+        Number of worker processes used to evaluate the samples.
+        If None, the number of processors is used. Default is 1.
+
+    Returns
+    -------
+    results : ST_SensitivityResults
+        Results with the "mu", "mu_star" and "sigma" indices, with shape
+        (n_variables, ...) for each output point. The elementary effects are
+        computed with respect to the random variables quantiles.
+
+    Examples
+    --------
+    >>> import scipy.stats as st
+    >>> import ross.stochastic as srs
+    >>> def rotor_func(x1, x2, x3):
+    ...     return np.column_stack([x1, x2, x3])
+    >>> def output_func(x):
+    ...     return x[:, 0] + 2 * x[:, 1]
+    >>> results = srs.st_morris(
+    ...     rotor_func,
+    ...     output_func,
+    ...     {name: st.uniform(0, 1) for name in ["x1", "x2", "x3"]},
+    ...     seed=0,
+    ... )
+    >>> np.round(results.indices["mu_star"], 2)
+    array([1., 2., 0.])
+    """
+    names = list(distributions.keys())
+    dim = len(names)
+    rng = np.random.default_rng(seed)
+    delta = levels / (2 * (levels - 1))
+
+    # trajectories in the grid {0, 1 / (levels - 1), ..., 1}
+    grid = np.zeros((trajectories, dim + 1, dim))
+    steps = np.zeros((trajectories, dim), dtype=int)
+    signs = np.zeros((trajectories, dim))
+    for t in range(trajectories):
+        x = rng.integers(0, levels, dim) / (levels - 1)
+        grid[t, 0] = x
+        for j, i in enumerate(rng.permutation(dim)):
+            if x[i] + delta > 1:
+                sign = -1.0
+            elif x[i] - delta < 0:
+                sign = 1.0
+            else:
+                sign = rng.choice([-1.0, 1.0])
+            x = x.copy()
+            x[i] += sign * delta
+            grid[t, j + 1] = x
+            steps[t, j] = i
+            signs[t, j] = sign
+
+    # grid levels mapped to the centers of equiprobable intervals
+    u = (grid.reshape(-1, dim) * (levels - 1) + 0.5) / levels
+    design = _ppf(distributions, names, u)
+
+    outputs = _evaluate(rotor_func, output_func, names, design, n_jobs)
+    outputs = outputs.reshape((trajectories, dim + 1) + outputs.shape[1:])
+    step = delta * (levels - 1) / levels
+
+    effects = np.zeros((dim, trajectories) + outputs.shape[2:])
+    for t in range(trajectories):
+        for j in range(dim):
+            effects[steps[t, j], t] = (outputs[t, j + 1] - outputs[t, j]) / (
+                signs[t, j] * step
+            )
+
+    mu = np.mean(effects, axis=1)
+    mu_star = np.mean(np.abs(effects), axis=1)
+    sigma = np.std(effects, axis=1, ddof=1) if trajectories > 1 else 0 * mu
+
+    return ST_SensitivityResults(names, dict(mu=mu, mu_star=mu_star, sigma=sigma))
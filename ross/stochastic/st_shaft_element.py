@@ -4,13 +4,14 @@ This module creates an instance of random shaft element for stochastic
 analysis.
 """
 from ross.shaft_element import ShaftElement
+from ross.stochastic.st_element import ST_Element
 from ross.stochastic.st_materials import ST_Material
 from ross.stochastic.st_results_elements import plot_histogram
 
 __all__ = ["ST_ShaftElement", "st_shaft_example"]
 
 
-class ST_ShaftElement:
+class ST_ShaftElement(ST_Element):
     """Random shaft element.
 
     Creates an object containing a generator with random instances of
@@ -84,6 +85,8 @@ class ST_ShaftElement:
     5
     """
 
+    element_class = ShaftElement
+
     def __init__(
         self,
         L,
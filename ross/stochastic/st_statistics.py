@@ -0,0 +1,299 @@
+"""STOCHASTIC ROSS statistics module.
+
+This module computes Monte Carlo statistics on the fly, without storing the
+samples.
+"""
+import numpy as np
+
+__all__ = ["ST_StreamingStatistics"]
+
+DEFAULT_PERCENTILES = (2.5, 5, 25, 50, 75, 95, 97.5)
+
+
+class ST_StreamingStatistics:
+    """Running statistics for a stream of random samples.
+
+    This class updates the mean, the variance (Welford's algorithm) and a set of
+    percentiles (P-square algorithm) of each output point every time a new
+    sample is added, so the memory used does not depend on the number of
+    samples.
+
+    The object behaves as the array of stacked samples for np.mean and
+    np.percentile along the samples axis, so it can be used in place of the
+    samples array by the stochastic results classes.
+
+    Parameters
+    ----------
+    shape : tuple
+        Shape of a single sample.
+    sample_axis : int, optional
+        Position of the samples axis in the equivalent array of stacked samples.
+        Default is 0.
+    percentiles : list, optional
+        Sequence of percentiles to be estimated, which must be between 0 and 100
+        inclusive. Only these percentiles are available after the samples are
+        added, so a confidence interval p requires the percentiles 50 +- p / 2.
+        Default is (2.5, 5, 25, 50, 75, 95, 97.5).
+    dtype : data-type, optional
+        Samples data type. Percentiles are not estimated for complex samples.
+        Default is float.
+
+    Attributes
+    ----------
+    n : int
+        Number of samples added.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from ross.stochastic.st_statistics import ST_StreamingStatistics
+    >>> samples = np.random.normal(10, 2, (10000, 3))
+    >>> stats = ST_StreamingStatistics((3,), percentiles=[50])
+    >>> for sample in samples:
+    ...     stats.update(sample)
+    >>> np.allclose(np.mean(stats, axis=0), np.mean(samples, axis=0))
+    True
+    >>> np.allclose(stats.var(), np.var(samples, axis=0, ddof=1))
+    True
+    >>> np.allclose(np.percentile(stats, 50, axis=0), 10, rtol=0.02)
+    True
+    """
+
+    def __init__(
+        self, shape, sample_axis=0, percentiles=DEFAULT_PERCENTILES, dtype=float
+    ):
+        self.shape = tuple(shape)
+        self.sample_axis = sample_axis
+        self.dtype = np.dtype(dtype)
+        self.n = 0
+
+        self._mean = np.zeros(self.shape, dtype=self.dtype)
+        self._m2 = np.zeros(self.shape)
+
+        if np.issubdtype(self.dtype, np.complexfloating):
+            percentiles = []
+        self.percentiles = np.array(sorted(set(percentiles)), dtype=float)
+        if np.any((self.percentiles < 0) | (self.percentiles > 100)):
+            raise ValueError("Percentiles must be in the range [0, 100].")
+
+        # P-square markers, one set of 5 markers for each percentile
+        p = self.percentiles[:, np.newaxis] / 100
+        self._dn = np.hstack([0 * p, p / 2, p, (1 + p) / 2, 0 * p + 1])
+        self._desired = 1 + 4 * self._dn
+        self._heights = np.zeros((len(self.percentiles), 5) + self.shape)
+        self._positions = np.zeros_like(self._heights)
+        self._positions[:] = np.arange(1, 6).reshape((1, 5) + (1,) * len(self.shape))
+        self._first_samples = []
+
+    def __array_function__(self, func, types, args, kwargs):
+        """Dispatch np.mean and np.percentile to the running statistics."""
+        if func is np.mean:
+            # np.mean(a, axis)
+            axis_position = 1
+        elif func is np.percentile:
+            # np.percentile(a, q, axis)
+            axis_position = 2
+        else:
+            return NotImplemented
+
+        if len(args) > axis_position:
+            axis = args[axis_position]
+        else:
+            axis = kwargs.get("axis", self.sample_axis)
+        if isinstance(axis, (int, np.integer)) and axis < 0:
+            axis += len(self.shape) + 1
+        if axis != self.sample_axis:
+            raise ValueError(
+                f"Statistics are only available along the samples axis "
+                f"({self.sample_axis})."
+            )
+
+        if func is np.mean:
+            return self.mean()
+        q = args[1] if len(args) > 1 else kwargs["q"]
+        return self.percentile(q)
+
+    def __getitem__(self, key):
+        """Get the statistics for a subset of the output points.
+
+        The key is given as for the equivalent array of stacked samples and must
+        select all the samples.
+
+        Parameters
+        ----------
+        key : int, slice, tuple
+            Index of the output points.
+
+        Returns
+        -------
+        stats : ST_StreamingStatistics
+            New object with the statistics for the selected points.
+        """
+        if not isinstance(key, tuple):
+            key = (key,)
+
+        ndim = len(self.shape) + 1
+        if any(k is Ellipsis for k in key):
+            i = [k is Ellipsis for k in key].index(True)
+            key = key[:i] + (slice(None),) * (ndim - len(key) + 1) + key[i + 1 :]
+        key = key + (slice(None),) * (ndim - len(key))
+
+        if key[self.sample_axis] != slice(None):
+            raise IndexError("The samples axis can not be indexed.")
+        out_key = key[: self.sample_axis] + key[self.sample_axis + 1 :]
+        sample_axis = len(
+            [k for k in key[: self.sample_axis] if not isinstance(k, (int, np.integer))]
+        )
+
+        new = object.__new__(ST_StreamingStatistics)
+        new.__dict__.update(self.__dict__)
+        new.sample_axis = sample_axis
+        new._mean = self._mean[out_key]
+        new._m2 = self._m2[out_key]
+        new.shape = new._mean.shape
+        p_key = (slice(None), slice(None)) + out_key
+        new._heights = self._heights[p_key]
+        new._positions = self._positions[p_key]
+        new._first_samples = [s[out_key] for s in self._first_samples]
+
+        return new
+
+    def update(self, sample):
+        """Add a new sample to the statistics.
+
+        Parameters
+        ----------
+        sample : array
+            New sample with the same shape of the output points.
+        """
+        x = np.asarray(sample, dtype=self.dtype).reshape(self.shape)
+        self.n += 1
+
+        delta = x - self._mean
+        self._mean = self._mean + delta / self.n
+        self._m2 = self._m2 + np.real(delta * np.conj(x - self._mean))
+
+        if not len(self.percentiles):
+            return
+
+        if self.n <= 5:
+            self._first_samples.append(x.copy())
+            if self.n == 5:
+                self._heights[:] = np.sort(self._first_samples, axis=0)
+            return
+
+        self._update_markers(x)
+
+    def _update_markers(self, x):
+        """Update the P-square markers with a new sample."""
+        q = self._heights
+        n = self._positions
+
+        # cell where the new sample falls and extreme markers
+        q[:, 0] = np.minimum(q[:, 0], x)
+        q[:, 4] = np.maximum(q[:, 4], x)
+        k = np.sum(x >= q[:, 1:4], axis=1)
+        cell = np.arange(5).reshape((1, 5) + (1,) * len(self.shape))
+        n += cell > k[:, np.newaxis]
+        self._desired = self._desired + self._dn
+        desired = self._desired.reshape(self._desired.shape + (1,) * len(self.shape))
+
+        # adjust the heights of the middle markers
+        for i in range(1, 4):
+            d = desired[:, i] - n[:, i]
+            move_up = (d >= 1) & (n[:, i + 1] - n[:, i] > 1)
+            move_down = (d <= -1) & (n[:, i - 1] - n[:, i] < -1)
+            s = np.where(move_up, 1.0, 0.0) - np.where(move_down, 1.0, 0.0)
+            if not np.any(s):
+                continue
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                parabolic = q[:, i] + s / (n[:, i + 1] - n[:, i - 1]) * (
+                    (n[:, i] - n[:, i - 1] + s)
+                    * (q[:, i + 1] - q[:, i])
+                    / (n[:, i + 1] - n[:, i])
+                    + (n[:, i + 1] - n[:, i] - s)
+                    * (q[:, i] - q[:, i - 1])
+                    / (n[:, i] - n[:, i - 1])
+                )
+                q_near = np.where(s > 0, q[:, i + 1], q[:, i - 1])
+                n_near = np.where(s > 0, n[:, i + 1], n[:, i - 1])
+                linear = q[:, i] + s * (q_near - q[:, i]) / (n_near - n[:, i])
+
+            use_parabolic = (q[:, i - 1] < parabolic) & (parabolic < q[:, i + 1])
+            new_height = np.where(use_parabolic, parabolic, linear)
+            q[:, i] = np.where(s != 0, new_height, q[:, i])
+            n[:, i] += s
+
+    def _estimates(self):
+        """Return the mean and the percentiles stacked in a single array."""
+        if self.n < 5 or not len(self.percentiles):
+            percentiles = [self.percentile(q) for q in self.percentiles]
+        else:
+            percentiles = list(self._heights[:, 2])
+        return np.array([self._mean] + percentiles)
+
+    def mean(self):
+        """Return the samples mean of each output point.
+
+        Returns
+        -------
+        mean : array
+            Mean of the samples.
+        """
+        return self._mean.copy()
+
+    def var(self):
+        """Return the samples variance of each output point.
+
+        Returns
+        -------
+        var : array
+            Unbiased variance of the samples.
+        """
+        if self.n < 2:
+            return np.full(self.shape, np.nan)
+        return self._m2 / (self.n - 1)
+
+    def std(self):
+        """Return the samples standard deviation of each output point.
+
+        Returns
+        -------
+        std : array
+            Standard deviation of the samples.
+        """
+        return np.sqrt(self.var())
+
+    def percentile(self, q):
+        """Return the estimated percentile of each output point.
+
+        Parameters
+        ----------
+        q : float
+            Percentile, which must be one of the percentiles tracked.
+
+        Returns
+        -------
+        percentile : array
+            Estimated percentile of the samples.
+
+        Raises
+        ------
+        ValueError
+            If the percentile is not tracked or no samples were added.
+        """
+        if self.n == 0:
+            raise ValueError("Percentiles are not available before adding samples.")
+        matches = np.isclose(self.percentiles, q)
+        if not np.any(matches):
+            raise ValueError(
+                f"Percentile {q} is not available. Tracked percentiles are "
+                f"{list(self.percentiles)}."
+            )
+        i = np.argmax(matches)
+
+        if self.n < 5:
+            return np.percentile(self._first_samples, q, axis=0)
+
+        return self._heights[i, 2].copy()
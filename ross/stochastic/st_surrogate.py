@@ -0,0 +1,243 @@
+"""STOCHASTIC ROSS surrogate module.
+
+This module fits surrogate models to the rotor responses as functions of the
+random inputs, so that the responses of a large number of random rotors can be
+estimated from a small number of rotor evaluations.
+"""
+from itertools import combinations_with_replacement
+
+import numpy as np
+import scipy.linalg as la
+from numpy.polynomial import legendre
+
+__all__ = ["ST_PolynomialChaos"]
+
+
+class ST_PolynomialChaos:
+    """Polynomial chaos expansion surrogate.
+
+    The responses are approximated by a total degree expansion of Legendre
+    polynomials of the random inputs, which are scaled to [-1, 1]. The
+    coefficients are obtained by least squares regression on a design of
+    experiments selected from the random inputs samples.
+
+    The number of terms of a total degree expansion grows as
+    (n_inputs + degree)! / (n_inputs! degree!). For many random inputs, the
+    hyperbolic truncation (q_norm < 1) keeps the terms of each single input and
+    drops most of the interaction terms.
+
+    Parameters
+    ----------
+    degree : int, optional
+        Maximum total degree of the polynomials. Default is 2.
+    design_size : int, optional
+        Number of rotor evaluations used to fit the expansion. Default is
+        twice the number of polynomial terms.
+    q_norm : float, optional
+        Hyperbolic truncation parameter, in (0, 1]. The terms with
+        sum(alpha ** q_norm) ** (1 / q_norm) <= degree are kept, where alpha
+        are the polynomial degrees in each input. Default is 1, the total
+        degree expansion.
+
+    Attributes
+    ----------
+    coefficients : np.ndarray
+        Expansion coefficients with shape (n_terms, n_outputs).
+    loo_error : np.ndarray
+        Leave-one-out error of each output, relative to the output variance.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from ross.stochastic.st_surrogate import ST_PolynomialChaos
+    >>> X = np.random.uniform(0, 1, (200, 2))
+    >>> Y = 1 + X[:, 0] * X[:, 1] + X[:, 1] ** 2
+    >>> pce = ST_PolynomialChaos(degree=2)
+    >>> design = pce.design(X)
+    >>> len(design)
+    12
+    >>> pce = pce.fit(X[design], Y[design])
+    >>> np.allclose(pce.predict(X), Y)
+    True
+    """
+
+    def __init__(self, degree=2, design_size=None, q_norm=1.0):
+        if not 0 < q_norm <= 1:
+            raise ValueError("q_norm must be in the range (0, 1].")
+        self.degree = degree
+        self.design_size = design_size
+        self.q_norm = q_norm
+        self.lower = None
+        self.upper = None
+        self.multi_indices = None
+        self.coefficients = None
+        self.loo_error = None
+
+    def _set_domain(self, X):
+        """Set the inputs bounds and the polynomial multi-indices."""
+        X = np.asarray(X, dtype=float)
+        self.lower = X.min(axis=0)
+        self.upper = X.max(axis=0)
+
+        # the multi-indices of each total degree are the multisets of inputs
+        # with that size, so only the kept terms are generated
+        n_inputs = X.shape[1]
+        multi_indices = []
+        for total in range(self.degree + 1):
+            terms = []
+            for inputs in combinations_with_replacement(range(n_inputs), total):
+                alpha = [0] * n_inputs
+                for i in inputs:
+                    alpha[i] += 1
+                terms.append(tuple(alpha))
+            multi_indices.extend(sorted(terms))
+        multi_indices = np.array(multi_indices, dtype=int).reshape(-1, n_inputs)
+
+        if self.q_norm < 1:
+            q_norm = np.sum(multi_indices ** self.q_norm, axis=1) ** (1 / self.q_norm)
+            multi_indices = multi_indices[q_norm <= self.degree + 1e-10]
+        self.multi_indices = multi_indices
+
+    def _scale(self, X):
+        """Scale the inputs to [-1, 1]."""
+        X = np.asarray(X, dtype=float)
+        span = self.upper - self.lower
+        span[span == 0] = 1
+        return 2 * (X - self.lower) / span - 1
+
+    def _basis(self, X):
+        """Evaluate the polynomials for each input sample.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            Inputs with shape (n_samples, n_inputs).
+
+        Returns
+        -------
+        psi : np.ndarray
+            Polynomials values with shape (n_samples, n_terms).
+        """
+        x = self._scale(X)
+        # legendre polynomials values with shape (degree + 1, n_samples, n_inputs)
+        P = np.array(
+            [
+                legendre.legval(x, np.eye(self.degree + 1)[k])
+                for k in range(self.degree + 1)
+            ]
+        )
+        columns = np.arange(x.shape[1])
+        psi = np.array(
+            [np.prod(P[alpha, :, columns], axis=0) for alpha in self.multi_indices]
+        ).T
+
+        return psi
+
+    def design(self, X):
+        """Select the design of experiments from the random inputs samples.
+
+        The samples are chosen one at a time as the farthest from the ones
+        already chosen (maximin distance), starting from the closest to the
+        center of the inputs domain.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            Random inputs samples with shape (n_samples, n_inputs).
+
+        Returns
+        -------
+        design : np.ndarray
+            Indexes of the samples to be evaluated.
+
+        Raises
+        ------
+        ValueError
+            If the expansion has more terms than the number of samples, so the
+            surrogate would need more rotor evaluations than the Monte Carlo.
+        """
+        self._set_domain(X)
+        x = self._scale(X)
+
+        n_terms = len(self.multi_indices)
+        if n_terms > len(x):
+            raise ValueError(
+                f"The expansion has {n_terms} polynomial terms, more than the "
+                f"{len(x)} random samples. Reduce the degree or the q_norm, or "
+                f"run the analysis without a surrogate."
+            )
+
+        size = self.design_size
+        if size is None:
+            size = 2 * len(self.multi_indices)
+        size = min(size, len(x))
+
+        design = [np.argmin(np.sum(x ** 2, axis=1))]
+        distance = np.sum((x - x[design[0]]) ** 2, axis=1)
+        while len(design) < size:
+            design.append(np.argmax(distance))
+            distance = np.minimum(distance, np.sum((x - x[design[-1]]) ** 2, axis=1))
+
+        return np.array(design)
+
+    def fit(self, X, Y):
+        """Fit the expansion coefficients.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            Inputs of the design with shape (n_design, n_inputs).
+        Y : np.ndarray
+            Outputs of the design with shape (n_design, ...). Complex outputs
+            have their real and imaginary parts fitted.
+
+        Returns
+        -------
+        self : ST_PolynomialChaos
+            The fitted surrogate.
+        """
+        if self.lower is None:
+            self._set_domain(X)
+
+        Y = np.asarray(Y)
+        self._output_shape = Y.shape[1:]
+        self._complex = np.iscomplexobj(Y)
+        Y = Y.reshape(len(Y), -1)
+        if self._complex:
+            Y = np.hstack([Y.real, Y.imag])
+
+        psi = self._basis(X)
+        if psi.shape[0] < psi.shape[1]:
+            raise ValueError(
+                f"The design has {psi.shape[0]} samples, less than the "
+                f"{psi.shape[1]} polynomial terms."
+            )
+        self.coefficients = la.lstsq(psi, Y)[0]
+
+        # leave-one-out error from the hat matrix diagonal
+        h = np.sum(psi * la.pinv(psi).T, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            residual = (Y - psi @ self.coefficients) / (1 - h[:, np.newaxis])
+            self.loo_error = np.mean(residual ** 2, axis=0) / np.var(Y, axis=0)
+
+        return self
+
+    def predict(self, X):
+        """Evaluate the surrogate.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            Inputs with shape (n_samples, n_inputs).
+
+        Returns
+        -------
+        Y : np.ndarray
+            Estimated outputs with shape (n_samples, ...).
+        """
+        Y = self._basis(X) @ self.coefficients
+        if self._complex:
+            n = Y.shape[1] // 2
+            Y = Y[:, :n] + 1j * Y[:, n:]
+
+        return Y.reshape((len(Y),) + self._output_shape)
@@ -2,8 +2,8 @@ import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 
-from ross.api_report import Report
-from ross.bearing_seal_element import BearingElement
+from ross.api_report import Report, _refine_peak, report_example
+from ross.bearing_seal_element import BearingElement, SealElement
 from ross.disk_element import DiskElement
 from ross.materials import steel
 from ross.rotor_assembly import Rotor
@@ -250,6 +250,33 @@ def test_report_static_forces(report0, report1, report2):
     assert_allclose(F_2[1], 77.22429001, atol=1e-6)
 
 
+def test_ucs_critical_speeds():
+    report = report_example()
+    df = report.ucs_critical_speeds()
+    assert_allclose(
+        df["critical_speed"],
+        [
+            np.nan,
+            410.871476,
+            1271.994389,
+            np.nan,
+            np.nan,
+            442.597037,
+            1398.261406,
+            np.nan,
+        ],
+        rtol=1e-6,
+    )
+    # critical speeds within and above the operation speed range
+    assert_allclose(df["separation_margin"][[1, 2]], [0, 0.271994], atol=1e-6)
+
+    fig = report.plot_ucs(stiffness_range=(5, 8))
+    assert "Critical Speeds" not in [trace.name for trace in fig.data]
+    fig = report.plot_ucs(stiffness_range=(5, 8), critical_speeds=True)
+    critical_speeds = [trace for trace in fig.data if trace.name == "Critical Speeds"]
+    assert_allclose(critical_speeds[0].y, df["critical_speed"])
+
+
 def test_unbalance_forces(report0, report1, report2):
     Uforce_00 = report0.unbalance_forces(mode=0)
     assert_allclose(Uforce_00, [71.23351373], atol=1e-6)
@@ -270,6 +297,49 @@ def test_unbalance_forces(report0, report1, report2):
     assert_allclose(Uforce_22, np.array([26.25803611, 38.84867878]), atol=1e-6)
 
 
+def test_refine_peak():
+    # single degree of freedom system: the peak and the half-power frequencies
+    # are obtained with a precision much higher than the grid spacing
+    k, m, c = 1e6, 10.0, 200.0
+
+    def amplitude(w):
+        return 1 / np.abs(k - m * w ** 2 + 1j * c * w)
+
+    freq_range = np.linspace(0, 600, 31)
+    magnitude = amplitude(freq_range)
+    wn, peak, w_low, w_high = _refine_peak(freq_range, magnitude, 16, amplitude)
+
+    assert_allclose(wn, np.sqrt(k / m - c ** 2 / (2 * m ** 2)), rtol=1e-7)
+    assert_allclose(peak, amplitude(wn))
+    assert_allclose(amplitude(np.array([w_low, w_high])), 0.707 * peak, rtol=1e-6)
+    assert w_low < wn < w_high
+
+
+def test_unbalance_response_refined():
+    report = report_example()
+    _, unbalance_dict = report.unbalance_response(mode=2, samples=101)
+    # the same results are obtained with the default frequency range
+    assert_allclose(unbalance_dict["Frequency"], [445.88712641], rtol=1e-6)
+    assert_allclose(unbalance_dict["Amplification factor"], [50.41743435], rtol=1e-6)
+
+
+def test_unbalance_responses():
+    report = report_example()
+    results = report.unbalance_responses([0, 2], samples=101)
+    assert [unbalance_dict["Mode"] for _, unbalance_dict in results] == [1, 3]
+
+    for mode, (fig, unbalance_dict) in zip([0, 2], results):
+        fig_mode, unbalance_dict_mode = report.unbalance_response(mode, samples=101)
+        assert_allclose(fig.data[0].y, fig_mode.data[0].y)
+        assert_allclose(
+            unbalance_dict["Amplification factor"],
+            unbalance_dict_mode["Amplification factor"],
+        )
+
+    # the load cases share a single frequency response
+    assert len([key for key in report._cache if key[0] == "freq_response"]) == 1
+
+
 def test_report_mode_shape(report0, report1, report2):
     _ = report0.mode_shape(mode=0)
     n1 = report0.node_min
@@ -302,6 +372,36 @@ def test_report_mode_shape(report0, report1, report2):
     assert nodes == [0, 50]
 
 
+def test_mode_analysis(report0, report2):
+    for report in [report0, report2]:
+        df = report.mode_analysis()
+        assert df["mode"].tolist() == [0, 1, 2, 3]
+        assert np.all((df["participation"] >= 0) & (df["participation"] <= 1))
+
+        for mode in range(4):
+            report.mode_shape(mode)
+            assert_allclose(df["node_min"][mode], report.node_min)
+            assert_allclose(df["node_max"][mode], report.node_max)
+            assert_allclose(df["unbalance"][mode], report.unbalance_forces(mode))
+
+        # a single modal and static analysis are shared by all the modes
+        assert len([key for key in report._cache if key[0] == "modal"]) == 1
+        assert len([key for key in report._cache if key[0] == "static"]) <= 1
+
+        # the mode shapes are evaluated once for the report modes and sliced
+        shapes = report._cache[("mode_shapes", id(report.rotor))][1]
+        assert shapes["modes"] == [0, 1, 2, 3]
+        df_sliced = report.mode_analysis([3, 1])
+        assert_allclose(df_sliced["participation"], df["participation"][[3, 1]])
+        assert report._cache[("mode_shapes", id(report.rotor))][1] is shapes
+
+    # the first modes of the rotor are translational and the second ones are
+    # nearly conical
+    df = report0.mode_analysis()
+    assert np.all(df["participation"][:2] > 0.9)
+    assert np.all(df["participation"][2:] < 0.05)
+
+
 def test_stability_level1(report0, report1, report2):
     D = [0.28, 0.35]
     H = [0.07, 0.07]
@@ -348,6 +448,44 @@ def test_stability_level1(report0, report1, report2):
     assert report2.condition == True
 
 
+def test_cross_coupled_log_dec(report0, report1, monkeypatch):
+    speed = 1000 * np.pi / 30
+    run_modal = Rotor.run_modal
+    calls = []
+
+    def counted_run_modal(rotor, *args, **kwargs):
+        calls.append(rotor)
+        return run_modal(rotor, *args, **kwargs)
+
+    # along the report1 sweep, the first non-backward mode changes and the last
+    # steps are solved with a new modal analysis
+    for report, nodes, n_calls in [
+        (report0, [3], 0),
+        (report1, report1.disk_nodes, 2),
+    ]:
+        bearings = report.rotor.bearing_elements
+        cross_coupling = np.linspace(0, 1e5, 4)[:, np.newaxis] * np.ones(len(nodes))
+        calls.clear()
+        with monkeypatch.context() as m:
+            m.setattr(Rotor, "run_modal", counted_run_modal)
+            log_dec = report._cross_coupled_log_dec(
+                bearings, nodes, cross_coupling, speed
+            )
+        assert len(calls) == n_calls
+
+        for Q, ld in zip(cross_coupling, log_dec):
+            aux_bearings = list(bearings) + [
+                BearingElement(n=n, kxx=0, cxx=0, kxy=q, kyx=-q)
+                for n, q in zip(nodes, Q)
+            ]
+            aux_rotor = Rotor(
+                report.rotor.shaft_elements, [], aux_bearings, rated_w=None
+            )
+            modal = aux_rotor.run_modal(speed=speed)
+            non_backward = modal.whirl_direction() != "Backward"
+            assert_allclose(ld, modal.log_dec[non_backward][0], rtol=1e-6)
+
+
 def test_stability_level2(report0, report1, report2):
     df0 = report0.stability_level_2()
     df1 = report1.stability_level_2()
@@ -365,3 +503,67 @@ def test_stability_level2(report0, report1, report2):
     assert_allclose(
         df1["log_dec"].tolist(), [0.14898201611278591, 0.14898201641839076,], atol=1e-6,
     )
+
+    df0_parallel = report0.stability_level_2(n_jobs=2)
+    assert df0_parallel["tags"].tolist() == df0["tags"].tolist()
+    assert_allclose(df0_parallel["log_dec"], df0["log_dec"], atol=1e-8)
+
+
+def test_stability_level2_components():
+    shaft_elem = [ShaftElement(0.25, 0, 0.05, material=steel) for _ in range(6)]
+    disk0 = DiskElement.from_geometry(
+        n=2, material=steel, width=0.07, i_d=0.05, o_d=0.28
+    )
+    bearings = [
+        BearingElement(0, kxx=1e6, cxx=1e3),
+        BearingElement(6, kxx=1e6, cxx=1e3),
+    ]
+    seal = SealElement(4, kxx=1e5, kxy=2e5, kyx=-2e5, cxx=100, tag="Seal")
+    rotor = Rotor(shaft_elem, [disk0], bearings + [seal])
+    report = Report(rotor, (400, 1000), 1200, (5, 8), [bearings], "compressor", "rad/s")
+
+    df = report.stability_level_2()
+
+    # each case matches the full rotor with the same components
+    for disks, brgs, log_dec in zip(
+        [[disk0], []], [bearings, bearings + [seal]], df["log_dec"]
+    ):
+        modal = Rotor(shaft_elem, disks, brgs).run_modal(report.maxspeed)
+        expected = modal.log_dec[modal.whirl_direction() != "Backward"][0]
+        assert_allclose(log_dec, expected, rtol=1e-6)
+
+
+def test_report_memoized_modal(report0):
+    modal = report0._run_modal(report0.maxspeed)
+    assert report0._run_modal(report0.maxspeed) is modal
+
+    _ = report0.mode_shape(0)
+    _ = report0.mode_shape(2)
+    # a single modal analysis for the report rotor
+    assert len([key for key in report0._cache if key[0] == "modal"]) == 1
+
+
+def test_report_run_parallel():
+    report = report_example()
+    assert len(report.bearing_clearance_lists) == 2
+    args = ([0.35, 0.35], [0.08, 0.08], [10000, 10000], 1000.0, [1.11, 1.14])
+    args += (37.65, 30.45)
+
+    serial = report.run(*args, n_jobs=1)
+    log_dec_a = report.log_dec_a
+    # the results of the clearance cases are not kept
+    assert report._cache == {}
+
+    parallel = report.run(*args, n_jobs=2)
+
+    assert_allclose(report.log_dec_a, log_dec_a)
+    assert len(parallel[0]) == len(serial[0]) == 2
+    assert len(parallel[1]) == len(serial[1]) == 4
+    assert_allclose(
+        parallel[3]["Amplification factor"].astype(float),
+        serial[3]["Amplification factor"].astype(float),
+    )
+    assert_allclose(parallel[6]["log_dec"], serial[6]["log_dec"])
+    for summary_parallel, summary_serial in zip(parallel[7], serial[7]):
+        assert_allclose(summary_parallel[0]["CSR"], summary_serial[0]["CSR"])
+        assert_allclose(summary_parallel[1]["logdec"], summary_serial[1]["logdec"])
@@ -231,6 +231,43 @@ def test_from_table():
     assert_allclose(bearing.kxx.coefficient[2], 53565700)
 
 
+def test_from_fluid_flow_speed_range(tmp_path):
+    fluid_flow_parameters = dict(
+        nz=30,
+        ntheta=20,
+        nradius=11,
+        length=0.03,
+        p_in=0.0,
+        p_out=0.0,
+        radius_rotor=0.0499,
+        radius_stator=0.05,
+        visc=0.1,
+        rho=860.0,
+    )
+    omega = np.linspace(100, 300, 4)
+    bearing = BearingElement.from_fluid_flow_speed_range(
+        0, omega=omega, load=525, n_jobs=2, file_name=tmp_path, **fluid_flow_parameters
+    )
+    assert_allclose(bearing.frequency, omega)
+
+    for i, w in enumerate(omega):
+        single_speed_bearing = BearingElement.from_fluid_flow(
+            0, omega=float(w), load=525, **fluid_flow_parameters
+        )
+        assert_allclose(bearing.K(w), single_speed_bearing.K(w))
+        assert_allclose(bearing.C(w), single_speed_bearing.C(w))
+
+    loaded_bearing = BearingElement.load(tmp_path)[0]
+    assert_allclose(loaded_bearing.frequency, omega)
+    assert_allclose(loaded_bearing.K(omega), bearing.K(omega))
+    assert_allclose(loaded_bearing.C(omega), bearing.C(omega))
+
+    with pytest.raises(ValueError):
+        BearingElement.from_fluid_flow_speed_range(
+            0, omega=omega, **fluid_flow_parameters
+        )
+
+
 def test_bearing_link_matrices():
     b0 = BearingElement(n=0, n_link=3, kxx=1, cxx=1)
     # fmt: off
@@ -327,3 +364,24 @@ def test_bearing_6dof_equality():
     assert bearing_6dof_0 == bearing_6dof_1
     assert not bearing_6dof_1 == bearing_6dof_2
     assert not bearing_6dof_0 == bearing_6dof_2
+
+
+def test_bearing_6dof_save_load(tmp_path):
+    frequency = np.array([100.0, 200.0, 300.0])
+    bearing = BearingElement6DoF(
+        n=0,
+        kxx=np.array([1e6, 2e6, 3e6]),
+        kyy=np.array([0.8e6, 1.6e6, 2.4e6]),
+        kzz=np.float64(1e5),
+        cxx=np.array([2e2, 3e2, 4e2]),
+        cyy=np.array([1.5e2, 2.5e2, 3.5e2]),
+        czz=np.float64(0.5e2),
+        frequency=frequency,
+    )
+    bearing.save(tmp_path)
+    loaded_bearing = BearingElement6DoF.load(tmp_path)[0]
+
+    assert loaded_bearing == bearing
+    assert_allclose(loaded_bearing.frequency, frequency)
+    assert_allclose(loaded_bearing.K(200.0), bearing.K(200.0))
+    assert_allclose(loaded_bearing.C(200.0), bearing.C(200.0))
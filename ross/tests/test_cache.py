@@ -0,0 +1,113 @@
+import os
+import time
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+import ross.cache
+from ross.bearing_seal_element import BearingElement
+from ross.cache import (
+    ResultsCache,
+    cached_arrays,
+    content_hash,
+    disable_cache,
+    enable_cache,
+)
+from ross.disk_element import DiskElement
+from ross.materials import Material, steel
+from ross.rotor_assembly import Rotor
+from ross.shaft_element import ShaftElement
+
+
+def build_rotor(kxx=1e6, material=steel, tag=None):
+    shaft_elem = [ShaftElement(0.25, 0, 0.05, material=material) for _ in range(6)]
+    disk = DiskElement.from_geometry(
+        n=3, material=steel, width=0.07, i_d=0.05, o_d=0.28, tag=tag
+    )
+    bearing0 = BearingElement(n=0, kxx=kxx, cxx=0)
+    bearing1 = BearingElement(n=6, kxx=1e6, cxx=0)
+    return Rotor(shaft_elem, [disk], [bearing0, bearing1])
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = enable_cache(tmp_path)
+    yield cache
+    disable_cache()
+
+
+def test_content_hash(monkeypatch):
+    key = content_hash(build_rotor(), 10.0)
+    assert key == content_hash(build_rotor(), 10.0)
+    # tags do not change the results
+    assert key == content_hash(build_rotor(tag="Disk A"), 10.0)
+
+    assert key != content_hash(build_rotor(), 20.0)
+    assert key != content_hash(build_rotor(kxx=2e6), 10.0)
+    material = Material(name="Steel", rho=7850, E=211e9, G_s=81.2e9)
+    assert key != content_hash(build_rotor(material=material), 10.0)
+
+    # results stored by other ross versions are not reused
+    monkeypatch.setattr(ross.cache, "__version__", "0.0.0")
+    assert key != content_hash(build_rotor(), 10.0)
+
+
+def test_results_cache_lru(tmp_path):
+    cache = ResultsCache(tmp_path)
+    now = time.time()
+    for i in range(3):
+        cache.set(f"key{i}", x=np.random.rand(1000))
+        # distinct modification times for the access order
+        os.utime(cache.path / f"key{i}.npz", (now - 100 + i, now - 100 + i))
+    file_size = (cache.path / "key0.npz").stat().st_size
+
+    # key0 is accessed, so key1 becomes the least recently used result
+    cache.get("key0")
+    cache.max_size = 3.5 * file_size
+    cache.set("key3", x=np.random.rand(1000))
+
+    assert cache.get("key1") is None
+    for key in ["key0", "key2", "key3"]:
+        assert cache.get(key) is not None
+    assert cache.size() <= cache.max_size
+
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_cached_run_modal(cache):
+    rotor = build_rotor()
+    modal = rotor.run_modal(speed=100.0)
+    assert len(list(cache.path.glob("*.npz"))) == 1
+
+    cached_modal = build_rotor().run_modal(speed=100.0)
+    assert len(list(cache.path.glob("*.npz"))) == 1
+    assert_allclose(cached_modal.wn, modal.wn)
+    assert_allclose(cached_modal.log_dec, modal.log_dec)
+
+    build_rotor(kxx=2e6).run_modal(speed=100.0)
+    assert len(list(cache.path.glob("*.npz"))) == 2
+
+
+def test_cached_freq_response(cache):
+    rotor = build_rotor()
+    speed_range = np.linspace(0, 500, 11)
+    response = rotor.run_freq_response(speed_range=speed_range)
+    # the modal analyses of each frequency are not stored
+    assert len(list(cache.path.glob("*.npz"))) == 1
+
+    cached_response = rotor.run_freq_response(speed_range=speed_range)
+    assert_allclose(cached_response.freq_resp, response.freq_resp)
+
+
+def test_cached_arrays_disabled():
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"x": np.ones(2)}
+
+    cached_arrays(compute, "analysis")
+    cached_arrays(compute, "analysis")
+    assert len(calls) == 2
@@ -9,7 +9,8 @@ from numpy.testing import assert_allclose
 from ross.fluid_flow import fluid_flow as flow
 from ross.fluid_flow.fluid_flow_coefficients import (
     calculate_damping_matrix, calculate_oil_film_force,
-    calculate_stiffness_matrix, find_equilibrium_position)
+    calculate_stiffness_matrix, find_equilibrium_position,
+    find_equilibrium_position_newton)
 from ross.fluid_flow.fluid_flow_geometry import move_rotor_center
 from ross.fluid_flow.fluid_flow_graphics import (
     plot_eccentricity, plot_pressure_surface, plot_pressure_theta,
@@ -260,6 +261,69 @@ def test_long_bearing():
     assert math.isclose(error, 0, abs_tol=0.02)
 
 
+def test_pressure_matrices_analytical():
+    for bearing, methods in [
+        (fluid_flow_short_numerical(), [0, 1]),
+        (fluid_flow_long_numerical(), [0]),
+    ]:
+        eccentricity_ratios = [0.1, bearing.eccentricity_ratio, 0.3]
+        for method in methods:
+            p_mat = bearing.calculate_pressure_matrix_analytical(method=method)
+            p_mats = bearing.calculate_pressure_matrices_analytical(
+                eccentricity_ratios, method=method
+            )
+            assert p_mats.shape == (3, bearing.nz, bearing.ntheta)
+            assert_allclose(p_mats[1], p_mat)
+            assert np.all(p_mats >= 0)
+            assert p_mats[2].max() > p_mats[0].max()
+
+
+def test_iterative_solvers():
+    bearing = fluid_flow_short_numerical()
+    bearing.calculate_pressure_matrix_numerical()
+    for solver in ["gmres", "bicgstab"]:
+        bearing_iterative = fluid_flow_short_numerical()
+        bearing_iterative.solver = solver
+        bearing_iterative.calculate_pressure_matrix_numerical()
+        assert bearing_iterative.solver_iterations > 0
+        assert bearing_iterative.solver_residual < 1e-08
+        assert_allclose(
+            bearing_iterative.p_mat_numerical,
+            bearing.p_mat_numerical,
+            rtol=1e-06,
+            atol=1e-06 * bearing.p_mat_numerical.max(),
+        )
+
+        move_rotor_center(bearing_iterative, bearing.radial_clearance / 1e04, 0)
+        bearing_iterative.calculate_coefficients()
+        bearing_iterative.calculate_pressure_matrix_numerical()
+        assert bearing_iterative.solver_residual < 1e-08
+
+    with pytest.raises(ValueError):
+        flow.FluidFlow(
+            8, 32, 8, 0.01, 10, 0, 0, 0.08, 0.1, 0.015, 860, load=10, solver="cg"
+        )
+
+
+def test_iterative_solver_warm_start():
+    iterations = {}
+    for warm_start in [True, False]:
+        bearing = fluid_flow_short_numerical()
+        bearing.solver = "gmres"
+        bearing.warm_start = warm_start
+        bearing.calculate_pressure_matrix_numerical()
+        preconditioner = bearing._preconditioner
+
+        move_rotor_center(bearing, bearing.radial_clearance / 1e06, 0)
+        bearing.calculate_coefficients()
+        bearing.calculate_pressure_matrix_numerical()
+        assert bearing._preconditioner is preconditioner
+        assert bearing.solver_residual < 1e-08
+        iterations[warm_start] = bearing.solver_iterations
+
+    assert iterations[True] < iterations[False]
+
+
 def test_oil_film_force_short():
     bearing = fluid_flow_short_numerical()
     bearing.calculate_pressure_matrix_numerical()
@@ -319,6 +383,45 @@ def test_find_equilibrium_position():
     )
 
 
+def test_find_equilibrium_position_newton():
+    for jacobian in ["broyden", "newton"]:
+        bearing = flow.fluid_flow_example2()
+        calculate_pressure = bearing.calculate_pressure_matrix_numerical
+        n_calls = []
+
+        def counted_pressure(*args, **kwargs):
+            n_calls.append(1)
+            return calculate_pressure(*args, **kwargs)
+
+        bearing.calculate_pressure_matrix_numerical = counted_pressure
+        iteration_map = find_equilibrium_position_newton(
+            bearing, tolerance=1e-03, jacobian=jacobian, return_iteration_map=True
+        )
+        assert len(iteration_map) <= 8
+        # one pressure field per position and two per stiffness calculation; the
+        # field is recalculated at the end only after a newton stiffness
+        if jacobian == "broyden":
+            assert len(n_calls) == len(iteration_map) + 2
+        else:
+            assert len(n_calls) == 3 * len(iteration_map) + 1
+        _, _, force_x, force_y = calculate_oil_film_force(
+            bearing, force_type="numerical"
+        )
+        assert_allclose(force_x, 0, atol=1e-03)
+        assert_allclose(force_y, bearing.load, atol=1e-03)
+        assert_allclose(iteration_map[-1][2], bearing.eccentricity)
+        assert_allclose(iteration_map[-1][3], bearing.attitude_angle)
+
+    with pytest.raises(ValueError):
+        find_equilibrium_position_newton(bearing, jacobian="secant")
+
+    # the rotor center starts on the clearance circle
+    move_rotor_center(bearing, 0, -bearing.radial_clearance - bearing.yi)
+    with pytest.raises(ValueError) as ex:
+        find_equilibrium_position_newton(bearing)
+    assert "inside the radial clearance" in str(ex.value)
+
+
 def test_move_rotor_center():
     bearing = fluid_flow_short_friswell()
     eccentricity = bearing.eccentricity
@@ -0,0 +1,130 @@
+import json
+
+import pandas as pd
+import pytest
+
+from ross.api_report import report_example
+from ross.report_batch import load_report_parameters, main, run_report_batch
+
+PARAMETERS = """
+[report]
+speed_range = [400, 1000]
+tripspeed = 1200
+bearing_stiffness_range = [5, 8]
+speed_units = "rad/s"
+
+[stability]
+D = [0.35, 0.35]
+H = [0.08, 0.08]
+HP = [10000, 10000]
+oper_speed = 1000.0
+RHO_ratio = [1.11, 1.14]
+RHOs = 37.65
+RHOd = 30.45
+
+[[clearance]]
+bearings = [
+    {n = 0, kxx = [0.7e7, 0.8e7, 0.9e7, 1.0e7], cxx = [2.0e3, 1.9e3, 1.8e3, 1.7e3], frequency = [400, 800, 1200, 1600]},
+    {n = 6, kxx = [0.7e7, 0.8e7, 0.9e7, 1.0e7], cxx = [2.0e3, 1.9e3, 1.8e3, 1.7e3], frequency = [400, 800, 1200, 1600]},
+]
+"""
+
+
+@pytest.fixture
+def batch(tmp_path):
+    rotors_path = tmp_path / "rotors"
+    rotors_path.mkdir()
+    report_example().rotor.save("rotor_a", rotors_path)
+
+    # saved rotor without elements
+    (rotors_path / "broken").mkdir()
+    (rotors_path / "broken" / "properties.toml").write_text("[parameters]\n")
+
+    # folders that are not saved rotors are ignored
+    (rotors_path / "other").mkdir()
+
+    parameters_file = tmp_path / "parameters.toml"
+    parameters_file.write_text(PARAMETERS)
+
+    return rotors_path, parameters_file, tmp_path / "reports"
+
+
+def test_report_batch(batch):
+    rotors_path, parameters_file, output_path = batch
+    exit_code = main(
+        [
+            str(rotors_path),
+            str(parameters_file),
+            "-o",
+            str(output_path),
+            "-j",
+            "2",
+            "--figures",
+            "json",
+        ]
+    )
+    assert exit_code == 1
+
+    summary = pd.read_csv(output_path / "summary.csv").set_index("rotor")
+    assert summary.index.tolist() == ["broken", "rotor_a"]
+    assert summary.loc["broken", "status"] == "error"
+    assert "Elements folder not found" in summary.loc["broken", "message"]
+    assert summary.loc["rotor_a", "status"] == "ok"
+
+    rotor_path = output_path / "rotor_a"
+    with open(rotor_path / "timing.json") as f:
+        timing = json.load(f)
+    stages = [
+        "load",
+        "rotor_instance",
+        "plot_ucs",
+        "mode_shape",
+        "unbalance_response",
+        "stability_level_1",
+        "stability_level_2",
+        "summary",
+        "write",
+    ]
+    assert list(timing["stages"]) == stages
+    assert len(timing["clearance_cases"]) == 1
+    assert timing["total"] >= sum(timing["stages"].values())
+    assert summary.columns.tolist()[3:] == stages
+
+    assert (rotor_path / "figures" / "ucs_case0.json").is_file()
+    assert (rotor_path / "figures" / "unbalance_response_case0_mode2.json").is_file()
+    assert not list((rotor_path / "figures").glob("*.html"))
+    df_lvl1 = pd.read_csv(rotor_path / "tables" / "summary_level_1.csv")
+    assert df_lvl1.loc[0, "tags"] == "rotor_a"
+    df_ucs = pd.read_csv(rotor_path / "tables" / "ucs_critical_speeds.csv")
+    assert df_ucs.columns.tolist()[:3] == ["case", "mode", "coefficient"]
+    df_lvl2 = pd.read_csv(rotor_path / "tables" / "stability_level_2.csv")
+    assert df_lvl2["tags"].tolist()[-1] == "rotor_a"
+    assert (output_path / "broken" / "error.log").is_file()
+
+
+def test_report_batch_timeout(batch):
+    rotors_path, parameters_file, output_path = batch
+    summary = run_report_batch(
+        rotors_path,
+        load_report_parameters(parameters_file),
+        output_path,
+        n_jobs=1,
+        timeout=0.5,
+        figure_formats=[],
+    )
+    summary = summary.set_index("rotor")
+    assert summary.loc["rotor_a", "status"] == "timeout"
+    assert summary.loc["rotor_a", "total"] < 5
+    assert not (output_path / "rotor_a" / "tables").exists()
+
+    with open(output_path / "timing.json") as f:
+        timings = json.load(f)
+    assert [timing["status"] for timing in timings] == ["error", "timeout"]
+
+
+def test_report_parameters_error(tmp_path):
+    parameters_file = tmp_path / "parameters.json"
+    parameters_file.write_text(json.dumps({"report": {}}))
+    with pytest.raises(ValueError) as ex:
+        load_report_parameters(parameters_file)
+    assert "The parameters file has no 'stability' table." in str(ex.value)
@@ -1421,6 +1421,24 @@ def test_save_load():
     assert a == b
 
 
+def test_save_tables(tmp_path):
+    rotor = rotor_example()
+    rotor.save("rotor", tmp_path)
+
+    # the tables match the ones written by saving each element individually
+    elements_path = tmp_path / "elements"
+    elements_path.mkdir()
+    for element in rotor.elements:
+        element.save(elements_path)
+    files = sorted(f.name for f in elements_path.glob("*.toml"))
+    assert files == ["BearingElement.toml", "DiskElement.toml", "ShaftElement.toml"]
+    for file in files:
+        saved = tmp_path / "rotor" / "elements" / file
+        assert saved.read_text() == (elements_path / file).read_text()
+
+    assert Rotor.load(tmp_path / "rotor") == rotor
+
+
 def test_global_index():
     i_d = 0
     o_d = 0.05
@@ -1615,3 +1633,48 @@ def test_modal_6dof(rotor_6dof):
 
     assert_almost_equal(modal.wn[:6], wn, decimal=3)
     assert_almost_equal(modal.wd[:6], wd, decimal=3)
+
+
+def test_ucs_critical_speeds():
+    shaft_elem = [ShaftElement(0.25, 0, 0.05, material=steel) for _ in range(6)]
+    disk0 = DiskElement.from_geometry(
+        n=2, material=steel, width=0.07, i_d=0.05, o_d=0.28
+    )
+    disk1 = DiskElement.from_geometry(
+        n=4, material=steel, width=0.07, i_d=0.05, o_d=0.28
+    )
+    stfx = [1e6, 2e7, 3e8]
+    stfy = [0.8e6, 1.6e7, 2.4e8]
+    freq = [0, 1000, 2000]
+    bearing0 = BearingElement(0, kxx=stfx, kyy=stfy, cxx=0, frequency=freq)
+    bearing1 = BearingElement(6, kxx=stfx, kyy=stfy, cxx=0, frequency=freq)
+    rotor = Rotor(shaft_elem, [disk0, disk1], [bearing0, bearing1])
+
+    df = rotor.ucs_critical_speeds()
+    assert df["mode"].tolist() == [0, 1, 2, 3] * 2
+    assert df["coefficient"].tolist() == ["kxx"] * 4 + ["kyy"] * 4
+
+    # the intersections are on the bearing coefficients and map curves, where
+    # the interpolated coefficients are positive
+    assert np.all(df["stiffness"].dropna() > 0)
+    for _, row in df.dropna().iterrows():
+        coefficient = getattr(bearing0, row["coefficient"])
+        assert_allclose(
+            coefficient.interpolated(row["critical_speed"]), row["stiffness"]
+        )
+        bearings = [BearingElement(n, kxx=row["stiffness"], cxx=0) for n in [0, 6]]
+        ucs_rotor = Rotor(shaft_elem, [disk0, disk1], bearings, n_eigen=16)
+        wn = ucs_rotor.run_modal(speed=0).wn[:8:2]
+        assert_allclose(wn[row["mode"]], row["critical_speed"], rtol=1e-6)
+
+    # the critical speeds do not depend on the bracketing samples
+    assert_allclose(
+        rotor.ucs_critical_speeds(num=20)["critical_speed"],
+        df["critical_speed"],
+        rtol=1e-6,
+    )
+
+    fig = rotor.plot_ucs()
+    assert "Critical Speeds" not in [trace.name for trace in fig.data]
+    fig = rotor.plot_ucs(critical_speeds=True)
+    assert "Critical Speeds" in [trace.name for trace in fig.data]
@@ -16,6 +16,7 @@ from ross.stochastic.st_disk_element import ST_DiskElement
 from ross.stochastic.st_point_mass import ST_PointMass
 from ross.stochastic.st_rotor_assembly import ST_Rotor, st_rotor_example
 from ross.stochastic.st_shaft_element import ST_ShaftElement
+from ross.stochastic.st_surrogate import ST_PolynomialChaos
 
 
 @pytest.fixture
@@ -462,3 +463,268 @@ def test_time_response(rotor1):
 
     assert results.yout.shape == (2, 5, 28)
     assert_allclose(results.yout[:, :, :8], yout, atol=1e-8)
+
+
+def test_parallel_monte_carlo(rotor1):
+    speed_range = np.linspace(0, 500, 3)
+    serial = rotor1.run_campbell(speed_range, frequencies=4)
+    parallel = rotor1.run_campbell(speed_range, frequencies=4, n_jobs=2)
+    assert_allclose(parallel.wd, serial.wd)
+    assert_allclose(parallel.log_dec, serial.log_dec)
+
+    freq_range = np.linspace(0, 500, 5)
+    m = [0.001, 0.002]
+    p = [0.0, np.pi]
+    serial = rotor1.run_unbalance_response(3, m, p, freq_range)
+    parallel = rotor1.run_unbalance_response(3, m, p, freq_range, n_jobs=2)
+    assert_allclose(parallel.forced_resp, serial.forced_resp)
+    assert_allclose(parallel.magnitude, serial.magnitude)
+
+    parallel = rotor1.run_unbalance_response(
+        3, m, p, freq_range, n_jobs=2, batched=False
+    )
+    assert_allclose(parallel.forced_resp, serial.forced_resp, rtol=1e-6, atol=1e-15)
+
+    # no samples to evaluate
+    for n_jobs in [1, 2]:
+        assert list(rotor1._monte_carlo(len, [], n_jobs, indexes=[])) == []
+
+
+def test_stacked_matrices(rotor1):
+    rotors = list(iter(rotor1))
+    assert rotor1.M().shape == (2, rotor1.ndof, rotor1.ndof)
+    for i, rotor in enumerate(rotors):
+        assert_allclose(rotor1.M()[i], rotor.M())
+        assert_allclose(rotor1.K(10)[i], rotor.K(10))
+        assert_allclose(rotor1.C(10)[i], rotor.C(10))
+        assert_allclose(rotor1.G()[i], rotor.G())
+
+    tim0 = ST_ShaftElement(
+        L=0.25, idl=0, odl=[0.05, 0.06], material=steel, is_random=["odl"]
+    )
+    tim1 = ShaftElement(L=0.25, idl=0, odl=0.05, material=steel)
+    disk0 = ST_DiskElement(n=1, m=[20, 30], Id=1, Ip=1, is_random=["m"])
+    bearing0 = BearingElement(0, kxx=1e6, cxx=0)
+    bearing1 = BearingElement(2, kxx=1e6, cxx=0)
+    st_rotor = ST_Rotor([tim0, tim1], [disk0], [bearing0, bearing1])
+    for i, rotor in enumerate(iter(st_rotor)):
+        assert_allclose(st_rotor.M()[i], rotor.M())
+        assert_allclose(st_rotor.K(0)[i], rotor.K(0))
+        assert_allclose(st_rotor.G()[i], rotor.G())
+
+
+def test_stacked_matrices_errors(rotor1, monkeypatch):
+    # errors raised by the element matrices are not hidden by the assembly
+    def K(self, frequency):
+        raise TypeError("error in the bearing stiffness")
+
+    monkeypatch.setattr(BearingElement, "K", K)
+    with pytest.raises(TypeError) as ex:
+        rotor1.K(10)
+    assert "error in the bearing stiffness" in str(ex.value)
+
+
+def test_streaming_statistics(rotor1):
+    speed_range = np.linspace(0, 500, 3)
+    results = rotor1.run_campbell(speed_range, frequencies=4)
+    streaming = rotor1.run_campbell(
+        speed_range, frequencies=4, streaming=True, percentiles=[50]
+    )
+    assert_allclose(np.mean(streaming.wd, axis=2), np.mean(results.wd, axis=2))
+    assert_allclose(
+        np.percentile(streaming.log_dec[0], 50, axis=1),
+        np.percentile(results.log_dec[0], 50, axis=1),
+    )
+    streaming.plot(percentile=[50])
+
+    freq_range = np.linspace(0, 500, 5)
+    # the streaming statistics are computed from the per sample evaluation
+    results = rotor1.run_unbalance_response(3, 0.001, 0.0, freq_range, batched=False)
+    streaming = rotor1.run_unbalance_response(3, 0.001, 0.0, freq_range, streaming=True)
+    assert_allclose(streaming.forced_resp.mean(), np.mean(results.forced_resp, axis=0))
+    assert_allclose(
+        np.mean(streaming.magnitude[..., 13], axis=0),
+        np.mean(results.magnitude[..., 13], axis=0),
+    )
+    streaming.plot(13, conf_interval=[90])
+
+
+def test_surrogate(rotor1):
+    assert rotor1.random_inputs.shape == (2, 2)
+
+    rotors = st_rotor_example()
+    speed_range = np.linspace(0, 500, 5)
+    results = rotors.run_campbell(speed_range, frequencies=4)
+    surrogate = ST_PolynomialChaos(degree=1, design_size=6)
+    estimate = rotors.run_campbell(speed_range, frequencies=4, surrogate=surrogate)
+    assert estimate.wd.shape == results.wd.shape
+    assert_allclose(estimate.wd, results.wd, rtol=2e-2)
+
+    freq_range = np.linspace(0, 500, 7)
+    m = np.linspace(0.001, 0.002, 10)
+    results = rotors.run_unbalance_response(3, m, 0.0, freq_range)
+    estimate = rotors.run_unbalance_response(
+        3, m, 0.0, freq_range, surrogate=ST_PolynomialChaos(degree=2)
+    )
+    assert_allclose(estimate.magnitude, np.abs(estimate.forced_resp))
+    assert_allclose(
+        estimate.magnitude[..., 13], results.magnitude[..., 13], rtol=0.1, atol=1e-7
+    )
+
+
+def test_incremental_monte_carlo(tmp_path):
+    rotors = st_rotor_example()
+    speed_range = np.linspace(0, 500, 3)
+    full = rotors.run_campbell(speed_range, frequencies=4, streaming=True)
+    assert full.wd.n == 10
+
+    # early stop with a loose tolerance
+    checkpoint = tmp_path / "campbell.pkl"
+    early = rotors.run_campbell(
+        speed_range,
+        frequencies=4,
+        streaming=True,
+        batch_size=2,
+        tolerance=1.0,
+        checkpoint=checkpoint,
+    )
+    assert early.wd.n == 4
+
+    # the same tolerance does not evaluate more samples
+    stopped = rotors.run_campbell(
+        speed_range,
+        frequencies=4,
+        streaming=True,
+        tolerance=1.0,
+        checkpoint=checkpoint,
+    )
+    assert stopped.wd.n == 4
+
+    # resume the stopped run without tolerance from the checkpoint
+    resumed = rotors.run_campbell(
+        speed_range, frequencies=4, streaming=True, checkpoint=checkpoint
+    )
+    assert resumed.wd.n == 10
+    assert_allclose(np.mean(resumed.wd, axis=2), np.mean(full.wd, axis=2))
+
+    # checkpoints of other analyses, arguments or percentiles are refused
+    other_runs = [
+        lambda: rotors.run_freq_response(
+            speed_range, 9, 9, streaming=True, checkpoint=checkpoint
+        ),
+        lambda: rotors.run_campbell(
+            2 * speed_range, frequencies=4, streaming=True, checkpoint=checkpoint,
+        ),
+        lambda: rotors.run_campbell(
+            speed_range,
+            frequencies=4,
+            streaming=True,
+            percentiles=[50],
+            checkpoint=checkpoint,
+        ),
+    ]
+    for run in other_runs:
+        with pytest.raises(ValueError) as ex:
+            run()
+        assert "was not created by this analysis" in str(ex.value)
+
+    with pytest.warns(UserWarning, match="did not converge"):
+        rotors.run_campbell(
+            speed_range, frequencies=4, streaming=True, batch_size=5, tolerance=1e-12
+        )
+
+
+def test_lazy_random_elements(monkeypatch):
+    tim0 = ST_ShaftElement(
+        L=[0.2, 0.3], idl=0, odl=0.05, material=steel, is_random=["L"]
+    )
+    tim1 = ShaftElement(L=0.25, idl=0, odl=0.05, material=steel)
+    disk0 = ST_DiskElement(n=1, m=[20, 30], Id=1, Ip=1, is_random=["m"])
+    bearing0 = BearingElement(0, kxx=1e6, cxx=0)
+    bearing1 = BearingElement(2, kxx=1e6, cxx=0)
+    disk_elements = [disk0]
+
+    # the mean nodes positions do not need a rotor for each sample
+    sample_rotor = ST_Rotor._sample_rotor
+    samples = []
+
+    def counted_sample_rotor(self, idx):
+        samples.append(idx)
+        return sample_rotor(self, idx)
+
+    with monkeypatch.context() as m:
+        m.setattr(ST_Rotor, "_sample_rotor", counted_sample_rotor)
+        st_rotor = ST_Rotor([tim0, tim1], disk_elements, [bearing0, bearing1])
+    assert samples == [0]
+
+    # random elements are not converted to lists of elements
+    assert disk_elements == [disk0]
+    assert st_rotor["disk_elements"][0] is disk0
+    assert st_rotor.RV_size == 2
+    assert_allclose(st_rotor.nodes_pos, [0, 0.25, 0.5])
+
+    rotors = list(iter(st_rotor))
+    assert rotors[1].disk_elements[0].m == 30
+    assert_allclose(rotors[0].nodes_pos, [0, 0.2, 0.45])
+
+
+def test_run_modal(rotor1):
+    rotors = list(iter(rotor1))
+    for speed in [0, 500]:
+        results = rotor1.run_modal(speed, n_modes=4)
+        modal = [rotor.run_modal(speed) for rotor in rotors]
+        assert results.wn.shape == (4, rotor1.RV_size)
+        assert_allclose(results.wn, np.array([m.wn[:4] for m in modal]).T, rtol=1e-5)
+        assert_allclose(results.wd, np.array([m.wd[:4] for m in modal]).T, rtol=1e-5)
+        assert_allclose(
+            results.log_dec, np.array([m.log_dec[:4] for m in modal]).T, rtol=1e-4
+        )
+
+    # the full basis gives the exact eigenvalues
+    results = rotor1.run_modal(0, n_modes=4, basis_size=rotor1.ndof)
+    wn = np.array([rotor.run_modal(0).wn[:4] for rotor in rotors]).T
+    assert_allclose(results.wn, wn, rtol=1e-8)
+
+    with pytest.raises(ValueError) as ex:
+        rotor1.run_modal(0, n_modes=rotor1.ndof + 1)
+    assert "must not be greater than" in str(ex.value)
+
+
+def test_run_static(rotor1):
+    results = rotor1.run_static()
+    disp_y = [np.ravel(rotor.run_static().disp_y) for rotor in iter(rotor1)]
+    assert results.disp_y.shape == (rotor1.RV_size, len(rotor1.nodes))
+    assert_allclose(results.disp_y, disp_y)
+
+    # random shaft elements
+    tim0 = ST_ShaftElement(
+        L=0.25, idl=0, odl=[0.04, 0.05, 0.06], material=steel, is_random=["odl"],
+    )
+    tim1 = ShaftElement(L=0.25, idl=0, odl=0.05, material=steel)
+    bearing0 = BearingElement(0, kxx=1e6, cxx=0)
+    bearing1 = BearingElement(2, kxx=1e6, cxx=0)
+    st_rotor = ST_Rotor([tim0, tim1], [], [bearing0, bearing1])
+    results = st_rotor.run_static()
+    disp_y = [np.ravel(rotor.run_static().disp_y) for rotor in iter(st_rotor)]
+    assert_allclose(results.disp_y, disp_y)
+
+
+def test_batched_unbalance_response(rotor1):
+    freq_range = np.linspace(0, 500, 11)
+    m = [0.001, 0.002]
+    p = [0.0, np.pi / 3]
+    for args in [(3, m, p), (3, 0.001, 0.0), ([2, 4], [0.001, 0.002], [0.0, 1.0])]:
+        batched = rotor1.run_unbalance_response(*args, freq_range)
+        sampled = rotor1.run_unbalance_response(*args, freq_range, batched=False)
+        assert batched.forced_resp.shape == (rotor1.RV_size, 11, rotor1.ndof)
+        assert_allclose(batched.forced_resp, sampled.forced_resp, rtol=1e-6, atol=1e-15)
+        assert_allclose(batched.magnitude, sampled.magnitude, rtol=1e-6, atol=1e-15)
+
+    # fixed size chunks, evaluated serially and in worker processes
+    samples_args = [(3, mi, pi, freq_range) for mi, pi in zip(m, p)]
+    full = rotor1._unbalance_response_batch(samples_args, freq_range)
+    for n_jobs in [1, 2]:
+        chunked = rotor1._unbalance_response_batch(
+            samples_args, freq_range, n_jobs, chunk_size=1
+        )
+        assert_allclose(chunked, full)
@@ -0,0 +1,55 @@
+"""Tests file.
+
+Tests for:
+    st_sampling.py
+"""
+import numpy as np
+import pytest
+import scipy.stats as st
+from numpy.testing import assert_allclose
+
+from ross.stochastic.st_sampling import st_sampling
+
+
+@pytest.fixture
+def distributions():
+    return {"kxx": st.norm(1e6, 1e5), "cxx": st.uniform(1e3, 1e2)}
+
+
+def test_sampling_methods(distributions):
+    for method in ["random", "lhs", "sobol", "halton"]:
+        samples = st_sampling(distributions, 64, method=method, seed=1)
+        assert samples["kxx"].shape == (64,)
+        assert np.all((samples["cxx"] >= 1e3) & (samples["cxx"] <= 1.1e3))
+
+    # repeatable with the same seed
+    s1 = st_sampling(distributions, 16, seed=3)
+    s2 = st_sampling(distributions, 16, seed=3)
+    assert_allclose(s1["kxx"], s2["kxx"])
+
+
+def test_latin_hypercube_strata(distributions):
+    size = 20
+    samples = st_sampling(distributions, size, method="lhs", seed=0)
+    u = distributions["cxx"].cdf(samples["cxx"])
+    # one sample for each of the equiprobable intervals
+    assert_allclose(np.sort(np.floor(u * size)), np.arange(size))
+
+
+def test_sampling_correlation(distributions):
+    samples = st_sampling(
+        distributions, 1024, method="sobol", correlation=[[1, 0.8], [0.8, 1]], seed=0,
+    )
+    rho = st.spearmanr(samples["kxx"], samples["cxx"])[0]
+    assert_allclose(rho, 0.8, atol=0.03)
+    assert_allclose(np.mean(samples["kxx"]), 1e6, rtol=1e-3)
+
+
+def test_sampling_errors(distributions):
+    with pytest.raises(ValueError) as ex:
+        st_sampling(distributions, 8, method="grid")
+    assert "Sampling method grid is not available" in str(ex.value)
+
+    with pytest.raises(ValueError) as ex:
+        st_sampling(distributions, 8, correlation=np.eye(3))
+    assert "does not match the number of random variables" in str(ex.value)
@@ -0,0 +1,87 @@
+"""Tests file.
+
+Tests for:
+    st_sensitivity.py
+"""
+import numpy as np
+import pytest
+import scipy.stats as st
+from numpy.testing import assert_allclose
+
+from ross.bearing_seal_element import BearingElement
+from ross.disk_element import DiskElement
+from ross.materials import steel
+from ross.shaft_element import ShaftElement
+from ross.stochastic.st_bearing_seal_element import ST_BearingElement
+from ross.stochastic.st_rotor_assembly import ST_Rotor
+from ross.stochastic.st_sensitivity import st_morris, st_sobol
+
+
+def linear_model(x1, x2, x3):
+    return np.column_stack([x1, x2, x3])
+
+
+def linear_output(x):
+    return np.column_stack([x[:, 0] + 2 * x[:, 1], x[:, 2]])
+
+
+def rotor_func(kxx, cxx):
+    shaft_elem = [ShaftElement(0.25, 0, 0.05, material=steel) for _ in range(6)]
+    disk = DiskElement.from_geometry(
+        n=3, material=steel, width=0.07, i_d=0.05, o_d=0.28
+    )
+    bearing0 = ST_BearingElement(n=0, kxx=kxx, cxx=cxx, is_random=["kxx", "cxx"])
+    bearing1 = BearingElement(n=6, kxx=1e6, cxx=0)
+    return ST_Rotor(shaft_elem, [disk], [bearing0, bearing1])
+
+
+def rotor_output(rotors):
+    return rotors.run_modal(speed=0, n_modes=2).wn.T
+
+
+@pytest.fixture
+def distributions():
+    return {name: st.uniform(0, 1) for name in ["x1", "x2", "x3"]}
+
+
+def test_sobol(distributions):
+    results = st_sobol(linear_model, linear_output, distributions, 256, seed=0)
+    assert results.names == ["x1", "x2", "x3"]
+    assert results.indices["S1"].shape == (3, 2)
+    assert_allclose(results.indices["S1"][:, 0], [0.2, 0.8, 0], atol=0.02)
+    assert_allclose(results.indices["ST"][:, 0], [0.2, 0.8, 0], atol=0.02)
+    assert_allclose(results.indices["ST"][:, 1], [0, 0, 1], atol=0.02)
+
+    parallel = st_sobol(
+        linear_model, linear_output, distributions, 256, seed=0, n_jobs=2
+    )
+    assert_allclose(parallel.indices["ST"], results.indices["ST"])
+
+    fig = results.plot(output=0)
+    assert len(fig.data) == 2
+
+
+def test_morris(distributions):
+    results = st_morris(linear_model, linear_output, distributions, seed=0)
+    assert_allclose(results.indices["mu_star"][:, 0], [1, 2, 0])
+    assert_allclose(results.indices["sigma"][:, 0], [0, 0, 0], atol=1e-12)
+
+    parallel = st_morris(linear_model, linear_output, distributions, seed=0, n_jobs=2)
+    assert_allclose(parallel.indices["mu"], results.indices["mu"])
+
+
+def test_rotor_sensitivity():
+    distributions = {"kxx": st.uniform(1e6, 1e6), "cxx": st.uniform(0, 1e3)}
+    results = st_sobol(rotor_func, rotor_output, distributions, 32, seed=0)
+    # the natural frequencies barely depend on the bearing damping
+    assert np.all(results.indices["ST"][1] < 1e-3)
+    assert np.all(results.indices["ST"][0] > 0.9)
+
+    results = st_morris(rotor_func, rotor_output, distributions, 4, seed=0)
+    assert np.all(results.indices["mu_star"][0] > 1e2 * results.indices["mu_star"][1])
+
+
+def test_output_shape_error(distributions):
+    with pytest.raises(ValueError) as ex:
+        st_sobol(linear_model, lambda x: x.T, distributions, 8)
+    assert "output_func must return the samples in the first axis" in str(ex.value)
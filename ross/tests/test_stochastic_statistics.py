@@ -0,0 +1,59 @@
+"""Tests file.
+
+Tests for:
+    st_statistics.py
+"""
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from ross.stochastic.st_statistics import ST_StreamingStatistics
+
+
+@pytest.fixture
+def samples():
+    return np.random.RandomState(0).normal(10, 2, (2000, 2, 3))
+
+
+def test_p_square_percentiles(samples):
+    stats = ST_StreamingStatistics((2, 3), percentiles=[5, 50, 95])
+    for sample in samples:
+        stats.update(sample)
+
+    assert stats.n > 5
+    for q in [5, 50, 95]:
+        assert_allclose(
+            np.percentile(stats, q, axis=0),
+            np.percentile(samples, q, axis=0),
+            rtol=0.03,
+        )
+
+
+def test_positional_axis(samples):
+    stats = ST_StreamingStatistics((3, 2), sample_axis=1, percentiles=[50])
+    for sample in samples:
+        stats.update(sample.T)
+    stacked = np.moveaxis(samples, 2, 0)
+
+    assert_allclose(np.mean(stats, 1), np.mean(stacked, 1))
+    assert_allclose(np.mean(stats, -2), np.mean(stacked, 1))
+    assert_allclose(
+        np.percentile(stats, 50, 1), np.percentile(stacked, 50, 1), rtol=0.03
+    )
+
+    with pytest.raises(ValueError) as ex:
+        np.mean(stats, 0)
+    assert "samples axis (1)" in str(ex.value)
+
+
+def test_percentile_errors():
+    stats = ST_StreamingStatistics((3,), percentiles=[50])
+    with pytest.raises(ValueError) as ex:
+        stats.percentile(50)
+    assert "before adding samples" in str(ex.value)
+
+    stats.update([1, 2, 3])
+    assert_allclose(stats.percentile(50), [1, 2, 3])
+    with pytest.raises(ValueError) as ex:
+        np.percentile(stats, 25, axis=0)
+    assert "Percentile 25 is not available" in str(ex.value)
@@ -0,0 +1,85 @@
+"""Tests file.
+
+Tests for:
+    st_surrogate.py
+"""
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from ross.stochastic.st_surrogate import ST_PolynomialChaos
+
+
+@pytest.fixture
+def inputs():
+    rng = np.random.default_rng(0)
+    return rng.uniform([1e5, 0.1], [1e6, 0.2], (500, 2))
+
+
+def test_polynomial_chaos_fit(inputs):
+    Y = np.stack(
+        [1 + inputs[:, 0] * inputs[:, 1], inputs[:, 1] ** 3 - inputs[:, 0] / 1e6],
+        axis=1,
+    )
+    pce = ST_PolynomialChaos(degree=3)
+    design = pce.design(inputs)
+    assert len(design) == 20
+    assert len(np.unique(design)) == 20
+
+    pce.fit(inputs[design], Y[design])
+    assert_allclose(pce.predict(inputs), Y, rtol=1e-8)
+    assert np.all(pce.loo_error < 1e-12)
+
+
+def test_polynomial_chaos_complex(inputs):
+    Y = (inputs[:, 0] + 1j * inputs[:, 1])[:, np.newaxis, np.newaxis] * np.ones(
+        (1, 3, 2)
+    )
+    pce = ST_PolynomialChaos(degree=1)
+    design = pce.design(inputs)
+    pce.fit(inputs[design], Y[design])
+    prediction = pce.predict(inputs)
+    assert prediction.shape == (500, 3, 2)
+    assert_allclose(prediction, Y)
+
+
+def test_polynomial_chaos_error(inputs):
+    pce = ST_PolynomialChaos(degree=2, design_size=3)
+    design = pce.design(inputs)
+    with pytest.raises(ValueError) as ex:
+        pce.fit(inputs[design], inputs[design, 0])
+    assert "less than the 6 polynomial terms" in str(ex.value)
+
+
+def test_polynomial_chaos_many_inputs():
+    rng = np.random.default_rng(0)
+    X = rng.uniform(0, 1, (1000, 25))
+    Y = 1 + X @ np.arange(25) + X[:, 0] * X[:, 24] + X[:, 3] ** 2
+
+    pce = ST_PolynomialChaos(degree=2)
+    design = pce.design(X)
+    # total degree terms: (25 + 2)! / (25! 2!)
+    assert pce.multi_indices.shape == (351, 25)
+    assert np.all(pce.multi_indices.sum(axis=1) <= 2)
+    assert len(np.unique(pce.multi_indices, axis=0)) == 351
+    assert len(design) == 702
+
+    pce.fit(X[design], Y[design])
+    assert_allclose(pce.predict(X), Y, rtol=1e-8)
+
+    # the hyperbolic truncation drops the interaction terms
+    pce = ST_PolynomialChaos(degree=2, q_norm=0.5)
+    pce.design(X)
+    assert pce.multi_indices.shape == (51, 25)
+    assert np.all(np.count_nonzero(pce.multi_indices, axis=1) <= 1)
+
+
+def test_polynomial_chaos_too_many_terms(inputs):
+    pce = ST_PolynomialChaos(degree=2)
+    with pytest.raises(ValueError) as ex:
+        pce.design(inputs[:5])
+    assert "6 polynomial terms, more than the 5 random samples" in str(ex.value)
+
+    with pytest.raises(ValueError) as ex:
+        ST_PolynomialChaos(q_norm=0)
+    assert "q_norm must be in the range (0, 1]" in str(ex.value)
@@ -126,9 +126,7 @@ setup(
     packages=find_packages(exclude=("tests",)),
     # If your package is a single module, use this instead of 'packages':
     # py_modules=['mypackage'],
-    # entry_points={
-    #     'console_scripts': ['mycli=mymodule:cli'],
-    # },
+    entry_points={"console_scripts": ["ross-report=ross.report_batch:main"]},
     install_requires=REQUIRED,
     extras_require=EXTRAS,
     package_data={"": ["new_units.txt"]},